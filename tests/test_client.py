@@ -0,0 +1,27 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox client commands batching
+"""
+
+import pytest
+
+pytest.importorskip('tpDcc.core.client')
+
+from tpRigToolkit.tools.rigtoolbox.core import client
+
+
+def test_batch_result_functions():
+    batch = client.CommandBatch()
+    placeholder = batch.add({'cmd': 'get_skin_weights'}, result_fn=lambda result: result['data'])
+    batch.add({'cmd': 'delete_history'})
+    batch.add({'cmd': 'get_skin_weights'}, result_fn=lambda result: result['data'])
+    assert placeholder['queued']
+    assert placeholder['result'] is None
+
+    batch.set_replies([
+        {'success': True, 'msg': '', 'result': {'data': [1, 2]}},
+        {'success': True, 'msg': '', 'result': None},
+        {'success': False, 'msg': 'Invalid mesh', 'result': None}])
+    assert [reply['result'] for reply in batch.replies] == [[1, 2], None, None]
@@ -0,0 +1,57 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox commands definitions loading
+"""
+
+import os
+import json
+
+from tpRigToolkit.tools.rigtoolbox.core import commands
+
+
+def _write_commands(commands_path, name, data):
+    with open(os.path.join(commands_path, '{}.yaml'.format(name)), 'w') as commands_file:
+        json.dump(data, commands_file)
+
+
+def test_load_commands_data_cache(tmpdir):
+    commands_path = tmpdir.mkdir('commands')
+    cache_directory = str(tmpdir.mkdir('cache'))
+    _write_commands(str(commands_path), 'skin', {'prune_skin_weights': {'categories': ['Skin']}})
+    _write_commands(str(commands_path), 'joint', {'orient_joints': {'categories': ['Joint']}})
+    commands_path.join('readme.txt').write('not a commands file')
+
+    read_files = list()
+
+    def _read(file_path):
+        read_files.append(os.path.basename(file_path))
+        with open(file_path, 'r') as commands_file:
+            return json.load(commands_file)
+
+    commands_datas = commands.load_commands_data(str(commands_path), _read, cache_directory=cache_directory)
+    assert sorted(commands_datas) == ['joint', 'skin']
+    assert sorted(read_files) == ['joint.yaml', 'skin.yaml']
+
+    del read_files[:]
+    assert commands.load_commands_data(str(commands_path), _read, cache_directory=cache_directory) == commands_datas
+    assert not read_files
+
+    _write_commands(str(commands_path), 'skin', {'mirror_skin_weights': {'categories': ['Skin', 'Mirror']}})
+    commands_datas = commands.load_commands_data(str(commands_path), _read, cache_directory=cache_directory)
+    assert list(commands_datas['skin']) == ['mirror_skin_weights']
+    assert 'skin.yaml' in read_files
+
+
+def test_load_commands_data_invalid_file_is_not_cached(tmpdir):
+    commands_path = tmpdir.mkdir('commands')
+    cache_directory = str(tmpdir.mkdir('cache'))
+    commands_path.join('general.yaml').write('{invalid')
+
+    def _read(file_path):
+        with open(file_path, 'r') as commands_file:
+            return json.load(commands_file)
+
+    assert commands.load_commands_data(str(commands_path), _read, cache_directory=cache_directory) == dict()
+    assert not os.listdir(cache_directory)
@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox job runner
+"""
+
+import threading
+
+import pytest
+
+from tpRigToolkit.tools.rigtoolbox.core import jobs
+
+
+class FakeDcc(object):
+    """
+    Fake DCC main thread executor that records the threads functions are executed in
+    """
+
+    def __init__(self):
+        self.calls = list()
+        self._lock = threading.Lock()
+
+    def execute(self, fn, *args, **kwargs):
+        with self._lock:
+            self.calls.append(fn.__name__)
+            return fn(*args, **kwargs)
+
+
+def _scene_read():
+    return [1.0, 2.0, 3.0]
+
+
+def _scene_write(values):
+    return sum(values)
+
+
+def _job(context, factor):
+    values = context.main_thread(_scene_read)
+    context.progress(50, 'Computing')
+    values = [value * factor for value in values]
+    return context.main_thread(_scene_write, values)
+
+
+def _failing_job(context):
+    raise RuntimeError('Job failed')
+
+
+def test_job_runner_marshals_main_thread_calls():
+    fake_dcc = FakeDcc()
+    runner = jobs.JobRunner(main_thread_executor=fake_dcc.execute)
+    try:
+        states = list()
+        job_id = runner.submit('multiply', _job, 2.0)
+        runner.subscribe(job_id, states.append)
+        job = runner.wait(job_id, timeout=5.0)
+    finally:
+        runner.shutdown()
+
+    assert job['status'] == jobs.JobStatus.DONE
+    assert job['result'] == 12.0
+    assert job['progress'] == 100
+    assert fake_dcc.calls == ['_scene_read', '_scene_write']
+    assert states[-1]['status'] == jobs.JobStatus.DONE
+
+
+def test_job_runner_failed_job():
+    runner = jobs.JobRunner()
+    try:
+        job = runner.wait(runner.submit('fail', _failing_job), timeout=5.0)
+    finally:
+        runner.shutdown()
+
+    assert job['status'] == jobs.JobStatus.FAILED
+    assert 'Job failed' in job['msg']
+
+
+def test_job_runner_cancel_pending_job():
+    event = threading.Event()
+    runner = jobs.JobRunner(max_workers=1)
+    try:
+        blocking_id = runner.submit('block', lambda context: event.wait(5.0))
+        pending_id = runner.submit('pending', _job, 1.0)
+        assert runner.cancel(pending_id)
+        event.set()
+        assert runner.wait(blocking_id, timeout=5.0)['status'] == jobs.JobStatus.DONE
+    finally:
+        runner.shutdown()
+
+    assert runner.get_job(pending_id)['status'] == jobs.JobStatus.CANCELLED
+
+
+def test_job_runner_shutdown_cancel_pending():
+    started = threading.Event()
+    event = threading.Event()
+    runner = jobs.JobRunner(max_workers=1)
+    blocking_id = runner.submit('block', lambda context: started.set() or event.wait(5.0))
+    assert started.wait(5.0)
+    pending_id = runner.submit('pending', _job, 1.0)
+    runner.shutdown(wait=False, cancel_pending=True)
+    event.set()
+
+    assert runner.wait(blocking_id, timeout=5.0)['status'] == jobs.JobStatus.DONE
+    assert runner.get_job(pending_id)['status'] == jobs.JobStatus.CANCELLED
+    with pytest.raises(RuntimeError):
+        runner.submit('late', _job, 1.0)
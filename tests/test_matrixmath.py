@@ -0,0 +1,81 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox matrix math functions
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import matrixmath
+
+
+def _compose(translate, rotate, scale, rotate_order=0, rotate_axis=(0.0, 0.0, 0.0), joint_orient=None,
+             inverse_scale=None):
+    matrix = numpy.identity(4)
+    axes = numpy.diag(scale)
+    axes = axes.dot(matrixmath.euler_to_matrices([rotate_axis])[0])
+    axes = axes.dot(matrixmath.euler_to_matrices([rotate], rotate_order)[0])
+    if joint_orient is not None:
+        axes = axes.dot(matrixmath.euler_to_matrices([joint_orient])[0])
+    if inverse_scale is not None:
+        axes = axes.dot(numpy.diag(1.0 / numpy.asarray(inverse_scale)))
+    matrix[:3, :3] = axes
+    matrix[3, :3] = translate
+
+    return matrix
+
+
+def test_euler_round_trip_all_rotate_orders():
+    angles = numpy.random.RandomState(0).uniform(-1.5, 1.5, (60, 3))
+    rotate_orders = numpy.repeat(numpy.arange(6), 10)
+
+    matrices = matrixmath.euler_to_matrices(angles, rotate_orders)
+
+    assert numpy.allclose(matrixmath.matrices_to_euler(matrices, rotate_orders), angles)
+    # Maya uses row vectors: rotating Y axis 90 degrees around X gives Z axis
+    x_rotation = matrixmath.euler_to_matrices([[numpy.pi / 2, 0.0, 0.0]])[0]
+    assert numpy.allclose(numpy.dot([0.0, 1.0, 0.0], x_rotation), [0.0, 0.0, 1.0])
+
+
+def test_decompose_matrices():
+    matrix = _compose([1.0, 2.0, 3.0], [0.3, -0.2, 1.1], [2.0, 0.5, 1.5], rotate_order=4)
+
+    translations, rotations, scales = matrixmath.decompose_matrices(matrix[None])
+
+    assert numpy.allclose(translations[0], [1.0, 2.0, 3.0])
+    assert numpy.allclose(scales[0], [2.0, 0.5, 1.5])
+    assert numpy.allclose(matrixmath.matrices_to_euler(rotations, 4)[0], [0.3, -0.2, 1.1])
+
+
+def test_compute_match_values():
+    parent_matrix = _compose([5.0, 0.0, -2.0], [0.0, 0.4, 0.2], [2.0, 2.0, 2.0])
+    target_matrix = _compose([1.0, 4.0, 2.0], [0.5, 0.1, -0.7], [1.0, 1.0, 1.0])
+    parent_inverse = numpy.linalg.inv(parent_matrix)
+    inverse_scale = [2.0, 2.0, 2.0]
+
+    values = matrixmath.compute_match_values(
+        target_matrix, numpy.array([parent_inverse, parent_inverse]), rotate_orders=[2, 0],
+        rotate_axes=[[0.0, 0.0, 0.0], [0.1, 0.0, 0.2]], joints=[False, True],
+        inverse_scales=[[1.0, 1.0, 1.0], inverse_scale])
+
+    transform_matrix = _compose(values['translate'][0], values['rotate'][0], values['scale'][0], rotate_order=2)
+    assert numpy.allclose(transform_matrix.dot(parent_matrix), target_matrix)
+
+    assert numpy.allclose(values['rotate'][1], 0.0)
+    joint_matrix = _compose(
+        values['translate'][1], values['rotate'][1], values['scale'][1], rotate_axis=[0.1, 0.0, 0.2],
+        joint_orient=values['jointOrient'][1], inverse_scale=inverse_scale)
+    assert numpy.allclose(joint_matrix.dot(parent_matrix), target_matrix)
+    assert numpy.allclose(values['scale'][1], [1.0, 1.0, 1.0])
+
+
+def test_average_matrix():
+    first_matrix = _compose([0.0, 0.0, 0.0], [0.0, 0.0, 0.2], [1.0, 1.0, 1.0])
+    second_matrix = _compose([2.0, 4.0, 0.0], [0.0, 0.0, 0.6], [3.0, 3.0, 3.0])
+
+    matrix = matrixmath.average_matrix(numpy.array([first_matrix, second_matrix]))
+
+    assert numpy.allclose(matrix, _compose([1.0, 2.0, 0.0], [0.0, 0.0, 0.4], [2.0, 2.0, 2.0]))
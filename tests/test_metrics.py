@@ -0,0 +1,76 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox server metrics
+"""
+
+import types
+
+from tpRigToolkit.tools.rigtoolbox.core import metrics
+
+
+def test_percentile_value():
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+    assert metrics.percentile_value(values, 50) == 3.0
+    assert metrics.percentile_value(values, 100) == 5.0
+    assert metrics.percentile_value(values, 25) == 2.0
+    assert metrics.percentile_value(values, 90) == 4.6
+
+
+def test_metrics_recorder_instrument():
+    fake_cmds = types.ModuleType('fake_cmds')
+    fake_cmds.setAttr = lambda *args, **kwargs: None
+    counter = metrics.CallCounter()
+    counter.install(fake_cmds)
+
+    def handler(data, reply):
+        assert counter.is_counting()
+        for _ in range(data['calls']):
+            fake_cmds.setAttr('pCube1.tx', 1.0)
+        reply['success'] = True
+
+    recorder = metrics.MetricsRecorder(max_records=3, call_counter=counter, count_calls=True)
+    instrumented = recorder.instrument('set_attr', handler)
+    try:
+        for calls in (1, 2, 3, 4):
+            instrumented({'calls': calls}, {'success': False, 'msg': '', 'result': None})
+
+        # Calls are only counted while handlers run
+        assert not counter.is_counting()
+        fake_cmds.setAttr('pCube1.tx', 1.0)
+    finally:
+        counter.uninstall()
+
+    records = recorder.records()
+    assert len(records) == 3
+    assert [record['cmds_calls'] for record in records] == [2, 3, 4]
+
+    summary = recorder.summary()
+    assert summary['set_attr']['count'] == 3
+    assert summary['set_attr']['failed'] == 0
+    assert summary['set_attr']['cmds_calls']['p50'] == 3
+    assert counter.count == 10
+
+
+def test_metrics_recorder_defaults():
+    recorder = metrics.MetricsRecorder(call_counter=metrics.CallCounter())
+    instrumented = recorder.instrument('noop', lambda data, reply: reply.update(success=True))
+    instrumented({}, {'success': False, 'msg': '', 'result': None})
+
+    record = recorder.records()[0]
+    assert record['cmds_calls'] is None
+    assert record['success']
+
+
+def test_phase_timer():
+    timer = metrics.PhaseTimer()
+    with timer.phase('load_commands'):
+        pass
+    with timer.phase('create_widgets'):
+        pass
+
+    phases = timer.phases()
+    assert [phase[0] for phase in phases] == ['load_commands', 'create_widgets']
+    assert all(duration >= 0.0 for _, _, duration in phases)
+    assert 'total' in timer.report()
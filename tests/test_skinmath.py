@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox vectorized skin weights functions
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import skinmath
+
+
+def test_path_percentages_uniform():
+    percentages = skinmath.path_percentages(3)
+    assert numpy.allclose(percentages, [0.25, 0.5, 0.75])
+
+
+def test_path_percentages_distance():
+    positions = [(0, 0, 0), (1, 0, 0), (3, 0, 0), (4, 0, 0)]
+    percentages = skinmath.path_percentages(2, positions=positions)
+    assert numpy.allclose(percentages, [0.25, 0.75])
+
+
+def test_interpolate_weights():
+    weights = skinmath.interpolate_weights([1.0, 0.0], [0.0, 1.0], [0.0, 0.25, 1.0])
+    assert weights.shape == (3, 2)
+    assert numpy.allclose(weights, [[1.0, 0.0], [0.75, 0.25], [0.0, 1.0]])
+    assert numpy.allclose(weights.sum(axis=1), 1.0)
+
+
+def test_average_weights():
+    weights = [[0.5, 0.5, 0.0], [1.0, 0.0, 0.0000001]]
+    average = skinmath.average_weights(weights)
+    assert numpy.allclose(average, [0.75, 0.25, 0.0])
+
+
+def test_smooth_weights():
+    weights = [[1.0, 0.0], [0.0, 1.0]]
+    neighbour_weights = [[0.0, 1.0], [0.5, 0.5]]
+    offsets = [0, 2, 2]
+    neighbours = [0, 1]
+    smoothed = skinmath.smooth_weights(weights, neighbour_weights, offsets, neighbours, blend=0.5)
+    assert numpy.allclose(smoothed, [[0.625, 0.375], [0.0, 1.0]])
+
+
+def test_move_weights():
+    weights = [[0.2, 0.3, 0.5, 0.0], [0.0, 0.0, 0.4, 0.6]]
+    moved = skinmath.move_weights(weights, [2, 3], [0, 0])
+    assert numpy.allclose(moved, [[0.7, 0.3, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]])
+
+    with pytest.raises(ValueError):
+        skinmath.move_weights(weights, [2, 3], [3, 0])
+
+
+def test_remove_weights():
+    weights = [[0.2, 0.3, 0.5, 0.0], [0.0, 0.0, 0.4, 0.6], [0.0, 0.0, 0.0, 0.0]]
+    removed = skinmath.remove_weights(weights, [2, 3], [1, 0])
+    assert numpy.allclose(removed, [[0.4, 0.6, 0.0, 0.0], [0.6, 0.4, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0]])
+
+
+def test_influence_count_histogram():
+    weights = [[0.1, 0.2, 0.3, 0.4], [0.005, 0.0, 0.0, 0.0], [0.5, 0.0, 0.45, 0.05]]
+    assert skinmath.influence_count_histogram(weights).tolist() == [0, 1, 0, 1, 1]
+    assert skinmath.influence_count_histogram(weights, threshold=0.1).tolist() == [1, 0, 1, 1]
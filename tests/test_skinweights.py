@@ -0,0 +1,78 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox sparse skin weights
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import skinweights
+
+WEIGHTS = [[0.5, 0.5, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, 0.0], [0.1, 0.6, 0.3]]
+NAMES = ['a', 'b', 'c']
+
+
+def test_dense_round_trip():
+    weights = skinweights.SkinWeights.from_dense(WEIGHTS, NAMES)
+    assert weights.offsets.tolist() == [0, 2, 3, 3, 6]
+    assert weights.influence_indices.dtype == numpy.int32
+    assert weights.values.dtype == numpy.float32
+    assert numpy.allclose(weights.to_dense(), WEIGHTS)
+    assert numpy.allclose(weights.influence_sums(), [0.6, 1.1, 1.3])
+    assert weights.influence_counts().tolist() == [2, 1, 0, 3]
+
+    with pytest.raises(ValueError):
+        skinweights.SkinWeights([0, 2], [0, 3], [0.5, 0.5], NAMES)
+
+
+def test_slice_and_concatenate():
+    weights = skinweights.SkinWeights.from_dense(WEIGHTS, NAMES)
+    sliced = weights.slice_rows([3, 0])
+    assert numpy.allclose(sliced.to_dense(), [WEIGHTS[3], WEIGHTS[0]])
+    assert weights.slice_rows(slice(1, 3)).offsets.tolist() == [0, 1, 1]
+
+    other = skinweights.SkinWeights.from_dense([[0.25, 0.75]], ['d', 'a'])
+    stacked = skinweights.SkinWeights.concatenate([weights, other])
+    assert stacked.influence_names == ('a', 'b', 'c', 'd')
+    assert numpy.allclose(stacked.to_dense(), [row + [0.0] for row in WEIGHTS] + [[0.75, 0.0, 0.0, 0.25]])
+
+
+def test_remap_influences():
+    weights = skinweights.SkinWeights.from_dense(WEIGHTS, NAMES)
+    remapped = weights.remap_influences([0, 0, -1], ['ab'])
+    assert numpy.allclose(remapped.to_dense(), [[1.0], [0.0], [0.0], [0.7]])
+    assert remapped.offsets.tolist() == [0, 1, 1, 1, 2]
+
+    reordered = weights.reorder_influences(['c', 'a', 'b', 'd'])
+    assert numpy.allclose(reordered.to_dense()[:, [1, 2, 0]], WEIGHTS)
+    with pytest.raises(ValueError):
+        weights.reorder_influences(['a', 'b'])
+
+
+def test_prune_and_normalize():
+    weights = skinweights.SkinWeights.from_dense([[0.1, 0.2, 0.3, 0.4], [0.05, 0.0, 0.0, 0.0]], NAMES + ['d'])
+    pruned = weights.prune(threshold=0.15, max_influences=2)
+    assert numpy.allclose(pruned.to_dense(), [[0.0, 0.0, 3.0 / 7.0, 4.0 / 7.0], [1.0, 0.0, 0.0, 0.0]])
+    assert numpy.allclose(weights.normalize().row_sums(), 1.0)
+
+    # Weights equal to the threshold are discarded too
+    pruned = weights.prune(threshold=0.1)
+    assert numpy.allclose(pruned.to_dense()[0], [0.0, 2.0 / 9.0, 3.0 / 9.0, 4.0 / 9.0])
+
+    with pytest.raises(ValueError):
+        weights.prune(max_influences=0)
+
+
+def test_equality_and_diff():
+    weights = skinweights.SkinWeights.from_dense(WEIGHTS, NAMES)
+    assert weights == weights.copy()
+    assert weights != weights.prune(max_influences=1)
+
+    other_weights = numpy.array(WEIGHTS)[:, [2, 0, 1]]
+    other_weights[3] = [0.3, 0.2, 0.5]
+    other = skinweights.SkinWeights.from_dense(other_weights, ['c', 'a', 'b'])
+    assert weights.diff(other).tolist() == [3]
+    assert weights.diff(weights.copy()).tolist() == []
@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox spatial queries
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import spatial
+
+
+@pytest.mark.parametrize('use_scipy', [True, False])
+def test_point_index_query(monkeypatch, use_scipy):
+    if not use_scipy:
+        monkeypatch.setattr(spatial, 'cKDTree', None)
+        monkeypatch.setattr(spatial, 'CHUNK_SIZE', 4)
+    elif spatial.cKDTree is None:
+        pytest.skip('SciPy is not available')
+
+    point_index = spatial.PointIndex([(0, 0, 0), (10, 0, 0), (0, 10, 0)])
+    distances, indices = point_index.query([(9, 1, 0), (1, 0, 0), (0, 7, 0)])
+    assert indices.tolist() == [1, 0, 2]
+    assert numpy.allclose(distances, [numpy.sqrt(2.0), 1.0, 3.0])
+
+
+@pytest.mark.parametrize('use_scipy', [True, False])
+def test_point_index_query_k(monkeypatch, use_scipy):
+    if not use_scipy:
+        monkeypatch.setattr(spatial, 'cKDTree', None)
+        monkeypatch.setattr(spatial, 'CHUNK_SIZE', 8)
+    elif spatial.cKDTree is None:
+        pytest.skip('SciPy is not available')
+
+    point_index = spatial.PointIndex([(0, 0, 0), (10, 0, 0), (0, 10, 0), (3, 0, 0)])
+    distances, indices = point_index.query([(9, 1, 0), (1, 0, 0), (0, 7, 0)], k=2)
+    assert indices.tolist() == [[1, 3], [0, 3], [2, 0]]
+    assert numpy.allclose(distances[:, 0], [numpy.sqrt(2.0), 1.0, 3.0])
+
+    with pytest.raises(ValueError):
+        point_index.query([(0, 0, 0)], k=5)
@@ -0,0 +1,58 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox skin weights mirroring functions
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import symmetry
+
+POSITIONS = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (2, 1, 0), (-2.0005, 1, 0), (3, 0, 0)]
+
+
+def test_symmetry_map():
+    vertex_map = symmetry.symmetry_map(POSITIONS, axis=0, tolerance=0.001)
+    assert vertex_map.tolist() == [1, 0, 2, 4, 3, -1]
+    assert symmetry.side_vertices(POSITIONS).tolist() == [1, 4]
+    assert symmetry.side_vertices(POSITIONS, positive_to_negative=False).tolist() == [0, 3, 5]
+
+
+def test_mirror_weights():
+    sides = [symmetry.CENTER_SIDE, symmetry.LEFT_SIDE, symmetry.RIGHT_SIDE, symmetry.LEFT_SIDE]
+    labels = ['spine', 'arm', 'arm', 'leg']
+    permutation = symmetry.influence_mirror_permutation(sides, labels)
+    assert permutation.tolist() == [0, 2, 1, 3]
+
+    weights = numpy.array([
+        [0.2, 0.8, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.5, 0.0, 0.5], [1.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]])
+    vertex_map = symmetry.symmetry_map(POSITIONS)
+    mirrored = symmetry.mirror_weights(weights, vertex_map, permutation, [1, 4])
+    assert numpy.allclose(mirrored, [[0.2, 0.0, 0.8, 0.0], [0.0, 0.0, 0.5, 0.5]])
+
+    with pytest.raises(ValueError):
+        symmetry.mirror_weights(weights, vertex_map, permutation, [5])
+
+
+def test_mirror_permutation_shared_labels():
+    sides = [symmetry.LEFT_SIDE, symmetry.LEFT_SIDE, symmetry.RIGHT_SIDE, symmetry.RIGHT_SIDE]
+    labels = ['finger'] * 4
+    names = ['index1_l', 'index2_l', 'index2_r', 'index1_r']
+    with pytest.raises(ValueError):
+        symmetry.influence_mirror_permutation(sides, labels, names=names)
+
+    positions = [(1, 0, 0), (2, 0, 0), (-2, 0, 0), (-1, 0, 0)]
+    permutation = symmetry.influence_mirror_permutation(sides, labels, names=names, positions=positions)
+    assert permutation.tolist() == [3, 2, 1, 0]
+
+    weights = numpy.array([[0.5, 0.5, 0.0, 0.0], [0.5, 0.5, 0.0, 0.0]])
+    mirrored = symmetry.mirror_weights(weights, [1, 0], permutation, [0, 1])
+    assert numpy.allclose(mirrored, [[0.0, 0.0, 0.5, 0.5], [0.0, 0.0, 0.5, 0.5]])
+
+    # Several influences mapped into the same one keep all their weight
+    mirrored = symmetry.mirror_weights(weights, [1, 0], [3, 3, 1, 1], [0, 1])
+    assert numpy.allclose(mirrored.sum(axis=1), 1.0)
@@ -0,0 +1,41 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox mesh topology functions
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import topology
+
+# 3x2 vertices grid made of two quads
+# 0 - 1 - 2
+# |   |   |
+# 3 - 4 - 5
+POLYGON_COUNTS = [4, 4]
+POLYGON_CONNECTS = [0, 3, 4, 1, 1, 4, 5, 2]
+
+
+def test_adjacency_from_polygons():
+    offsets, neighbours = topology.adjacency_from_polygons(POLYGON_COUNTS, POLYGON_CONNECTS, 6)
+    assert offsets.tolist() == [0, 2, 5, 7, 9, 12, 14]
+    assert neighbours[offsets[4]:offsets[5]].tolist() == [1, 3, 5]
+
+
+def test_adjacency_rows():
+    offsets, neighbours = topology.adjacency_from_polygons(POLYGON_COUNTS, POLYGON_CONNECTS, 6)
+    sub_offsets, sub_neighbours = topology.adjacency_rows(offsets, neighbours, [4, 0])
+    assert sub_offsets.tolist() == [0, 3, 5]
+    assert sub_neighbours.tolist() == [1, 3, 5, 1, 3]
+
+
+def test_shortest_path():
+    offsets, neighbours = topology.adjacency_from_polygons(POLYGON_COUNTS, POLYGON_CONNECTS, 6)
+    assert topology.shortest_path(offsets, neighbours, 0, 2) == [0, 1, 2]
+
+    # Moving vertex 1 far away makes the path through the bottom row shorter
+    positions = [(0, 0, 0), (1, 10, 0), (2, 0, 0), (0, -1, 0), (1, -1, 0), (2, -1, 0)]
+    assert topology.shortest_path(offsets, neighbours, 0, 2, positions=positions) == [0, 3, 4, 5, 2]
@@ -0,0 +1,38 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox skin weights transfer functions
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import transfer
+
+# Unit square in the XY plane split into two triangles
+POSITIONS = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+TRIANGLES = [(0, 1, 2), (0, 2, 3)]
+
+
+def test_closest_barycentric():
+    a = numpy.array([0.0, 0.0, 0.0])
+    b = numpy.array([1.0, 0.0, 0.0])
+    c = numpy.array([0.0, 1.0, 0.0])
+    points = numpy.array([(0.25, 0.25, 1.0), (-1.0, -1.0, 0.0), (0.5, -1.0, 0.0), (1.0, 1.0, 0.0), (2.0, 0.0, 0.0)])
+    coordinates = transfer.closest_barycentric(points, a, b, c)
+    assert numpy.allclose(coordinates, [
+        [0.5, 0.25, 0.25], [1.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.0, 0.5, 0.5], [0.0, 1.0, 0.0]])
+
+
+def test_surface_sampler():
+    sampler = transfer.SurfaceSampler(POSITIONS, TRIANGLES, candidates=2)
+    vertices, coordinates, distances = sampler.sample([(0.75, 0.25, 0.5), (0.0, 2.0, 0.0)])
+    assert vertices.tolist() == [[0, 1, 2], [0, 2, 3]]
+    assert numpy.allclose(coordinates, [[0.25, 0.5, 0.25], [0.0, 0.0, 1.0]])
+    assert numpy.allclose(distances, [0.5, 1.0])
+
+    weights = [[1.0, 0.0], [0.0, 1.0], [0.0, 1.0], [1.0, 0.0]]
+    sampled_weights = transfer.interpolate_weights(weights, vertices, coordinates)
+    assert numpy.allclose(sampled_weights, [[0.25, 0.75], [1.0, 0.0]])
@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox skin weights files
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import skinmath, weightsio
+
+
+def test_get_weights_file_name():
+    assert weightsio.get_weights_file_name('|character|ns:body') == 'character_ns_body.skw'
+
+
+def test_write_read_weights(tmp_path, monkeypatch):
+    monkeypatch.setattr(weightsio, 'CHUNK_SIZE', 2)
+    weights = numpy.array([[0.2, 0.8, 0.0], [0.0, 0.0, 1.0], [0.5, 0.25, 0.25]])
+    offsets, influence_indices, values = skinmath.sparse_weights(weights)
+    file_path = str(tmp_path / weightsio.get_weights_file_name('body'))
+    weightsio.write_weights(
+        file_path, numpy.arange(3), offsets, influence_indices, values, ['root', 'spine', 'head'],
+        dtype=numpy.float16)
+
+    weights_data = weightsio.read_weights(file_path)
+    assert weights_data['influence_names'] == ['root', 'spine', 'head']
+    assert weights_data['values'].dtype == numpy.float16
+    loaded = skinmath.dense_weights(
+        weights_data['offsets'], weights_data['influence_indices'], weights_data['values'], 3)
+    assert numpy.allclose(loaded, weights, atol=0.001)
+
+
+def test_write_read_index(tmp_path):
+    assert weightsio.read_index(str(tmp_path)) == dict()
+    weightsio.write_index(str(tmp_path), {'body': {'file': 'body.skw', 'vertex_count': 3}})
+    assert weightsio.read_index(str(tmp_path))['body']['vertex_count'] == 3
+
+
+def test_quantized_weights_normalization(tmp_path):
+    random_state = numpy.random.RandomState(0)
+    weights = skinmath.normalize_weights(random_state.rand(50, 40))
+    offsets, influence_indices, values = skinmath.sparse_weights(weights)
+    file_path = str(tmp_path / weightsio.get_weights_file_name('body'))
+    weightsio.write_weights(
+        file_path, numpy.arange(50), offsets, influence_indices, values,
+        ['joint{}'.format(i) for i in range(40)], dtype=numpy.float16)
+
+    weights_data = weightsio.read_weights(file_path)
+    loaded = skinmath.dequantize_weights(
+        weights_data['offsets'], weights_data['influence_indices'], weights_data['values'], 40)
+    assert loaded.dtype == numpy.float64
+    assert numpy.allclose(loaded.sum(axis=1), 1.0, rtol=0.0, atol=1e-12)
+    assert numpy.allclose(loaded, weights, atol=0.001)
@@ -0,0 +1,32 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for tpRigToolkit-tools-rigtoolbox skin weights binary format
+"""
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from tpRigToolkit.tools.rigtoolbox.core import skinmath, wireformat
+
+
+@pytest.mark.parametrize('dtype', [numpy.float16, numpy.float32, numpy.float64])
+def test_pack_unpack_weights(dtype):
+    weights = numpy.array([[0.25, 0.75, 0.0], [0.0, 0.0, 1.0], [0.5, 0.0, 0.5]])
+    offsets, influence_indices, values = skinmath.sparse_weights(weights)
+    data = wireformat.pack_weights(
+        [10, 11, 12], offsets, influence_indices, values, ['joint1', 'joint2', 'joint3'], dtype=dtype)
+    unpacked = wireformat.unpack_weights(wireformat.decode(wireformat.encode(data)))
+
+    assert unpacked['influence_names'] == ['joint1', 'joint2', 'joint3']
+    assert unpacked['vertex_indices'].tolist() == [10, 11, 12]
+    assert unpacked['values'].dtype == numpy.dtype(dtype)
+    assert numpy.allclose(
+        skinmath.dense_weights(unpacked['offsets'], unpacked['influence_indices'], unpacked['values'], 3), weights)
+
+
+def test_unpack_invalid_weights():
+    with pytest.raises(ValueError):
+        wireformat.unpack_weights(b'\0' * wireformat.HEADER.size)
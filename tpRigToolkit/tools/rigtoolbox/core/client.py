@@ -12,6 +12,9 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
+import time
+import contextlib
+
 from tpDcc.core import client
 from tpDcc.managers import tools
 
@@ -20,6 +23,214 @@ class RigToolboxClient(client.DccClient, object):
 
     PORT = 19344
 
+    def __init__(self, *args, **kwargs):
+        super(RigToolboxClient, self).__init__(*args, **kwargs)
+
+        self._batch = None
+
+    # =================================================================================================================
+    # BATCH
+    # =================================================================================================================
+
+    def send(self, cmd_dict):
+        """
+        Overrides base send function to queue commands instead of sending them while a batch is opened
+        :param cmd_dict: dict
+        :return: dict
+        """
+
+        if self._batch is not None:
+            return self._batch.add(cmd_dict)
+
+        return super(RigToolboxClient, self).send(cmd_dict)
+
+    def send_many(self, cmds):
+        """
+        Sends given commands to the server within a single envelope, so all of them are executed in one round trip
+        Server executes the commands in order inside a single undo chunk
+        :param cmds: list(dict), list of commands to execute
+        :return: list(dict), list of replies (one per command and in the same order commands were given)
+        """
+
+        cmds = list(cmds or list())
+        if not cmds:
+            return list()
+
+        cmd = {
+            'cmd': 'batch',
+            'commands': cmds
+        }
+
+        reply_dict = super(RigToolboxClient, self).send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            msg = reply_dict.get('msg', '') if reply_dict else 'Invalid reply'
+            return [{'success': False, 'msg': msg, 'result': None, 'cmd': cmd_dict.get('cmd')} for cmd_dict in cmds]
+
+        return reply_dict['result']
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that queues all commands sent inside it and sends them to the server in one round trip
+        Replies returned by client functions inside the context are placeholders; real replies are available in the
+        batch object once the context is closed. If an exception is raised inside the context nothing is sent.
+
+        with client.batch() as batch:
+            client.lock_translation(transforms)
+            client.delete_history(transforms)
+        print(batch.replies)
+
+        :return: CommandBatch
+        """
+
+        # Nested batches are merged into the outer one
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = self._batch = CommandBatch()
+        try:
+            yield batch
+        finally:
+            self._batch = None
+
+        batch.set_replies(self.send_many(batch.commands))
+
+    # =================================================================================================================
+    # METRICS
+    # =================================================================================================================
+
+    def get_metrics(self, percentiles=None, clear=False):
+        """
+        Returns rolling percentiles of the timings of the commands executed by the server
+        :param percentiles: list(int) or None, percentiles to compute. If None, 50, 90 and 99 percentiles are returned
+        :param clear: bool, whether to clear server records once metrics are computed
+        :return: dict(str, dict), metrics per command name
+        """
+
+        cmd = {
+            'cmd': 'get_metrics',
+            'percentiles': percentiles,
+            'clear': clear
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return dict()
+
+        return reply_dict['result']
+
+    def configure_metrics(self, count_calls=None):
+        """
+        Enables or disables the optional server metrics. Counting Maya calls adds overhead to each command, so it is
+        disabled by default
+        :param count_calls: bool or None, whether to count the Maya commands called by each command. If None, current
+            option is kept
+        :return: dict(str, bool), current server metrics options
+        """
+
+        cmd = {
+            'cmd': 'configure_metrics',
+            'count_calls': count_calls
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return dict()
+
+        return reply_dict['result']
+
+    # =================================================================================================================
+    # JOBS
+    # =================================================================================================================
+
+    def submit_job(self, cmd_dict):
+        """
+        Executes given command asynchronously in the server. Server replies immediately with the job id
+        :param cmd_dict: dict, command to execute
+        :return: str or None, job id
+        """
+
+        cmd = {
+            'cmd': 'submit_job',
+            'job': cmd_dict
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return None
+
+        return reply_dict['result']
+
+    def get_job(self, job_id):
+        """
+        Returns the current state of the given job. Once the job is finished, command reply is stored in result key
+        :param job_id: str
+        :return: dict or None
+        """
+
+        cmd = {
+            'cmd': 'get_job',
+            'job_id': job_id
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return None
+
+        return reply_dict['result']
+
+    def get_jobs(self):
+        cmd = {
+            'cmd': 'get_jobs'
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['result']
+
+    def cancel_job(self, job_id):
+        cmd = {
+            'cmd': 'cancel_job',
+            'job_id': job_id
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return False
+
+        return reply_dict['success']
+
+    def wait_job(self, job_id, interval=0.2, timeout=None, callback=None):
+        """
+        Polls the server until given job is finished
+        :param job_id: str
+        :param interval: float, seconds between polls
+        :param timeout: float or None, maximum number of seconds to wait
+        :param callback: callable or None, function called with the state of the job after each poll
+        :return: dict or None, last state of the job
+        """
+
+        start_time = time.time()
+        while True:
+            job = self.get_job(job_id)
+            if callback and job:
+                callback(job)
+            if not job or job['status'] in ('done', 'failed', 'cancelled'):
+                return job
+            if timeout is not None and time.time() - start_time > timeout:
+                return job
+            time.sleep(interval)
+
     # =================================================================================================================
     # RENAMER
     # =================================================================================================================
@@ -244,6 +455,29 @@ class RigToolboxClient(client.DccClient, object):
 
         return reply_dict['success']
 
+    def set_transforms_locked(self, transforms=None, attributes=None, lock=True):
+        """
+        Locks or unlocks the given attributes of all the given transforms in a single server call
+        :param transforms: list(str) or None
+        :param attributes: list(str) or None
+        :param lock: bool
+        :return: list(bool), status of each node
+        """
+
+        cmd = {
+            'cmd': 'set_transforms_locked',
+            'transforms': transforms,
+            'attributes': attributes,
+            'lock': lock
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict.get('status', list())
+
     def clean_student_license(self, file_path=None):
         cmd = {
             'cmd': 'clean_student_license',
@@ -862,13 +1096,15 @@ class RigToolboxClient(client.DccClient, object):
 
     def mirror_skin_weights(
             self, mesh=None, auto_assign_labels=True, left_side_label='*_l_*', right_side_label='*_r_*',
-            show_options=False):
+            mirror_mode='YZ', mirror_inverse=False, show_options=False):
         cmd = {
             'cmd': 'mirror_skin_weights',
             'mesh': mesh,
             'auto_assign_labels': auto_assign_labels,
             'left_side_label': left_side_label,
             'right_side_label': right_side_label,
+            'mirror_mode': mirror_mode,
+            'mirror_inverse': mirror_inverse,
             'show_options': show_options
         }
 
@@ -881,7 +1117,7 @@ class RigToolboxClient(client.DccClient, object):
 
     def copy_skin_weights(
             self, source_mesh=None, target_mesh=None, auto_assign_labels=True, left_side_label='*_l_*',
-            right_side_label='*_r_*', show_options=False):
+            right_side_label='*_r_*', workers=None, show_options=False):
         cmd = {
             'cmd': 'copy_skin_weights',
             'source_mesh': source_mesh,
@@ -889,6 +1125,7 @@ class RigToolboxClient(client.DccClient, object):
             'auto_assign_labels': auto_assign_labels,
             'left_side_label': left_side_label,
             'right_side_label': right_side_label,
+            'workers': workers,
             'show_options': show_options
         }
 
@@ -897,12 +1134,14 @@ class RigToolboxClient(client.DccClient, object):
         if not self.is_valid_reply(reply_dict):
             return list()
 
-        return reply_dict['success']
+        return reply_dict['result']
 
-    def prune_skin_weights(self, mesh=None, show_options=False):
+    def prune_skin_weights(self, mesh=None, threshold=0.01, max_influences=None, show_options=False):
         cmd = {
             'cmd': 'prune_skin_weights',
             'mesh': mesh,
+            'threshold': threshold,
+            'max_influences': max_influences,
             'show_options': show_options
         }
 
@@ -911,7 +1150,7 @@ class RigToolboxClient(client.DccClient, object):
         if not self.is_valid_reply(reply_dict):
             return list()
 
-        return reply_dict['success']
+        return reply_dict['result']
 
     def transfer_skin_uvs(
             self, source_mesh=None, target_mesh=None, auto_assign_labels=True, left_side_label='*_l_*',
@@ -978,10 +1217,11 @@ class RigToolboxClient(client.DccClient, object):
 
         return reply_dict['result']
 
-    def remove_unused_influences(self, mesh=None):
+    def remove_unused_influences(self, mesh=None, tolerance=1e-6):
         cmd = {
             'cmd': 'remove_unused_influences',
-            'mesh': mesh
+            'mesh': mesh,
+            'tolerance': tolerance
         }
 
         reply_dict = self.send(cmd)
@@ -1057,6 +1297,120 @@ class RigToolboxClient(client.DccClient, object):
 
         return reply_dict['success']
 
+    def smooth_vertex_weights(self, components=None, weight=1.0):
+        cmd = {
+            'cmd': 'smooth_vertex_weights',
+            'components': components,
+            'weight': weight
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['success']
+
+    def export_skin_weights(self, meshes=None, directory=None, precision=32):
+        cmd = {
+            'cmd': 'export_skin_weights',
+            'meshes': meshes,
+            'directory': directory,
+            'precision': precision
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['success']
+
+    def import_skin_weights(self, meshes=None, directory=None):
+        cmd = {
+            'cmd': 'import_skin_weights',
+            'meshes': meshes,
+            'directory': directory
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['success']
+
+    def get_skin_weights(self, mesh=None, vertex_indices=None, binary=True, precision=32):
+        """
+        Returns the skin weights of the given mesh in sparse (CSR) format
+        Binary transfer avoids JSON nested lists; weights arrays are read with numpy.frombuffer
+        :param mesh: str or None, skinned mesh to retrieve weights of. If None, first selected mesh is used
+        :param vertex_indices: list(int) or None, vertices to retrieve weights of. If None, all vertices are returned
+        :param binary: bool, whether to transfer weights in binary format or as lists
+        :param precision: int, bits used to transfer weight values in binary format (16, 32 or 64)
+        :return: dict or None, dictionary with vertex_indices, offsets, influence_indices, values and influence_names
+        """
+
+        cmd = {
+            'cmd': 'get_skin_weights',
+            'mesh': mesh,
+            'vertex_indices': vertex_indices,
+            'binary': binary,
+            'precision': precision
+        }
+
+        def _decode_weights(result):
+            weights_data = result['data']
+            if binary:
+                from tpRigToolkit.tools.rigtoolbox.core import wireformat
+                weights_data = wireformat.unpack_weights(wireformat.decode(weights_data))
+            return weights_data
+
+        # Inside a batch, weights are decoded once the batch replies are received
+        if self._batch is not None:
+            return self._batch.add(cmd, result_fn=_decode_weights)
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return None
+
+        return _decode_weights(reply_dict['result'])
+
+    def set_skin_weights(self, mesh, weights_data, binary=True, precision=32):
+        """
+        Sets the skin weights of the given mesh from sparse (CSR) weights
+        :param mesh: str, skinned mesh to set weights of
+        :param weights_data: dict, dictionary with vertex_indices, offsets, influence_indices, values and
+            influence_names keys (such as the one returned by get_skin_weights)
+        :param binary: bool, whether to transfer weights in binary format or as lists
+        :param precision: int, bits used to transfer weight values in binary format (16, 32 or 64)
+        :return: bool
+        """
+
+        if binary:
+            from tpRigToolkit.tools.rigtoolbox.core import wireformat
+            data = wireformat.encode(wireformat.pack_weights(
+                weights_data['vertex_indices'], weights_data['offsets'], weights_data['influence_indices'],
+                weights_data['values'], weights_data['influence_names'], dtype=wireformat.DTYPES[precision // 8]))
+        else:
+            data = dict((key, value.tolist() if hasattr(value, 'tolist') else list(value))
+                        for key, value in weights_data.items())
+
+        cmd = {
+            'cmd': 'set_skin_weights',
+            'mesh': mesh,
+            'data': data,
+            'binary': binary
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return False
+
+        return reply_dict['success']
+
     def move_skin_weights(self):
         cmd = {
             'cmd': 'move_skin_weights'
@@ -1124,6 +1478,22 @@ class RigToolboxClient(client.DccClient, object):
 
         return reply_dict['success']
 
+    def unbind_influences(self, mesh_nodes=None, influences_to_unbind=None, delete=False, use_parent=True):
+        cmd = {
+            'cmd': 'unbind_influences',
+            'skinned_objects': mesh_nodes,
+            'influences_to_unbind': influences_to_unbind,
+            'delete': delete,
+            'use_parent': use_parent
+        }
+
+        reply_dict = self.send(cmd)
+
+        if not self.is_valid_reply(reply_dict):
+            return list()
+
+        return reply_dict['success']
+
     def br_smooth_weights(self, options=False):
         cmd = {
             'cmd': 'br_smooth_weights',
@@ -1161,3 +1531,45 @@ class RigToolboxClient(client.DccClient, object):
             return list()
 
         return reply_dict['success']
+
+
+class CommandBatch(object):
+    """
+    Class that stores the commands queued by RigToolboxClient.batch and the replies returned by the server
+    """
+
+    def __init__(self):
+        super(CommandBatch, self).__init__()
+
+        self.commands = list()
+        self.replies = list()
+        self._result_fns = list()
+
+    def __len__(self):
+        return len(self.commands)
+
+    def add(self, cmd_dict, result_fn=None):
+        """
+        Queues given command and returns a placeholder reply
+        :param cmd_dict: dict
+        :param result_fn: callable or None, function applied to the result of the command reply once it is received.
+            Client functions that post-process command results use it, as results are not available inside the batch
+        :return: dict
+        """
+
+        self.commands.append(cmd_dict)
+        self._result_fns.append(result_fn)
+
+        return {'success': True, 'msg': '', 'result': None, 'cmd': cmd_dict.get('cmd'), 'queued': True}
+
+    def set_replies(self, replies):
+        """
+        Stores the replies returned by the server, post-processing the results of the successful ones
+        :param replies: list(dict), list of replies (one per queued command)
+        """
+
+        for reply, result_fn in zip(replies, self._result_fns):
+            if result_fn and reply.get('success', False):
+                reply['result'] = result_fn(reply['result'])
+
+        self.replies = replies
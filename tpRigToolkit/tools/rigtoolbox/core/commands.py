@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to load rig toolbox commands definitions
+Parsed definitions are cached in a pickle file that is invalidated when any of the YAML files changes
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import pickle
+import hashlib
+import logging
+import tempfile
+
+from tpRigToolkit.tools.rigtoolbox.core import consts
+
+LOGGER = logging.getLogger(consts.TOOL_ID)
+
+# Increase this value each time the format of the cached data changes
+CACHE_VERSION = 1
+EXTENSION = '.yaml'
+
+
+def get_cache_directory():
+    """
+    Returns directory where commands cache files are stored
+    :return: str
+    """
+
+    return os.path.join(tempfile.gettempdir(), consts.TOOL_ID, 'commands')
+
+
+def get_cache_path(commands_path, cache_directory=None):
+    """
+    Returns path of the cache file of the given commands directory
+    :param commands_path: str
+    :param cache_directory: str or None
+    :return: str
+    """
+
+    commands_path = os.path.normcase(os.path.abspath(commands_path))
+    cache_name = hashlib.md5(commands_path.encode('utf-8')).hexdigest()
+
+    return os.path.join(cache_directory or get_cache_directory(), '{}.cache'.format(cache_name))
+
+
+def get_commands_key(commands_path):
+    """
+    Returns a key that identifies the current state of the commands files in the given directory
+    :param commands_path: str
+    :return: tuple
+    """
+
+    files_key = list()
+    for command_file in sorted(os.listdir(commands_path)):
+        if not command_file.endswith(EXTENSION):
+            continue
+        file_stat = os.stat(os.path.join(commands_path, command_file))
+        files_key.append((command_file, file_stat.st_mtime, file_stat.st_size))
+
+    return CACHE_VERSION, tuple(files_key)
+
+
+def load_commands_data(commands_path, read_fn, cache_directory=None, use_cache=True):
+    """
+    Returns commands data of all the YAML files located in the given directory
+    :param commands_path: str
+    :param read_fn: callable, function used to parse a YAML file. It receives the file path
+    :param cache_directory: str or None, directory where cache is stored. If not given, default one is used
+    :param use_cache: bool, whether to read and write cached commands data
+    :return: dict(str, dict), dictionary that maps each commands category with its commands data
+    """
+
+    if not os.path.isdir(commands_path):
+        return dict()
+
+    commands_key = get_commands_key(commands_path)
+    cache_path = get_cache_path(commands_path, cache_directory=cache_directory)
+    if use_cache:
+        commands_datas = _read_cache(cache_path, commands_key)
+        if commands_datas is not None:
+            return commands_datas
+
+    commands_datas = dict()
+    valid = True
+    for command_file, _, _ in commands_key[1]:
+        commands_category = os.path.splitext(command_file)[0]
+        command_file_path = os.path.join(commands_path, command_file)
+        try:
+            commands_datas[commands_category] = read_fn(command_file_path)
+        except Exception as exc:
+            LOGGER.error('Error while reading commands data from "{}" : {}'.format(command_file_path, exc))
+            valid = False
+
+    # Invalid files are not cached, so errors are reported until files are fixed
+    if use_cache and valid:
+        _write_cache(cache_path, commands_key, commands_datas)
+
+    return commands_datas
+
+
+def _read_cache(cache_path, commands_key):
+    if not os.path.isfile(cache_path):
+        return None
+
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cache_key, commands_datas = pickle.load(cache_file)
+    except Exception as exc:
+        LOGGER.debug('Impossible to read commands cache "{}": {}'.format(cache_path, exc))
+        return None
+
+    if cache_key != commands_key:
+        return None
+
+    return commands_datas
+
+
+def _write_cache(cache_path, commands_key, commands_datas):
+    temp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    try:
+        cache_directory = os.path.dirname(cache_path)
+        if not os.path.isdir(cache_directory):
+            os.makedirs(cache_directory)
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump((commands_key, commands_datas), cache_file, protocol=2)
+        if os.path.isfile(cache_path):
+            os.remove(cache_path)
+        os.rename(temp_path, cache_path)
+    except Exception as exc:
+        LOGGER.debug('Impossible to write commands cache "{}": {}'.format(cache_path, exc))
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,339 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a thread pool job runner used to execute long commands asynchronously
+Jobs are executed by worker threads. DCC API calls can be marshalled into DCC main thread through the job context
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import uuid
+import time
+import logging
+import threading
+import functools
+import traceback
+from collections import OrderedDict
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+LOGGER = logging.getLogger('tpRigToolkit-tools-rigtoolbox')
+
+
+class JobStatus(object):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class Job(object):
+    """
+    Class that stores the state of a job
+    """
+
+    def __init__(self, name, fn, args=None, kwargs=None):
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.fn = fn
+        self.args = args or tuple()
+        self.kwargs = kwargs or dict()
+        self.status = JobStatus.PENDING
+        self.progress = 0
+        self.msg = ''
+        self.result = None
+        self.created_time = time.time()
+        self.start_time = None
+        self.end_time = None
+        self.finished = threading.Event()
+        self.callbacks = list()
+
+    def as_dict(self):
+        """
+        Returns a serializable dictionary with the current state of the job
+        :return: dict
+        """
+
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'progress': self.progress,
+            'msg': self.msg,
+            'result': self.result,
+            'elapsed': (self.end_time or time.time()) - self.start_time if self.start_time else 0.0
+        }
+
+
+class JobContext(object):
+    """
+    Class that is given to job functions to report progress and to execute functions in DCC main thread
+    """
+
+    def __init__(self, runner, job):
+        self._runner = runner
+        self._job = job
+
+    @property
+    def job_id(self):
+        return self._job.id
+
+    def progress(self, value, msg=''):
+        """
+        Updates job progress
+        :param value: int, progress value in the range [0, 100]
+        :param msg: str, progress message
+        """
+
+        self._job.progress = value
+        self._job.msg = msg
+        self._runner._notify(self._job)
+
+    def main_thread(self, fn, *args, **kwargs):
+        """
+        Executes given function in DCC main thread and returns its result
+        :param fn: callable
+        :return: object
+        """
+
+        return self._runner.execute_in_main_thread(fn, *args, **kwargs)
+
+
+class JobRunner(object):
+    """
+    Class that executes jobs in a pool of worker threads
+    """
+
+    def __init__(self, max_workers=2, main_thread_executor=None, max_finished_jobs=100):
+        """
+        :param max_workers: int, number of worker threads
+        :param main_thread_executor: callable or None, function used to execute functions in DCC main thread
+            (such as maya.utils.executeInMainThreadWithResult). If None, functions are executed in the worker thread
+        :param max_finished_jobs: int, number of finished jobs whose state is kept so clients can retrieve it
+        """
+
+        self._max_workers = max(1, max_workers)
+        self._main_thread_executor = main_thread_executor
+        self._max_finished_jobs = max_finished_jobs
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._workers = list()
+        self._closed = False
+        self._aborted = False
+
+    def submit(self, name, fn, *args, **kwargs):
+        """
+        Queues a new job. Given function is called with a JobContext as first argument followed by given arguments
+        :param name: str, name of the job
+        :param fn: callable
+        :return: str, job id
+        """
+
+        job = Job(name, fn, args, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Impossible to submit job "{}" to a runner that is shut down'.format(name))
+            self._jobs[job.id] = job
+            self._start_workers()
+        self._queue.put(job)
+
+        return job.id
+
+    def get_job(self, job_id):
+        """
+        Returns the current state of the given job
+        :param job_id: str
+        :return: dict or None
+        """
+
+        job = self._jobs.get(job_id, None)
+
+        return job.as_dict() if job else None
+
+    def get_jobs(self):
+        """
+        Returns the current state of all the jobs known by the runner
+        :return: list(dict)
+        """
+
+        with self._lock:
+            jobs = list(self._jobs.values())
+
+        return [job.as_dict() for job in jobs]
+
+    def subscribe(self, job_id, callback):
+        """
+        Registers a callback that is called with the state of the job each time it changes
+        If the job is already finished, callback is called immediately
+        :param job_id: str
+        :param callback: callable
+        :return: bool
+        """
+
+        job = self._jobs.get(job_id, None)
+        if not job:
+            return False
+
+        with self._lock:
+            finished = job.status in JobStatus.FINISHED
+            if not finished:
+                job.callbacks.append(callback)
+        if finished:
+            callback(job.as_dict())
+
+        return True
+
+    def wait(self, job_id, timeout=None):
+        """
+        Blocks until given job is finished
+        :param job_id: str
+        :param timeout: float or None
+        :return: dict or None, state of the job
+        """
+
+        job = self._jobs.get(job_id, None)
+        if not job:
+            return None
+        job.finished.wait(timeout)
+
+        return job.as_dict()
+
+    def cancel(self, job_id):
+        """
+        Cancels given job. Only jobs that did not start yet can be cancelled
+        :param job_id: str
+        :return: bool
+        """
+
+        job = self._jobs.get(job_id, None)
+        with self._lock:
+            if not job or job.status != JobStatus.PENDING:
+                return False
+            job.status = JobStatus.CANCELLED
+        self._finish(job)
+
+        return True
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops all worker threads once queued jobs are processed. No more jobs can be submitted
+        :param wait: bool, whether to block until all workers are stopped
+        :param cancel_pending: bool, whether to cancel the jobs that did not start yet instead of processing them.
+            Running jobs are not interrupted, but its pending main thread calls are not executed
+        """
+
+        with self._lock:
+            self._closed = True
+            self._aborted = self._aborted or cancel_pending
+            workers = self._workers
+            self._workers = list()
+            pending_ids = [job.id for job in self._jobs.values() if job.status == JobStatus.PENDING]
+        if cancel_pending:
+            for job_id in pending_ids:
+                self.cancel(job_id)
+        for _ in workers:
+            self._queue.put(None)
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def execute_in_main_thread(self, fn, *args, **kwargs):
+        """
+        Executes given function in DCC main thread and returns its result
+        :param fn: callable
+        :return: object
+        """
+
+        if not self._main_thread_executor:
+            return fn(*args, **kwargs)
+
+        @functools.wraps(fn)
+        def _main_thread_fn():
+            # Calls queued before the runner was shut down are not executed
+            if self._aborted:
+                raise RuntimeError('Job runner was shut down')
+            return fn(*args, **kwargs)
+
+        return self._main_thread_executor(_main_thread_fn)
+
+    def _start_workers(self):
+        """
+        Internal function that starts worker threads. Workers are started lazily when the first job is submitted
+        """
+
+        while len(self._workers) < self._max_workers:
+            worker = threading.Thread(target=self._work, name='RigToolboxJobWorker{}'.format(len(self._workers)))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        """
+        Internal function executed by worker threads
+        """
+
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            with self._lock:
+                if job.status != JobStatus.PENDING:
+                    continue
+                job.status = JobStatus.RUNNING
+                job.start_time = time.time()
+            self._notify(job)
+            try:
+                job.result = job.fn(JobContext(self, job), *job.args, **job.kwargs)
+                job.status = JobStatus.DONE
+                job.progress = 100
+            except Exception:
+                job.status = JobStatus.FAILED
+                job.msg = 'Something went wrong while executing job "{}": {}'.format(job.name, traceback.format_exc())
+                LOGGER.error(job.msg)
+            self._finish(job)
+
+    def _finish(self, job):
+        """
+        Internal function that marks given job as finished and removes old finished jobs
+        :param job: Job
+        """
+
+        job.end_time = time.time()
+
+        # Subscribers are notified before the job is flagged as finished, so waiters always see the final state
+        self._notify(job)
+        with self._lock:
+            job.callbacks = list()
+        job.finished.set()
+
+        with self._lock:
+            finished_ids = [
+                job_id for job_id, finished_job in self._jobs.items() if finished_job.status in JobStatus.FINISHED]
+            for job_id in finished_ids[:max(0, len(finished_ids) - self._max_finished_jobs)]:
+                self._jobs.pop(job_id)
+
+    def _notify(self, job):
+        """
+        Internal function that calls the callbacks subscribed to the given job
+        :param job: Job
+        """
+
+        with self._lock:
+            callbacks = list(job.callbacks)
+        if not callbacks:
+            return
+
+        job_data = job.as_dict()
+        for callback in callbacks:
+            try:
+                callback(job_data)
+            except Exception:
+                LOGGER.warning('Error while notifying job "{}" state: {}'.format(job.name, traceback.format_exc()))
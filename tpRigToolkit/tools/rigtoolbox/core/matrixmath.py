@@ -0,0 +1,196 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains vectorized functions to work with transform matrices
+Matrices follow Maya convention: row vectors (point * matrix) with translation stored in the last row. Angles are
+expressed in radians and rotate orders use Maya rotateOrder attribute values.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+# Maya rotateOrder values: xyz, yzx, zxy, xzy, yxz, zyx
+ROTATE_ORDERS = ((0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (1, 0, 2), (2, 1, 0))
+
+EPSILON = 1e-8
+
+
+def axis_rotation_matrices(angles, axis):
+    """
+    Returns rotation matrices around the given axis
+    :param angles: numpy.array, (N) angles in radians
+    :param axis: int, 0 for X, 1 for Y and 2 for Z
+    :return: numpy.array, (N, 3, 3) rotation matrices
+    """
+
+    angles = numpy.asarray(angles, dtype=numpy.float64)
+    cos = numpy.cos(angles)
+    sin = numpy.sin(angles)
+    i, j = (axis + 1) % 3, (axis + 2) % 3
+
+    matrices = numpy.zeros((len(angles), 3, 3))
+    matrices[:, axis, axis] = 1.0
+    matrices[:, i, i] = cos
+    matrices[:, i, j] = sin
+    matrices[:, j, i] = -sin
+    matrices[:, j, j] = cos
+
+    return matrices
+
+
+def euler_to_matrices(angles, rotate_orders=0):
+    """
+    Returns rotation matrices of the given euler angles
+    :param angles: numpy.array, (N, 3) XYZ angles in radians
+    :param rotate_orders: int or numpy.array, rotate order of all the angles or (N) rotate order of each one
+    :return: numpy.array, (N, 3, 3) rotation matrices
+    """
+
+    angles = numpy.atleast_2d(numpy.asarray(angles, dtype=numpy.float64))
+    rotate_orders = numpy.broadcast_to(numpy.asarray(rotate_orders, dtype=numpy.int32), (len(angles),))
+    axis_matrices = [axis_rotation_matrices(angles[:, axis], axis) for axis in range(3)]
+
+    matrices = numpy.empty((len(angles), 3, 3))
+    for rotate_order, (i, j, k) in enumerate(ROTATE_ORDERS):
+        mask = rotate_orders == rotate_order
+        if not mask.any():
+            continue
+        matrices[mask] = numpy.matmul(
+            numpy.matmul(axis_matrices[i][mask], axis_matrices[j][mask]), axis_matrices[k][mask])
+
+    return matrices
+
+
+def matrices_to_euler(matrices, rotate_orders=0):
+    """
+    Returns euler angles of the given rotation matrices
+    :param matrices: numpy.array, (N, 3, 3) rotation matrices
+    :param rotate_orders: int or numpy.array, rotate order of all the matrices or (N) rotate order of each one
+    :return: numpy.array, (N, 3) XYZ angles in radians
+    """
+
+    matrices = numpy.asarray(matrices, dtype=numpy.float64).reshape(-1, 3, 3)
+    rotate_orders = numpy.broadcast_to(numpy.asarray(rotate_orders, dtype=numpy.int32), (len(matrices),))
+
+    angles = numpy.zeros((len(matrices), 3))
+    for rotate_order, (i, j, k) in enumerate(ROTATE_ORDERS):
+        mask = rotate_orders == rotate_order
+        if not mask.any():
+            continue
+        # Rotation R = Ri * Rj * Rk. Sign depends on whether (i, j, k) is an even permutation of (x, y, z)
+        sign = 1.0 if (j - i) % 3 == 1 else -1.0
+        rotations = matrices[mask]
+        cos_j = numpy.sqrt(rotations[:, i, i] ** 2 + rotations[:, i, j] ** 2)
+        singular = cos_j < EPSILON
+        angle_i = numpy.where(
+            singular, numpy.arctan2(-sign * rotations[:, k, j], rotations[:, j, j]),
+            numpy.arctan2(sign * rotations[:, j, k], rotations[:, k, k]))
+        angle_j = numpy.arctan2(-sign * rotations[:, i, k], cos_j)
+        angle_k = numpy.where(singular, 0.0, numpy.arctan2(sign * rotations[:, i, j], rotations[:, i, i]))
+        angles[mask, i] = angle_i
+        angles[mask, j] = angle_j
+        angles[mask, k] = angle_k
+
+    return angles
+
+
+def orthonormalize(matrices):
+    """
+    Returns the closest rotation matrices of the given 3x3 matrices
+    :param matrices: numpy.array, (N, 3, 3) matrices
+    :return: numpy.array, (N, 3, 3) rotation matrices
+    """
+
+    u, _, vt = numpy.linalg.svd(matrices)
+    rotations = numpy.matmul(u, vt)
+
+    # Make sure the result is a rotation (and not a reflection)
+    reflected = numpy.linalg.det(rotations) < 0
+    if reflected.any():
+        u[reflected, :, -1] *= -1
+        rotations[reflected] = numpy.matmul(u[reflected], vt[reflected])
+
+    return rotations
+
+
+def decompose_matrices(matrices):
+    """
+    Decomposes given matrices into translation, rotation and scale. Shear is discarded
+    :param matrices: numpy.array, (N, 4, 4) or (N, 3, 3) matrices
+    :return: tuple(numpy.array, numpy.array, numpy.array), (N, 3) translations, (N, 3, 3) rotation matrices and
+        (N, 3) scales
+    """
+
+    matrices = numpy.asarray(matrices, dtype=numpy.float64)
+    translations = matrices[:, 3, :3].copy() if matrices.shape[1] == 4 else numpy.zeros((len(matrices), 3))
+    axes = matrices[:, :3, :3]
+
+    scales = numpy.linalg.norm(axes, axis=2)
+    negative = numpy.linalg.det(axes) < 0
+    scales[negative, 0] *= -1
+    rotations = orthonormalize(axes / numpy.where(scales == 0.0, 1.0, scales)[:, :, None])
+
+    return translations, rotations, scales
+
+
+def average_matrix(matrices):
+    """
+    Returns the average transform of the given matrices. Translation and scales are averaged linearly and rotations
+    are averaged using the closest rotation of its arithmetic mean
+    :param matrices: numpy.array, (N, 4, 4) matrices
+    :return: numpy.array, (4, 4) matrix
+    """
+
+    translations, rotations, scales = decompose_matrices(matrices)
+    rotation = orthonormalize(rotations.mean(axis=0)[None])[0]
+
+    matrix = numpy.identity(4)
+    matrix[:3, :3] = scales.mean(axis=0)[:, None] * rotation
+    matrix[3, :3] = translations.mean(axis=0)
+
+    return matrix
+
+
+def compute_match_values(
+        world_matrix, parent_inverse_matrices, rotate_orders=0, rotate_axes=None, joints=None, inverse_scales=None):
+    """
+    Computes the local transform values that place all the given nodes at the given world matrix
+    Node matrix is composed as S * RA * R * T for transforms and S * RA * R * JO * IS * T for joints (pivots are
+    expected to be at origin). Joints rotation is stored in joint orient and its rotate values are zeroed
+    :param world_matrix: numpy.array, (4, 4) world matrix to match
+    :param parent_inverse_matrices: numpy.array, (N, 4, 4) parent inverse world matrix of each node
+    :param rotate_orders: int or numpy.array, (N) rotate order of each node
+    :param rotate_axes: numpy.array or None, (N, 3) rotate axis angles (in radians) of each node
+    :param joints: numpy.array or None, (N) bool array with True for joint nodes
+    :param inverse_scales: numpy.array or None, (N, 3) inverseScale value of each joint (parent scale, when segment
+        scale compensate is enabled)
+    :return: dict, dictionary with (N, 3) translate, rotate, scale and jointOrient values
+    """
+
+    parent_inverse_matrices = numpy.asarray(parent_inverse_matrices, dtype=numpy.float64)
+    num_nodes = len(parent_inverse_matrices)
+    joints = numpy.zeros(num_nodes, dtype=bool) if joints is None else numpy.asarray(joints, dtype=bool)
+
+    local_matrices = numpy.matmul(numpy.asarray(world_matrix, dtype=numpy.float64), parent_inverse_matrices)
+    if inverse_scales is not None:
+        # Joint matrix is multiplied by the inverse of its inverseScale before translation, so it is compensated here
+        compensation = numpy.where(joints[:, None], numpy.asarray(inverse_scales, dtype=numpy.float64), 1.0)
+        local_matrices[:, :3, :3] *= compensation[:, None, :]
+
+    translations, rotations, scales = decompose_matrices(local_matrices)
+    if rotate_axes is not None:
+        rotate_axis_matrices = euler_to_matrices(rotate_axes)
+        rotations = numpy.matmul(numpy.transpose(rotate_axis_matrices, (0, 2, 1)), rotations)
+
+    rotate_orders = numpy.broadcast_to(numpy.asarray(rotate_orders, dtype=numpy.int32), (num_nodes,))
+    rotates = numpy.where(joints[:, None], 0.0, matrices_to_euler(rotations, rotate_orders))
+    joint_orients = numpy.where(joints[:, None], matrices_to_euler(rotations, 0), 0.0)
+
+    return {
+        'translate': translations,
+        'rotate': rotates,
+        'scale': scales,
+        'jointOrient': joint_orients
+    }
@@ -0,0 +1,268 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains classes to record and summarize server commands timings
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import time
+import functools
+import threading
+import contextlib
+from collections import deque
+
+
+class CallCounter(object):
+    """
+    Class that counts the calls done to the functions of a module (such as maya.cmds)
+    Module functions are wrapped only once, but calls are only counted while a counting scope is active. Calls done
+    from other threads while counting are counted too
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._depth = 0
+        self._module = None
+        self._functions = dict()
+        self._lock = threading.Lock()
+
+    @property
+    def count(self):
+        return self._count
+
+    def is_installed(self):
+        return self._module is not None
+
+    def is_counting(self):
+        return self._depth > 0
+
+    @contextlib.contextmanager
+    def counting(self):
+        """
+        Context manager that counts the calls done to the functions of the installed module while it is active
+        Scopes can be nested
+        """
+
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+
+    def install(self, module):
+        """
+        Replaces all the functions of the given module with wrappers that count its calls
+        :param module: module
+        """
+
+        if self._module is not None:
+            return
+
+        for name in dir(module):
+            fn = getattr(module, name)
+            if name.startswith('_') or not callable(fn) or isinstance(fn, type):
+                continue
+            self._functions[name] = fn
+            setattr(module, name, self._wrap(fn))
+        self._module = module
+
+    def uninstall(self):
+        """
+        Restores the original functions of the module
+        """
+
+        if self._module is None:
+            return
+
+        for name, fn in self._functions.items():
+            setattr(self._module, name, fn)
+        self._functions.clear()
+        self._module = None
+
+    def _wrap(self, fn):
+        @functools.wraps(fn)
+        def _counted(*args, **kwargs):
+            if self._depth:
+                with self._lock:
+                    self._count += 1
+            return fn(*args, **kwargs)
+
+        return _counted
+
+
+class MetricsRecorder(object):
+    """
+    Class that stores command timings records in a ring buffer and summarizes them
+    """
+
+    def __init__(self, max_records=2000, call_counter=None, count_calls=False):
+        """
+        :param max_records: int, number of records kept. Oldest records are discarded
+        :param call_counter: CallCounter or None, counter used to record the number of DCC calls done by each command
+        :param count_calls: bool, whether to count DCC calls done by each command. Counter must be installed
+        """
+
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        self._call_counter = call_counter
+        self._count_calls = count_calls
+
+    @property
+    def count_calls(self):
+        return self._count_calls
+
+    @count_calls.setter
+    def count_calls(self, flag):
+        self._count_calls = bool(flag)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def records(self, name=None):
+        """
+        Returns stored records
+        :param name: str or None, if given, only records of the given command are returned
+        :return: list(dict)
+        """
+
+        with self._lock:
+            records = list(self._records)
+
+        return [record for record in records if name is None or record['name'] == name]
+
+    def instrument(self, name, fn):
+        """
+        Returns a wrapper of the given handler that records its timings each time it is called
+        Handlers are expected to follow the server handlers signature: fn(data, reply)
+        :param name: str, name of the command
+        :param fn: callable
+        :return: callable
+        """
+
+        @functools.wraps(fn)
+        def _instrumented(data, reply):
+            record = {'name': name, 'time': time.time()}
+            counter = self._call_counter if self._count_calls and self._call_counter else None
+            counting = counter.counting() if counter else _null_context()
+            calls = counter.count if counter else 0
+            start = time.time()
+            try:
+                with counting:
+                    return fn(data, reply)
+            finally:
+                record['handler_time'] = time.time() - start
+                record['cmds_calls'] = counter.count - calls if counter else None
+                record['success'] = bool(reply.get('success', False))
+                with self._lock:
+                    self._records.append(record)
+
+        return _instrumented
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Returns rolling percentiles of the stored records grouped by command name
+        :param percentiles: tuple(int), percentiles to compute
+        :return: dict(str, dict), dictionary with the count, total time and percentiles of each metric per command
+        """
+
+        grouped = dict()
+        for record in self.records():
+            grouped.setdefault(record['name'], list()).append(record)
+
+        summary = dict()
+        for name, records in grouped.items():
+            command_summary = {
+                'count': len(records),
+                'failed': len([record for record in records if not record['success']]),
+                'total_time': sum(record['handler_time'] for record in records)
+            }
+            for key in ('handler_time', 'cmds_calls'):
+                values = [record[key] for record in records if record.get(key, None) is not None]
+                if not values:
+                    continue
+                command_summary[key] = dict(
+                    ('p{}'.format(percentile), percentile_value(values, percentile)) for percentile in percentiles)
+            summary[name] = command_summary
+
+        return summary
+
+
+class PhaseTimer(object):
+    """
+    Class that records the duration of the phases of a process (such as tool startup). Phases can be timed from
+    different threads
+    """
+
+    def __init__(self):
+        self._start = time.time()
+        self._phases = list()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Context manager that records the time spent inside it
+        :param name: str, name of the phase
+        """
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            end = time.time()
+            with self._lock:
+                self._phases.append((name, start - self._start, end - start))
+
+    def phases(self):
+        """
+        Returns recorded phases sorted by start time
+        :return: list(tuple(str, float, float)), list with the name, start offset and duration of each phase
+        """
+
+        with self._lock:
+            return sorted(self._phases, key=lambda phase: phase[1])
+
+    def total_time(self):
+        return time.time() - self._start
+
+    def report(self):
+        """
+        Returns a human readable breakdown of the recorded phases
+        :return: str
+        """
+
+        lines = list()
+        for name, start, duration in self.phases():
+            lines.append('{:<30} {:>8.3f}s (at {:.3f}s)'.format(name, duration, start))
+        lines.append('{:<30} {:>8.3f}s'.format('total', self.total_time()))
+
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def _null_context():
+    yield
+
+
+def percentile_value(values, percentile):
+    """
+    Returns the given percentile of the given values using linear interpolation between closest ranks
+    :param values: list(float)
+    :param percentile: float, percentile in the range [0, 100]
+    :return: float
+    """
+
+    values = sorted(values)
+    if not values:
+        return None
+
+    rank = (len(values) - 1) * percentile / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
@@ -0,0 +1,232 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic vectorized functions to operate with skin weights
+Weights are handled as (vertices x influences) NumPy arrays
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+
+def path_percentages(path_length, positions=None):
+    """
+    Returns the interpolation percentage of each one of the vertices of a path
+    :param path_length: int, number of vertices in the path (start and end vertices not included)
+    :param positions: list or numpy.array or None, positions of the path vertices (start and end vertices included).
+        If given, percentages are computed using the distance along the path; otherwise vertices are uniformly
+        distributed between start and end vertices
+    :return: numpy.array, array of path_length percentages in the range [0, 1]
+    """
+
+    uniform_percentages = numpy.arange(1, path_length + 1, dtype=numpy.float64) / (path_length + 1)
+    if positions is None:
+        return uniform_percentages
+
+    positions = numpy.asarray(positions, dtype=numpy.float64)
+    if len(positions) != path_length + 2:
+        raise ValueError(
+            'Expected {} positions (path vertices plus start and end vertices) but {} were given'.format(
+                path_length + 2, len(positions)))
+
+    lengths = numpy.linalg.norm(numpy.diff(positions, axis=0), axis=1)
+    total_length = lengths.sum()
+    if total_length <= 0.0:
+        return uniform_percentages
+
+    return numpy.cumsum(lengths)[:-1] / total_length
+
+
+def interpolate_weights(start_weights, end_weights, percentages):
+    """
+    Linearly interpolates between start and end weights rows for each one of the given percentages
+    :param start_weights: list or numpy.array, weights of the start vertex (one value per influence)
+    :param end_weights: list or numpy.array, weights of the end vertex (one value per influence)
+    :param percentages: list or numpy.array, interpolation percentage of each vertex
+    :return: numpy.array, (vertices x influences) array with the interpolated weights
+    """
+
+    start_weights = numpy.asarray(start_weights, dtype=numpy.float64)
+    end_weights = numpy.asarray(end_weights, dtype=numpy.float64)
+    if start_weights.shape != end_weights.shape:
+        raise ValueError('Start and end weights must have the same number of influences')
+    percentages = numpy.asarray(percentages, dtype=numpy.float64).reshape(-1, 1)
+
+    return start_weights * (1.0 - percentages) + end_weights * percentages
+
+
+def average_weights(weights, threshold=0.000001):
+    """
+    Returns the normalized average of the given weights rows
+    :param weights: list or numpy.array, (vertices x influences) weights to average
+    :param threshold: float, weights below this value are ignored
+    :return: numpy.array, normalized average weights (one value per influence)
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    weights = numpy.where(weights < threshold, 0.0, weights)
+    average = weights.mean(axis=0)
+    total = average.sum()
+    if total <= 0.0:
+        return average
+
+    return average / total
+
+
+def normalize_weights(weights):
+    """
+    Normalizes given weights rows so each one of them sums 1. Rows without weights are left untouched
+    :param weights: list or numpy.array, (vertices x influences) weights
+    :return: numpy.array, normalized (vertices x influences) weights
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    totals = weights.sum(axis=-1, keepdims=True)
+
+    return numpy.divide(weights, totals, out=weights.copy(), where=totals > 0.0)
+
+
+def smooth_weights(weights, neighbour_weights, offsets, neighbours, blend=1.0):
+    """
+    Blends the weights of each vertex towards the average weights of its connected vertices
+    Vertices connectivity is given in CSR format: the neighbours of vertex i are
+    neighbour_weights[neighbours[offsets[i]:offsets[i + 1]]]
+    :param weights: list or numpy.array, (vertices x influences) weights of the vertices to smooth
+    :param neighbour_weights: list or numpy.array, (neighbours x influences) weights of the connected vertices
+    :param offsets: list or numpy.array, CSR row pointers (vertices + 1 values)
+    :param neighbours: list or numpy.array, CSR neighbour indices (rows of neighbour_weights)
+    :param blend: float, 0.0 keeps the original weights and 1.0 sets the neighbours average weights
+    :return: numpy.array, normalized (vertices x influences) smoothed weights
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    neighbour_weights = numpy.asarray(neighbour_weights, dtype=numpy.float64)
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    neighbours = numpy.asarray(neighbours, dtype=numpy.int64)
+
+    counts = numpy.diff(offsets)
+    rows = numpy.repeat(numpy.arange(len(counts)), counts)
+    totals = numpy.zeros_like(weights)
+    numpy.add.at(totals, rows, neighbour_weights[neighbours])
+
+    # Vertices without neighbours keep their weights
+    average = weights.copy()
+    has_neighbours = counts > 0
+    average[has_neighbours] = totals[has_neighbours] / counts[has_neighbours, numpy.newaxis]
+
+    return normalize_weights(weights * (1.0 - blend) + average * blend)
+
+
+def move_weights(weights, source_columns, target_columns):
+    """
+    Moves the weights of the given source influences into the given target influences in a single array operation
+    Source columns are left with zero weights. Several sources can be moved into the same target
+    :param weights: list or numpy.array, (vertices x influences) weights
+    :param source_columns: list(int), influence columns to move weights from
+    :param target_columns: list(int), influence columns to move weights into (one per source column)
+    :return: numpy.array, (vertices x influences) remapped weights
+    """
+
+    weights = numpy.array(weights, dtype=numpy.float64)
+    source_columns = numpy.asarray(source_columns, dtype=numpy.int64)
+    target_columns = numpy.asarray(target_columns, dtype=numpy.int64)
+    if len(source_columns) != len(target_columns):
+        raise ValueError('A target influence is expected for each source influence')
+    if numpy.intersect1d(source_columns, target_columns).size:
+        raise ValueError('Weights can not be moved into influences whose weights are also being moved')
+
+    moved_weights = weights[:, source_columns]
+    weights[:, source_columns] = 0.0
+    numpy.add.at(weights.T, target_columns, moved_weights.T)
+
+    return weights
+
+
+def remove_weights(weights, source_columns, fallback_columns):
+    """
+    Sets the weights of the given source influences to zero and normalizes the remaining weights
+    Vertices that are only weighted to the source influences would be left without weights, so their weights are
+    moved into the fallback influences instead
+    :param weights: list or numpy.array, (vertices x influences) weights
+    :param source_columns: list(int), influence columns to remove weights of
+    :param fallback_columns: list(int), influence columns that receive the weights of the vertices that are only
+        weighted to the source influences (one per source column)
+    :return: numpy.array, normalized (vertices x influences) weights
+    """
+
+    weights = numpy.array(weights, dtype=numpy.float64)
+    source_columns = numpy.asarray(source_columns, dtype=numpy.int64)
+
+    remaining_weights = weights.copy()
+    remaining_weights[:, source_columns] = 0.0
+    orphans = remaining_weights.sum(axis=1) <= 0.0
+    if numpy.any(orphans):
+        remaining_weights[orphans] = move_weights(weights[orphans], source_columns, fallback_columns)
+
+    return normalize_weights(remaining_weights)
+
+
+def influence_count_histogram(weights, threshold=0.0):
+    """
+    Returns how many vertices are influenced by each number of influences
+    :param weights: list or numpy.array, (vertices x influences) weights
+    :param threshold: float, weights lower or equal than this value are not counted
+    :return: numpy.array, array whose item i is the number of vertices with i influences
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+
+    return numpy.bincount((weights > threshold).sum(axis=-1), minlength=1)
+
+
+def sparse_weights(weights, threshold=0.0):
+    """
+    Converts given dense weights into CSR format, discarding weights lower or equal than the given threshold
+    :param weights: list or numpy.array, (vertices x influences) weights
+    :param threshold: float
+    :return: tuple(numpy.array, numpy.array, numpy.array), row offsets, influence indices and weight values
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    rows, columns = numpy.nonzero(weights > threshold)
+    offsets = numpy.zeros(len(weights) + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(rows, minlength=len(weights)), out=offsets[1:])
+
+    return offsets, columns, weights[rows, columns]
+
+
+def dense_weights(offsets, influence_indices, values, num_influences):
+    """
+    Converts given CSR weights into a dense (vertices x influences) weights array
+    :param offsets: list or numpy.array, row offsets (vertices + 1 values)
+    :param influence_indices: list or numpy.array, influence index of each value
+    :param values: list or numpy.array, weight values
+    :param num_influences: int, number of columns of the dense array
+    :return: numpy.array
+    """
+
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    rows = numpy.repeat(numpy.arange(len(offsets) - 1), numpy.diff(offsets))
+    weights = numpy.zeros((len(offsets) - 1, num_influences), dtype=numpy.float64)
+    weights[rows, numpy.asarray(influence_indices, dtype=numpy.int64)] = values
+
+    return weights
+
+
+def dequantize_weights(offsets, influence_indices, values, num_influences):
+    """
+    Converts given CSR weights stored with reduced precision (such as the ones read from weights files or received in
+    binary format) into normalized dense (vertices x influences) weights
+    Quantized weights do not sum exactly 1, so they are normalized in double precision before being written
+    :param offsets: list or numpy.array, row offsets (vertices + 1 values)
+    :param influence_indices: list or numpy.array, influence index of each value
+    :param values: list or numpy.array, weight values of any floating point precision
+    :param num_influences: int, number of columns of the dense array
+    :return: numpy.array
+    """
+
+    values = numpy.asarray(values, dtype=numpy.float64)
+
+    return normalize_weights(dense_weights(offsets, influence_indices, values, num_influences))
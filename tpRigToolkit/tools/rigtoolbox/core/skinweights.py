@@ -0,0 +1,414 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic sparse skin weights data structure
+Weights are stored in CSR format: the weights of vertex i are values[offsets[i]:offsets[i + 1]] and they belong to
+the influences influence_indices[offsets[i]:offsets[i + 1]] of the influence names table
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+from tpRigToolkit.tools.rigtoolbox.core import skinmath
+
+
+class SkinWeights(object):
+    """
+    Sparse skin weights of a set of vertices. All operations are vectorized and return new SkinWeights instances
+    """
+
+    OFFSETS_DTYPE = numpy.int64
+    INDICES_DTYPE = numpy.int32
+    VALUES_DTYPE = numpy.float32
+
+    # Instances are mutable arrays containers, so they cannot be hashed
+    __hash__ = None
+
+    def __init__(self, offsets, influence_indices, values, influence_names):
+        self._offsets = numpy.asarray(offsets, dtype=self.OFFSETS_DTYPE)
+        self._influence_indices = numpy.asarray(influence_indices, dtype=self.INDICES_DTYPE)
+        self._values = numpy.asarray(values, dtype=self.VALUES_DTYPE)
+        self._influence_names = tuple(influence_names)
+
+        if self._offsets.ndim != 1 or not len(self._offsets) or self._offsets[0] != 0:
+            raise ValueError('Invalid CSR row offsets')
+        if self._offsets[-1] != len(self._values) or len(self._influence_indices) != len(self._values):
+            raise ValueError('CSR row offsets do not match the number of weight values')
+        if numpy.any(numpy.diff(self._offsets) < 0):
+            raise ValueError('CSR row offsets must be sorted')
+        if len(self._influence_indices) and (
+                self._influence_indices.min() < 0 or self._influence_indices.max() >= len(self._influence_names)):
+            raise ValueError('Influence indices do not match the influence names table')
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __repr__(self):
+        return '{}(vertices={}, influences={}, values={})'.format(
+            type(self).__name__, self.num_vertices, self.num_influences, len(self._values))
+
+    def __eq__(self, other):
+        if not isinstance(other, SkinWeights):
+            return NotImplemented
+
+        return (
+            self._influence_names == other.influence_names and
+            numpy.array_equal(self._offsets, other.offsets) and
+            numpy.array_equal(self._influence_indices, other.influence_indices) and
+            numpy.array_equal(self._values, other.values))
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def offsets(self):
+        return self._offsets
+
+    @property
+    def influence_indices(self):
+        return self._influence_indices
+
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def influence_names(self):
+        return self._influence_names
+
+    @property
+    def num_vertices(self):
+        return len(self._offsets) - 1
+
+    @property
+    def num_influences(self):
+        return len(self._influence_names)
+
+    @property
+    def nbytes(self):
+        return self._offsets.nbytes + self._influence_indices.nbytes + self._values.nbytes
+
+    # =================================================================================================================
+    # CONSTRUCTORS
+    # =================================================================================================================
+
+    @classmethod
+    def from_dense(cls, weights, influence_names, threshold=0.0):
+        """
+        Creates sparse weights from the given dense weights. Weights lower or equal than the threshold are discarded
+        :param weights: list or numpy.array, (vertices x influences) weights
+        :param influence_names: list(str), name of each weights column
+        :param threshold: float
+        :return: SkinWeights
+        """
+
+        weights = numpy.asarray(weights)
+        if weights.ndim != 2 or weights.shape[1] != len(influence_names):
+            raise ValueError('Weights shape {} does not match the number of influences ({})'.format(
+                weights.shape, len(influence_names)))
+        offsets, influence_indices, values = skinmath.sparse_weights(weights, threshold=threshold)
+
+        return cls(offsets, influence_indices, values, influence_names)
+
+    @classmethod
+    def from_coordinates(cls, rows, influence_indices, values, num_vertices, influence_names):
+        """
+        Creates sparse weights from unordered (row, influence, value) entries. Duplicated entries are summed and
+        zero values are discarded
+        :param rows: list or numpy.array, vertex row of each entry
+        :param influence_indices: list or numpy.array, influence index of each entry
+        :param values: list or numpy.array, weight value of each entry
+        :param num_vertices: int
+        :param influence_names: list(str)
+        :return: SkinWeights
+        """
+
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= num_vertices):
+            raise ValueError('Rows must be in the range [0, {})'.format(num_vertices))
+        rows, influence_indices, values = _sum_duplicates(rows, influence_indices, values)
+        valid = values != 0.0
+        rows = rows[valid]
+
+        return cls(
+            _get_offsets(rows, num_vertices), influence_indices[valid], values[valid], influence_names)
+
+    @classmethod
+    def concatenate(cls, skin_weights_list):
+        """
+        Stacks the vertices of the given sparse weights. Influence names tables are merged
+        :param skin_weights_list: list(SkinWeights)
+        :return: SkinWeights
+        """
+
+        influence_names = merge_influence_names([skin_weights.influence_names for skin_weights in skin_weights_list])
+        if not skin_weights_list:
+            return cls([0], [], [], influence_names)
+
+        offsets = [numpy.zeros(1, dtype=cls.OFFSETS_DTYPE)]
+        influence_indices = list()
+        values = list()
+        num_values = 0
+        for skin_weights in skin_weights_list:
+            skin_weights = skin_weights.reorder_influences(influence_names)
+            offsets.append(skin_weights.offsets[1:] + num_values)
+            influence_indices.append(skin_weights.influence_indices)
+            values.append(skin_weights.values)
+            num_values += len(skin_weights.values)
+
+        return cls(
+            numpy.concatenate(offsets), numpy.concatenate(influence_indices), numpy.concatenate(values),
+            influence_names)
+
+    # =================================================================================================================
+    # QUERIES
+    # =================================================================================================================
+
+    def rows(self):
+        """
+        Returns the vertex row of each weight value
+        :return: numpy.array
+        """
+
+        return numpy.repeat(numpy.arange(self.num_vertices), numpy.diff(self._offsets))
+
+    def influence_counts(self):
+        """
+        Returns the number of influences with weights of each vertex
+        :return: numpy.array
+        """
+
+        return numpy.diff(self._offsets)
+
+    def row_sums(self):
+        """
+        Returns the sum of the weights of each vertex
+        :return: numpy.array
+        """
+
+        return numpy.bincount(self.rows(), weights=self._values, minlength=self.num_vertices)
+
+    def influence_sums(self):
+        """
+        Returns the sum of the weights of each influence
+        :return: numpy.array
+        """
+
+        return numpy.bincount(self._influence_indices, weights=self._values, minlength=self.num_influences)
+
+    def to_dense(self, dtype=numpy.float64):
+        """
+        Returns weights as a dense (vertices x influences) array
+        :param dtype: numpy.dtype
+        :return: numpy.array
+        """
+
+        return skinmath.dense_weights(
+            self._offsets, self._influence_indices, self._values, self.num_influences).astype(dtype, copy=False)
+
+    def diff(self, other, tolerance=1e-6):
+        """
+        Returns the vertices whose weights differ from the weights of the given sparse weights. Influences are
+        matched by name
+        :param other: SkinWeights
+        :param tolerance: float, maximum difference between two weights to consider them equal
+        :return: numpy.array, sorted rows of the vertices with different weights
+        """
+
+        if other.num_vertices != self.num_vertices:
+            raise ValueError('Impossible to compare weights of {} and {} vertices'.format(
+                self.num_vertices, other.num_vertices))
+
+        influence_names = merge_influence_names([self._influence_names, other.influence_names])
+        weights = self.reorder_influences(influence_names)
+        other = other.reorder_influences(influence_names)
+        rows, _, differences = _sum_duplicates(
+            numpy.concatenate([weights.rows(), other.rows()]),
+            numpy.concatenate([weights.influence_indices, other.influence_indices]),
+            numpy.concatenate([weights.values.astype(numpy.float64), -other.values.astype(numpy.float64)]))
+
+        return numpy.unique(rows[numpy.abs(differences) > tolerance])
+
+    # =================================================================================================================
+    # OPERATIONS
+    # =================================================================================================================
+
+    def copy(self):
+        """
+        Returns a copy of these weights
+        :return: SkinWeights
+        """
+
+        return type(self)(
+            self._offsets.copy(), self._influence_indices.copy(), self._values.copy(), self._influence_names)
+
+    def slice_rows(self, rows):
+        """
+        Returns the weights of the given vertex rows
+        :param rows: slice or list(int) or numpy.array, rows to return (in the given order)
+        :return: SkinWeights
+        """
+
+        if isinstance(rows, slice):
+            rows = numpy.arange(self.num_vertices)[rows]
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+
+        counts = numpy.diff(self._offsets)[rows]
+        offsets = numpy.zeros(len(rows) + 1, dtype=self.OFFSETS_DTYPE)
+        numpy.cumsum(counts, out=offsets[1:])
+        positions = numpy.repeat(self._offsets[rows] - offsets[:-1], counts) + numpy.arange(offsets[-1])
+
+        return type(self)(offsets, self._influence_indices[positions], self._values[positions], self._influence_names)
+
+    def remap_influences(self, columns, influence_names):
+        """
+        Moves the weights of each influence into a new influence index. Weights moved into the same influence are
+        summed and weights of influences mapped to -1 are discarded
+        :param columns: list(int) or numpy.array, new index of each influence
+        :param influence_names: list(str), new influence names table
+        :return: SkinWeights
+        """
+
+        columns = numpy.asarray(columns, dtype=numpy.int64)
+        if len(columns) != self.num_influences:
+            raise ValueError('Expected {} influence columns but {} were given'.format(
+                self.num_influences, len(columns)))
+        if len(columns) and columns.max() >= len(influence_names):
+            raise ValueError('Influence columns do not match the new influence names table')
+
+        influence_indices = columns[self._influence_indices]
+        valid = influence_indices >= 0
+
+        return self.from_coordinates(
+            self.rows()[valid], influence_indices[valid], self._values[valid], self.num_vertices, influence_names)
+
+    def reorder_influences(self, influence_names):
+        """
+        Returns these weights using the given influence names table. Influences are matched by name
+        :param influence_names: list(str), table that must contain all the influences with weights
+        :return: SkinWeights
+        """
+
+        influence_names = tuple(influence_names)
+        if influence_names == self._influence_names:
+            return self
+
+        name_columns = dict((name, i) for i, name in enumerate(influence_names))
+        columns = numpy.array([name_columns.get(name, -1) for name in self._influence_names], dtype=numpy.int64)
+        missing = (columns < 0) & (self.influence_sums() > 0.0)
+        if missing.any():
+            raise ValueError('Influences with weights not found: {}'.format(
+                [self._influence_names[i] for i in numpy.flatnonzero(missing)]))
+
+        return self.remap_influences(columns, influence_names)
+
+    def normalize(self):
+        """
+        Returns these weights normalized so the weights of each vertex sum 1. Vertices without weights are kept
+        :return: SkinWeights
+        """
+
+        totals = self.row_sums()[self.rows()]
+        values = numpy.divide(
+            self._values, totals, out=self._values.astype(numpy.float64), where=totals > 0.0)
+
+        return type(self)(self._offsets, self._influence_indices, values, self._influence_names)
+
+    def prune(self, threshold=0.0, max_influences=None, normalize=True):
+        """
+        Discards the weights lower or equal than the given threshold and keeps only the largest weights of each vertex
+        The largest weight of each vertex is always kept, so no vertex is left without weights
+        :param threshold: float
+        :param max_influences: int or None, maximum number of influences per vertex. If None, it is not limited
+        :param normalize: bool, whether or not to normalize the pruned weights
+        :return: SkinWeights
+        """
+
+        if max_influences is not None and max_influences < 1:
+            raise ValueError('At least one influence per vertex must be kept')
+
+        rows = self.rows()
+        if not len(rows):
+            return self.normalize() if normalize else self.copy()
+
+        # Values are scattered into a (vertices x max influences per vertex) block, so the largest values of each row
+        # are selected with a partial sort per row instead of sorting all the values
+        columns = numpy.arange(len(rows)) - self._offsets[rows]
+        block = numpy.full((self.num_vertices, columns.max() + 1), -numpy.inf, dtype=self._values.dtype)
+        block[rows, columns] = self._values
+
+        keep = self._values > threshold
+        if max_influences is not None and max_influences < block.shape[1]:
+            largest = numpy.argpartition(-block, max_influences - 1, axis=1)[:, :max_influences]
+            selected = numpy.zeros(block.shape, dtype=bool)
+            selected[numpy.arange(self.num_vertices)[:, numpy.newaxis], largest] = True
+            keep &= selected[rows, columns]
+        keep |= columns == block.argmax(axis=1)[rows]
+
+        pruned = type(self)(
+            _get_offsets(rows[keep], self.num_vertices), self._influence_indices[keep], self._values[keep],
+            self._influence_names)
+
+        return pruned.normalize() if normalize else pruned
+
+
+def merge_influence_names(influence_names_lists):
+    """
+    Returns the union of the given influence names tables, keeping first appearance order
+    :param influence_names_lists: list(list(str))
+    :return: tuple(str)
+    """
+
+    influence_names = list()
+    found = set()
+    for names in influence_names_lists:
+        for name in names:
+            if name not in found:
+                found.add(name)
+                influence_names.append(name)
+
+    return tuple(influence_names)
+
+
+def _get_offsets(rows, num_vertices):
+    """
+    Internal function that returns the CSR row offsets of the given sorted rows
+    :param rows: numpy.array
+    :param num_vertices: int
+    :return: numpy.array
+    """
+
+    offsets = numpy.zeros(num_vertices + 1, dtype=SkinWeights.OFFSETS_DTYPE)
+    numpy.cumsum(numpy.bincount(rows, minlength=num_vertices), out=offsets[1:])
+
+    return offsets
+
+
+def _sum_duplicates(rows, influence_indices, values):
+    """
+    Internal function that sorts the given entries by row and influence and sums duplicated ones
+    :param rows: numpy.array
+    :param influence_indices: numpy.array
+    :param values: numpy.array
+    :return: tuple(numpy.array, numpy.array, numpy.array), sorted rows, influence indices and values
+    """
+
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    influence_indices = numpy.asarray(influence_indices, dtype=numpy.int64)
+    values = numpy.asarray(values, dtype=numpy.float64)
+    if not len(rows):
+        return rows, influence_indices, values
+
+    order = numpy.lexsort((influence_indices, rows))
+    rows, influence_indices, values = rows[order], influence_indices[order], values[order]
+    starts = numpy.flatnonzero(numpy.concatenate(
+        [[True], (rows[1:] != rows[:-1]) | (influence_indices[1:] != influence_indices[:-1])]))
+
+    return rows[starts], influence_indices[starts], numpy.add.reduceat(values, starts)
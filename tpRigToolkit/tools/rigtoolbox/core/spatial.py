@@ -0,0 +1,81 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic spatial queries
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+# SciPy is not available by default in DCCs. If not available, we fallback to chunked brute force queries
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Maximum number of distances computed at once by brute force queries
+CHUNK_SIZE = 4000000
+
+
+class PointIndex(object):
+    """
+    Nearest neighbour index built once over a point cloud and queried with batches of points
+    """
+
+    def __init__(self, positions):
+        self._positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+        self._tree = cKDTree(self._positions) if cKDTree is not None and len(self._positions) else None
+
+    def __len__(self):
+        return len(self._positions)
+
+    @property
+    def positions(self):
+        return self._positions
+
+    def query(self, points, k=1):
+        """
+        Returns the index of the closest points of the index for each one of the given points
+        :param points: list or numpy.array, (points x 3) positions to query
+        :param k: int, number of closest points to return for each point
+        :return: tuple(numpy.array, numpy.array), distances and indices of the closest points. If k is greater than 1,
+            (points x k) arrays sorted by distance are returned
+        """
+
+        points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        if not len(self._positions):
+            raise ValueError('Impossible to query an empty point index')
+        if k < 1 or k > len(self._positions):
+            raise ValueError('Impossible to query {} closest points of a {} points index'.format(
+                k, len(self._positions)))
+
+        if self._tree is not None:
+            distances, indices = self._tree.query(points, k=k)
+            return distances, indices.astype(numpy.int64)
+
+        shape = (len(points),) if k == 1 else (len(points), k)
+        distances = numpy.empty(shape, dtype=numpy.float64)
+        indices = numpy.empty(shape, dtype=numpy.int64)
+        chunk = max(1, CHUNK_SIZE // len(self._positions))
+        for start in range(0, len(points), chunk):
+            chunk_points = points[start:start + chunk]
+            squared_distances = (
+                (chunk_points * chunk_points).sum(axis=1)[:, numpy.newaxis] -
+                2.0 * chunk_points.dot(self._positions.T) +
+                (self._positions * self._positions).sum(axis=1)[numpy.newaxis, :])
+            rows = numpy.arange(len(chunk_points))
+            if k == 1:
+                chunk_indices = squared_distances.argmin(axis=1)
+                chunk_distances = squared_distances[rows, chunk_indices]
+            else:
+                chunk_indices = numpy.argpartition(squared_distances, k - 1, axis=1)[:, :k]
+                chunk_distances = squared_distances[rows[:, numpy.newaxis], chunk_indices]
+                order = numpy.argsort(chunk_distances, axis=1)
+                chunk_indices = chunk_indices[rows[:, numpy.newaxis], order]
+                chunk_distances = chunk_distances[rows[:, numpy.newaxis], order]
+            indices[start:start + chunk] = chunk_indices
+            distances[start:start + chunk] = numpy.sqrt(numpy.maximum(chunk_distances, 0.0))
+
+        return distances, indices
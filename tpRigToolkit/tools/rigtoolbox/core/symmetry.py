@@ -0,0 +1,169 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic functions to mirror skin weights
+Vertices correspondence is computed once with a nearest neighbour query over the mirrored positions and influences
+correspondence is computed from its side labels, so mirroring is a single gather and permute of the weights array
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+from tpRigToolkit.tools.rigtoolbox.core import spatial
+
+# Influence side labels (same values used by Maya joint side attribute)
+CENTER_SIDE = 0
+LEFT_SIDE = 1
+RIGHT_SIDE = 2
+NO_SIDE = 3
+
+
+def mirror_positions(positions, axis=0):
+    """
+    Returns given positions mirrored across the plane perpendicular to the given axis
+    :param positions: list or numpy.array, (vertices x 3) positions
+    :param axis: int, 0 for X (YZ plane), 1 for Y (XZ plane) and 2 for Z (XY plane)
+    :return: numpy.array
+    """
+
+    positions = numpy.array(positions, dtype=numpy.float64).reshape(-1, 3)
+    positions[:, axis] *= -1.0
+
+    return positions
+
+
+def symmetry_map(positions, axis=0, tolerance=0.001):
+    """
+    Returns the symmetric vertex of each one of the given vertices
+    :param positions: list or numpy.array, (vertices x 3) positions
+    :param axis: int, 0 for X (YZ plane), 1 for Y (XZ plane) and 2 for Z (XY plane)
+    :param tolerance: float, maximum distance between a mirrored vertex and its symmetric vertex
+    :return: numpy.array, index of the symmetric vertex of each vertex or -1 if it has no symmetric vertex
+    """
+
+    positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    if not len(positions):
+        return numpy.zeros(0, dtype=numpy.int64)
+
+    distances, indices = spatial.PointIndex(positions).query(mirror_positions(positions, axis=axis))
+    indices[distances > tolerance] = -1
+
+    return indices
+
+
+def side_vertices(positions, axis=0, positive_to_negative=True, tolerance=0.001):
+    """
+    Returns the vertices that receive weights when mirroring. Vertices lying on the mirror plane are not included
+    :param positions: list or numpy.array, (vertices x 3) positions
+    :param axis: int, 0 for X (YZ plane), 1 for Y (XZ plane) and 2 for Z (XY plane)
+    :param positive_to_negative: bool, whether to mirror from positive side to negative side or vice versa
+    :param tolerance: float, maximum distance to the mirror plane of the vertices lying on it
+    :return: numpy.array
+    """
+
+    coordinates = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)[:, axis]
+    if positive_to_negative:
+        return numpy.flatnonzero(coordinates < -tolerance)
+
+    return numpy.flatnonzero(coordinates > tolerance)
+
+
+def influence_mirror_permutation(sides, labels, names=None, positions=None, axis=0):
+    """
+    Returns the symmetric influence of each influence. Left and right influences with the same label are swapped and
+    the rest of influences are mapped to themselves
+    If several influences of the same side share a label (for example, all the phalanxes of a finger), they are
+    matched with the influence of the other side that is closest to its mirrored position
+    :param sides: list(int), side of each influence (CENTER_SIDE, LEFT_SIDE, RIGHT_SIDE or NO_SIDE)
+    :param labels: list, label of each influence. Labels must be hashable
+    :param names: list(str) or None, name of each influence. Only used to report errors
+    :param positions: list or numpy.array or None, (influences x 3) positions used to match influences that share
+        labels. If not given, shared labels raise a ValueError
+    :param axis: int, mirror axis used to match influences by position
+    :return: numpy.array, index of the symmetric influence of each influence
+    """
+
+    if len(sides) != len(labels):
+        raise ValueError('A label is expected for each influence side')
+
+    side_influences = dict()
+    for i, (side, label) in enumerate(zip(sides, labels)):
+        if side in (LEFT_SIDE, RIGHT_SIDE):
+            side_influences.setdefault((side, label), list()).append(i)
+
+    permutation = numpy.arange(len(sides), dtype=numpy.int64)
+    for (side, label), left_influences in side_influences.items():
+        if side != LEFT_SIDE:
+            continue
+        right_influences = side_influences.get((RIGHT_SIDE, label), None)
+        if not right_influences:
+            continue
+        if len(left_influences) == 1 and len(right_influences) == 1:
+            permutation[left_influences[0]] = right_influences[0]
+            permutation[right_influences[0]] = left_influences[0]
+            continue
+        if positions is None:
+            clashing = left_influences + right_influences
+            raise ValueError('Influences share the same side and label "{}": {}'.format(
+                label, [names[i] for i in clashing] if names else clashing))
+        for left_index, right_index in _match_closest(left_influences, right_influences, positions, axis):
+            permutation[left_index] = right_index
+            permutation[right_index] = left_index
+
+    return permutation
+
+
+def _match_closest(left_influences, right_influences, positions, axis=0):
+    """
+    Internal function that pairs each left influence with the right influence closest to its mirrored position
+    Pairs are assigned from the closest to the farthest one, so each influence is matched only once
+    :param left_influences: list(int)
+    :param right_influences: list(int)
+    :param positions: numpy.array, (influences x 3) positions
+    :param axis: int
+    :return: list(tuple(int, int))
+    """
+
+    positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    mirrored = mirror_positions(positions[left_influences], axis=axis)
+    distances = numpy.linalg.norm(
+        mirrored[:, numpy.newaxis, :] - positions[right_influences][numpy.newaxis, :, :], axis=-1)
+
+    pairs = list()
+    used_left = set()
+    used_right = set()
+    for flat_index in numpy.argsort(distances, axis=None):
+        left, right = numpy.unravel_index(flat_index, distances.shape)
+        if left in used_left or right in used_right:
+            continue
+        used_left.add(left)
+        used_right.add(right)
+        pairs.append((left_influences[left], right_influences[right]))
+
+    return pairs
+
+
+def mirror_weights(weights, vertex_map, influence_permutation, vertices):
+    """
+    Returns the mirrored weights of the given vertices
+    :param weights: numpy.array, (vertices x influences) weights of all the mesh vertices
+    :param vertex_map: numpy.array, symmetric vertex of each vertex (see symmetry_map)
+    :param influence_permutation: numpy.array, symmetric influence of each influence (see influence_mirror_permutation)
+    :param vertices: list or numpy.array, vertices to return mirrored weights of. All of them must have a symmetric
+        vertex
+    :return: numpy.array, (vertices x influences) mirrored weights
+    """
+
+    weights = numpy.asarray(weights)
+    source_vertices = numpy.asarray(vertex_map)[numpy.asarray(vertices, dtype=numpy.int64)]
+    if numpy.any(source_vertices < 0):
+        raise ValueError('Impossible to mirror weights of vertices without symmetric vertex')
+
+    # Weights are accumulated, so no weight is lost if several influences are mapped into the same one
+    mirrored_weights = numpy.zeros((len(source_vertices), weights.shape[1]), dtype=weights.dtype)
+    influence_permutation = numpy.asarray(influence_permutation, dtype=numpy.int64)
+    numpy.add.at(mirrored_weights.T, influence_permutation, weights[source_vertices].T)
+
+    return mirrored_weights
@@ -14,16 +14,17 @@ __email__ = "tpovedatd@gmail.com"
 
 import os
 import logging
+import threading
+from functools import partial
 
 from Qt.QtCore import Qt
 from Qt.QtWidgets import QSizePolicy, QToolButton, QMainWindow
 
-from tpDcc.managers import resources
 from tpDcc.libs.python import yamlio
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import window, toolset, progressbar, dock, message, buttons
 
-from tpRigToolkit.tools.rigtoolbox.core import consts
+from tpRigToolkit.tools.rigtoolbox.core import consts, commands, metrics
 from tpRigToolkit.tools.rigtoolbox.widgets import dock, library, base as base_widgets
 
 LOGGER = logging.getLogger(consts.TOOL_ID)
@@ -43,51 +44,77 @@ class RigToolboxToolset(toolset.ToolsetWidget, object):
         return help_event
 
     def contents(self):
-        dcc_name, dcc_version, _ = self.client.get_dcc_info()
-
-        self.client.load_plugins()
-
-        commands_datas = dict()
-        if dcc_name:
-            commands_path = os.path.join(
-                os.path.abspath(os.path.dirname(os.path.dirname(__file__))), 'dccs', dcc_name, 'commands')
-            if os.path.isdir(commands_path):
-                for command_file in os.listdir(commands_path):
-                    if not command_file.endswith('.yaml'):
-                        continue
-                    commands_category = os.path.splitext(command_file)[0]
-                    if commands_category in commands_datas:
-                        continue
-                    command_file_path = os.path.join(commands_path, command_file)
-                    try:
-                        commands_data = yamlio.read_file(command_file_path, maintain_order=True)
-                    except Exception as exc:
-                        LOGGER.error(
-                            'Error while reading commands data from "{}" : {}'.format(command_file_path, exc))
-                        continue
-                    commands_datas[commands_category] = commands_data
+        timer = metrics.PhaseTimer()
+
+        # DCC queries are done in a separate thread while commands definitions are loaded and widgets are created
+        dcc_info = dict()
+        dcc_thread = threading.Thread(target=self._query_dcc, args=(dcc_info, timer))
+        dcc_thread.daemon = True
+        dcc_thread.start()
+
+        all_commands_datas = dict()
+        dccs_path = os.path.join(os.path.abspath(os.path.dirname(os.path.dirname(__file__))), 'dccs')
+        with timer.phase('load_commands'):
+            for dcc_folder in os.listdir(dccs_path):
+                commands_path = os.path.join(dccs_path, dcc_folder, 'commands')
+                if not os.path.isdir(commands_path):
+                    continue
+                all_commands_datas[dcc_folder] = commands.load_commands_data(
+                    commands_path, read_fn=partial(yamlio.read_file, maintain_order=True))
+
+        with timer.phase('create_main_widget'):
+            self._rig_toolbox_widget = RigToolboxWidget(parent=self)
+
+        with timer.phase('wait_dcc_queries'):
+            dcc_thread.join()
+        dcc_name = dcc_info.get('dcc_name', None)
+        commands_datas = all_commands_datas.get(dcc_name, dict()) if dcc_name else dict()
 
         # Load widgets
-        self._rig_toolbox_widget = RigToolboxWidget(parent=self)
-        self._toolbox_widgets = list()
-        if not dcc_name:
-            from tpRigToolkit.tools.rigtoolbox.widgets import base
-            toolbox_widget = base.BaseRigToolBoxWidget(title='Hello World!', parent=self)
-            self._toolbox_widgets.append(toolbox_widget)
-
-        if self.client.is_maya():
-            from tpRigToolkit.tools.rigtoolbox.dccs import maya
-            self._toolbox_widgets = maya.get_toolbox_widgets(
-                client=self.client, commands_data=commands_datas, parent=self)
-        self._rig_toolbox_widget.load_widgets(self._toolbox_widgets, parent=self)
+        with timer.phase('create_toolbox_widgets'):
+            self._toolbox_widgets = list()
+            if not dcc_name:
+                from tpRigToolkit.tools.rigtoolbox.widgets import base
+                toolbox_widget = base.BaseRigToolBoxWidget(title='Hello World!', parent=self)
+                self._toolbox_widgets.append(toolbox_widget)
+
+            if self.client.is_maya():
+                from tpRigToolkit.tools.rigtoolbox.dccs import maya
+                self._toolbox_widgets = maya.get_toolbox_widgets(
+                    client=self.client, commands_data=commands_datas, parent=self)
+            self._rig_toolbox_widget.load_widgets(self._toolbox_widgets, parent=self)
 
         library.Command.startCommand.connect(self._rig_toolbox_widget._on_start_command)
-        library.Command.progressCommand.connect(self._rig_toolbox_widget._on_set_progress_command)
+        library.Command.add_progress_listener(self._rig_toolbox_widget._on_set_progress_command)
         library.Command.endCommand.connect(self._rig_toolbox_widget._on_end_command)
         # self.helpModeChanged.connect(rig_toolbox_widget.set_info_mode)
 
+        self._startup_timer = timer
+        LOGGER.debug('RigToolbox startup timings:\n{}'.format(timer.report()))
+
         return [self._rig_toolbox_widget]
 
+    def startup_timings(self):
+        """
+        Returns the duration of each phase of the toolset startup
+        :return: list(tuple(str, float, float)), list with the name, start offset and duration of each phase
+        """
+
+        timer = getattr(self, '_startup_timer', None)
+
+        return timer.phases() if timer else list()
+
+    def _query_dcc(self, dcc_info, timer):
+        try:
+            with timer.phase('get_dcc_info'):
+                dcc_name, dcc_version, _ = self.client.get_dcc_info()
+            dcc_info['dcc_name'] = dcc_name
+            dcc_info['dcc_version'] = dcc_version
+            with timer.phase('load_plugins'):
+                self.client.load_plugins()
+        except Exception as exc:
+            LOGGER.error('Error while querying DCC info: {}'.format(exc))
+
     def reload_theme(self, theme=None):
         super(RigToolboxToolset, self).reload_theme(theme)
 
@@ -121,6 +148,7 @@ class RigToolboxWidget(base.BaseWidget, object):
         self.main_layout.addWidget(self._progress)
 
     def load_widgets(self, widgets, parent=None):
+        first_dock_widget = None
         for w in widgets:
             if isinstance(w, base_widgets.BaseRigToolBoxWidget):
                 w.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -130,7 +158,7 @@ class RigToolboxWidget(base.BaseWidget, object):
                 info_button = QToolButton(parent=parent or self)
                 info_button.setCheckable(True)
                 info_button.setChecked(True)
-                info_button.setIcon(resources.icon('info', theme='color'))
+                info_button.setIcon(library.get_icon('info', theme='color'))
                 if hasattr(w, '_on_toggle_info'):
                     info_button.toggled.connect(w._on_toggle_info)
                 dock_widget.add_button(info_button)
@@ -140,6 +168,15 @@ class RigToolboxWidget(base.BaseWidget, object):
             dock_widget.setWidget(w)
             self._base_window.addDockWidget(Qt.TopDockWidgetArea, dock_widget)
 
+            # Docks are tabbed so lazy widgets contents are only built when their tab is shown
+            if first_dock_widget is None:
+                first_dock_widget = dock_widget
+            else:
+                self._base_window.tabifyDockWidget(first_dock_widget, dock_widget)
+
+        if first_dock_widget is not None:
+            first_dock_widget.raise_()
+
     def _on_start_command(self, command_name):
         library.Command.command = command_name
         self._progress.setFormat('Executing command: "{}"'.format(command_name))
@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic functions to operate with mesh topology
+Vertex adjacency is stored in CSR format: the neighbours of vertex i are neighbours[offsets[i]:offsets[i + 1]]
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import heapq
+
+import numpy
+
+
+def adjacency_from_polygons(polygon_counts, polygon_connects, num_vertices):
+    """
+    Builds vertex adjacency of a polygon mesh from its polygons description
+    :param polygon_counts: list or numpy.array, number of vertices of each polygon
+    :param polygon_connects: list or numpy.array, vertex indices of all polygons, one polygon after the other
+    :param num_vertices: int, total number of vertices of the mesh
+    :return: tuple(numpy.array, numpy.array), CSR offsets (num_vertices + 1 values) and neighbours arrays
+    """
+
+    polygon_counts = numpy.asarray(polygon_counts, dtype=numpy.int64)
+    polygon_connects = numpy.asarray(polygon_connects, dtype=numpy.int64)
+
+    # Each polygon vertex is connected with the next one, and the last one with the first one of the polygon
+    polygon_starts = numpy.repeat(numpy.cumsum(polygon_counts) - polygon_counts, polygon_counts)
+    face_vertex_ids = numpy.arange(len(polygon_connects)) - polygon_starts
+    next_ids = polygon_starts + (face_vertex_ids + 1) % numpy.repeat(polygon_counts, polygon_counts)
+    edges = numpy.stack([polygon_connects, polygon_connects[next_ids]], axis=1)
+    edges = numpy.concatenate([edges, edges[:, ::-1]])
+    edges = numpy.unique(edges[edges[:, 0] != edges[:, 1]], axis=0)
+
+    offsets = numpy.zeros(num_vertices + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(edges[:, 0], minlength=num_vertices), out=offsets[1:])
+
+    return offsets, edges[:, 1].copy()
+
+
+def adjacency_rows(offsets, neighbours, vertices):
+    """
+    Returns the adjacency of the given subset of vertices
+    :param offsets: numpy.array, CSR offsets of the mesh adjacency
+    :param neighbours: numpy.array, CSR neighbours of the mesh adjacency
+    :param vertices: list or numpy.array, vertex indices to retrieve adjacency of
+    :return: tuple(numpy.array, numpy.array), CSR offsets (len(vertices) + 1 values) and neighbours of the vertices
+    """
+
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+    neighbours = numpy.asarray(neighbours, dtype=numpy.int64)
+    vertices = numpy.asarray(vertices, dtype=numpy.int64)
+
+    counts = offsets[vertices + 1] - offsets[vertices]
+    sub_offsets = numpy.zeros(len(vertices) + 1, dtype=numpy.int64)
+    numpy.cumsum(counts, out=sub_offsets[1:])
+    positions = numpy.arange(sub_offsets[-1]) - numpy.repeat(sub_offsets[:-1], counts) + numpy.repeat(
+        offsets[vertices], counts)
+
+    return sub_offsets, neighbours[positions]
+
+
+def shortest_path(offsets, neighbours, start, end, positions=None):
+    """
+    Returns the shortest path between the given vertices
+    :param offsets: numpy.array, CSR offsets of the mesh adjacency
+    :param neighbours: numpy.array, CSR neighbours of the mesh adjacency
+    :param start: int, index of the start vertex
+    :param end: int, index of the end vertex
+    :param positions: numpy.array or None, (vertices x 3) positions. If given, edges are weighted by its length;
+        otherwise the path with less edges is returned
+    :return: list(int), vertex indices of the path, start and end vertices included. Empty if vertices are not connected
+    """
+
+    if positions is not None:
+        positions = numpy.asarray(positions, dtype=numpy.float64)
+
+    distances = {start: 0.0}
+    previous = dict()
+    visited = set()
+    heap = [(0.0, start)]
+    while heap:
+        distance, vertex = heapq.heappop(heap)
+        if vertex in visited:
+            continue
+        if vertex == end:
+            break
+        visited.add(vertex)
+        vertex_neighbours = neighbours[offsets[vertex]:offsets[vertex + 1]]
+        if positions is None:
+            lengths = numpy.ones(len(vertex_neighbours))
+        else:
+            lengths = numpy.linalg.norm(positions[vertex_neighbours] - positions[vertex], axis=1)
+        for neighbour, length in zip(vertex_neighbours.tolist(), lengths.tolist()):
+            new_distance = distance + length
+            if neighbour not in distances or new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                previous[neighbour] = vertex
+                heapq.heappush(heap, (new_distance, neighbour))
+
+    if end not in distances:
+        return list()
+
+    path = [end]
+    while path[-1] != start:
+        path.append(previous[path[-1]])
+
+    return path[::-1]
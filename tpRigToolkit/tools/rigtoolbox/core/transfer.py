@@ -0,0 +1,133 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains DCC agnostic functions to transfer skin weights between meshes using closest point on surface
+A spatial index is built once over the source surface triangles and each target vertex is sampled as a barycentric
+combination of the vertices of its closest source triangle
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+from tpRigToolkit.tools.rigtoolbox.core import spatial, skinmath
+
+# Maximum number of points sampled at once
+CHUNK_SIZE = 65536
+
+
+def closest_barycentric(points, a, b, c):
+    """
+    Returns the barycentric coordinates of the closest point of each triangle to each point
+    :param points: numpy.array, (..., 3) points
+    :param a: numpy.array, (..., 3) first vertex of each triangle
+    :param b: numpy.array, (..., 3) second vertex of each triangle
+    :param c: numpy.array, (..., 3) third vertex of each triangle
+    :return: numpy.array, (..., 3) barycentric coordinates
+    """
+
+    ab = b - a
+    ac = c - a
+    ap = points - a
+    bp = points - b
+    cp = points - c
+    d1 = (ab * ap).sum(axis=-1)
+    d2 = (ac * ap).sum(axis=-1)
+    d3 = (ab * bp).sum(axis=-1)
+    d4 = (ac * bp).sum(axis=-1)
+    d5 = (ab * cp).sum(axis=-1)
+    d6 = (ac * cp).sum(axis=-1)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    def _divide(numerator, denominator):
+        return numpy.divide(
+            numerator, denominator, out=numpy.zeros_like(numerator), where=numpy.abs(denominator) > 1e-12)
+
+    # Point projects inside the triangle
+    total = va + vb + vc
+    v = _divide(vb, total)
+    w = _divide(vc, total)
+    coordinates = numpy.stack([1.0 - v - w, v, w], axis=-1)
+
+    # Voronoi regions are checked in reverse order, so the first matching region overrides the rest
+    edge_bc = (va <= 0.0) & (d4 - d3 >= 0.0) & (d5 - d6 >= 0.0)
+    w = _divide(d4 - d3, (d4 - d3) + (d5 - d6))
+    coordinates[edge_bc] = numpy.stack([numpy.zeros_like(w), 1.0 - w, w], axis=-1)[edge_bc]
+    edge_ac = (vb <= 0.0) & (d2 >= 0.0) & (d6 <= 0.0)
+    w = _divide(d2, d2 - d6)
+    coordinates[edge_ac] = numpy.stack([1.0 - w, numpy.zeros_like(w), w], axis=-1)[edge_ac]
+    coordinates[(d6 >= 0.0) & (d5 <= d6)] = (0.0, 0.0, 1.0)
+    edge_ab = (vc <= 0.0) & (d1 >= 0.0) & (d3 <= 0.0)
+    v = _divide(d1, d1 - d3)
+    coordinates[edge_ab] = numpy.stack([1.0 - v, v, numpy.zeros_like(v)], axis=-1)[edge_ab]
+    coordinates[(d3 >= 0.0) & (d4 <= d3)] = (0.0, 1.0, 0.0)
+    coordinates[(d1 <= 0.0) & (d2 <= 0.0)] = (1.0, 0.0, 0.0)
+
+    return coordinates
+
+
+class SurfaceSampler(object):
+    """
+    Closest point on surface queries over a triangle mesh
+    Candidate triangles are the ones whose centroids are closest to the queried point, so the number of candidates
+    should be increased for meshes with very uneven triangle sizes
+    """
+
+    def __init__(self, positions, triangles, candidates=8):
+        self._positions = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+        self._triangles = numpy.asarray(triangles, dtype=numpy.int64).reshape(-1, 3)
+        if not len(self._triangles):
+            raise ValueError('Impossible to sample a surface without triangles')
+        self._index = spatial.PointIndex(self._positions[self._triangles].mean(axis=1))
+        self._candidates = max(1, min(candidates, len(self._triangles)))
+
+    def sample(self, points):
+        """
+        Returns the closest surface point of each one of the given points
+        :param points: list or numpy.array, (points x 3) positions
+        :return: tuple(numpy.array, numpy.array, numpy.array), (points x 3) vertices of the closest triangle of each
+            point, (points x 3) barycentric coordinates of the closest point and distance to the closest point
+        """
+
+        points = numpy.asarray(points, dtype=numpy.float64).reshape(-1, 3)
+        vertices = numpy.empty((len(points), 3), dtype=numpy.int64)
+        coordinates = numpy.empty((len(points), 3), dtype=numpy.float64)
+        distances = numpy.empty(len(points), dtype=numpy.float64)
+
+        for start in range(0, len(points), CHUNK_SIZE):
+            chunk_points = points[start:start + CHUNK_SIZE]
+            _, candidates = self._index.query(chunk_points, k=self._candidates)
+            candidates = candidates.reshape(len(chunk_points), self._candidates)
+            corners = self._positions[self._triangles[candidates]]
+            candidate_points = chunk_points[:, numpy.newaxis, :]
+            candidate_coordinates = closest_barycentric(
+                candidate_points, corners[:, :, 0], corners[:, :, 1], corners[:, :, 2])
+            closest_points = numpy.einsum('nkc,nkcd->nkd', candidate_coordinates, corners)
+            candidate_distances = numpy.linalg.norm(closest_points - candidate_points, axis=-1)
+
+            rows = numpy.arange(len(chunk_points))
+            best = candidate_distances.argmin(axis=1)
+            vertices[start:start + CHUNK_SIZE] = self._triangles[candidates[rows, best]]
+            coordinates[start:start + CHUNK_SIZE] = candidate_coordinates[rows, best]
+            distances[start:start + CHUNK_SIZE] = candidate_distances[rows, best]
+
+        return vertices, coordinates, distances
+
+
+def interpolate_weights(weights, vertices, coordinates):
+    """
+    Returns the normalized weights of the given barycentric samples
+    :param weights: numpy.array, (vertices x influences) weights of the sampled mesh
+    :param vertices: numpy.array, (samples x 3) triangle vertices of each sample
+    :param coordinates: numpy.array, (samples x 3) barycentric coordinates of each sample
+    :return: numpy.array, (samples x influences) weights
+    """
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    vertices = numpy.asarray(vertices, dtype=numpy.int64)
+    sampled_weights = numpy.einsum('nc,nci->ni', numpy.asarray(coordinates, dtype=numpy.float64), weights[vertices])
+
+    return skinmath.normalize_weights(sampled_weights)
@@ -0,0 +1,106 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to write and read skin weights files
+Files use the same layout as the binary wire format (see core.wireformat): sparse CSR rows with an influence names
+table and optional float16 quantization. Arrays are written in chunks and files are loaded with numpy.memmap, so
+weights are only paged in from disk when accessed.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import json
+
+import numpy
+
+from tpRigToolkit.tools.rigtoolbox.core import wireformat
+
+EXTENSION = '.skw'
+INDEX_FILE = 'weights.json'
+
+# Number of array elements written to disk at once
+CHUNK_SIZE = 1 << 20
+
+
+def get_weights_file_name(mesh_name):
+    """
+    Returns the name of the file that stores the weights of the given mesh
+    :param mesh_name: str
+    :return: str
+    """
+
+    return '{}{}'.format(re.sub(r'[|:]', '_', mesh_name.lstrip('|')), EXTENSION)
+
+
+def write_weights(file_path, vertex_indices, offsets, influence_indices, values, influence_names, dtype=numpy.float32):
+    """
+    Writes given sparse weights into a file
+    :param file_path: str
+    :param vertex_indices: numpy.array, vertex index of each row
+    :param offsets: numpy.array, CSR row offsets (rows + 1 values)
+    :param influence_indices: numpy.array, influence index of each value
+    :param values: numpy.array, weight values
+    :param influence_names: list(str), names of the influences, sorted by influence index
+    :param dtype: numpy.dtype, type used to store weight values (float16, float32 or float64)
+    """
+
+    dtype = numpy.dtype(dtype)
+    if dtype.itemsize not in wireformat.DTYPES or dtype.kind != 'f':
+        raise ValueError('Invalid weights type: {}'.format(dtype))
+    if len(offsets) != len(vertex_indices) + 1 or len(influence_indices) != len(values):
+        raise ValueError('Invalid sparse weights arrays')
+
+    names = '\n'.join(influence_names).encode('utf-8')
+    header = wireformat.HEADER.pack(
+        wireformat.MAGIC, wireformat.VERSION, dtype.itemsize, len(vertex_indices), len(values), len(names))
+
+    with open(file_path, 'wb') as weights_file:
+        weights_file.write(header + wireformat.padding(len(header)))
+        weights_file.write(names + wireformat.padding(len(names)))
+        for array, array_dtype in (
+                (vertex_indices, '<i4'), (offsets, '<i4'), (influence_indices, '<i4'),
+                (values, dtype.newbyteorder('<'))):
+            array = numpy.asarray(array)
+            for start in range(0, len(array), CHUNK_SIZE):
+                chunk = numpy.ascontiguousarray(array[start:start + CHUNK_SIZE], dtype=array_dtype)
+                weights_file.write(chunk.tobytes())
+            weights_file.write(wireformat.padding(len(array) * numpy.dtype(array_dtype).itemsize))
+
+
+def read_weights(file_path):
+    """
+    Loads a skin weights file. File is memory mapped, so arrays are read from disk when accessed
+    :param file_path: str
+    :return: dict, dictionary with vertex_indices, offsets, influence_indices, values and influence_names keys
+    """
+
+    return wireformat.unpack_weights(numpy.memmap(file_path, dtype=numpy.uint8, mode='r'))
+
+
+def write_index(directory, meshes_data):
+    """
+    Writes the index file of a weights directory
+    :param directory: str
+    :param meshes_data: dict(str, dict), dictionary that maps each mesh name with its weights file data
+    """
+
+    with open(os.path.join(directory, INDEX_FILE), 'w') as index_file:
+        json.dump(meshes_data, index_file, indent=4, sort_keys=True)
+
+
+def read_index(directory):
+    """
+    Reads the index file of a weights directory
+    :param directory: str
+    :return: dict(str, dict), dictionary that maps each mesh name with its weights file data
+    """
+
+    index_path = os.path.join(directory, INDEX_FILE)
+    if not os.path.isfile(index_path):
+        return dict()
+
+    with open(index_path, 'r') as index_file:
+        return json.load(index_file)
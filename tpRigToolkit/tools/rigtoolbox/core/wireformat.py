@@ -0,0 +1,124 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the compact binary format used to send skin weights between rig toolbox client and server
+Weights are stored in CSR format (one row per vertex) after a fixed size header:
+    header | influence names | vertex indices | row offsets | influence indices | weight values
+Each section is padded to 8 bytes, so arrays can be read with numpy.frombuffer without copying them
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import base64
+import struct
+
+import numpy
+
+MAGIC = b'TPSW'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+ALIGNMENT = 8
+
+DTYPES = {
+    2: numpy.float16,
+    4: numpy.float32,
+    8: numpy.float64
+}
+
+
+def padding(size):
+    """
+    Returns the bytes needed to align a section of the given size
+    :param size: int
+    :return: bytes
+    """
+
+    return b'\0' * ((ALIGNMENT - size % ALIGNMENT) % ALIGNMENT)
+
+
+def pack_weights(vertex_indices, offsets, influence_indices, values, influence_names, dtype=numpy.float32):
+    """
+    Packs given sparse weights into a single bytes buffer
+    :param vertex_indices: numpy.array, vertex index of each row
+    :param offsets: numpy.array, CSR row offsets (rows + 1 values)
+    :param influence_indices: numpy.array, influence index of each value
+    :param values: numpy.array, weight values
+    :param influence_names: list(str), names of the influences, sorted by influence index
+    :param dtype: numpy.dtype, type used to store weight values (float16, float32 or float64)
+    :return: bytes
+    """
+
+    dtype = numpy.dtype(dtype)
+    if dtype.itemsize not in DTYPES or dtype.kind != 'f':
+        raise ValueError('Invalid weights type: {}'.format(dtype))
+
+    vertex_indices = numpy.ascontiguousarray(vertex_indices, dtype='<i4')
+    offsets = numpy.ascontiguousarray(offsets, dtype='<i4')
+    influence_indices = numpy.ascontiguousarray(influence_indices, dtype='<i4')
+    values = numpy.ascontiguousarray(values, dtype=dtype.newbyteorder('<'))
+    if len(offsets) != len(vertex_indices) + 1 or len(influence_indices) != len(values):
+        raise ValueError('Invalid sparse weights arrays')
+
+    names = '\n'.join(influence_names).encode('utf-8')
+    header = HEADER.pack(MAGIC, VERSION, dtype.itemsize, len(vertex_indices), len(values), len(names))
+
+    chunks = [header, padding(len(header)), names, padding(len(names))]
+    for array in (vertex_indices, offsets, influence_indices, values):
+        chunks.append(array.tobytes())
+        chunks.append(padding(array.nbytes))
+
+    return b''.join(chunks)
+
+
+def unpack_weights(data):
+    """
+    Unpacks given bytes buffer. Arrays are views of the given buffer, so no data is copied
+    :param data: bytes or buffer
+    :return: dict, dictionary with vertex_indices, offsets, influence_indices, values and influence_names keys
+    """
+
+    magic, version, itemsize, num_rows, num_values, names_size = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError('Data is not a valid skin weights buffer')
+    if version > VERSION:
+        raise ValueError('Skin weights buffer version {} is not supported'.format(version))
+
+    position = HEADER.size + len(padding(HEADER.size))
+    names = bytes(data[position:position + names_size]).decode('utf-8')
+    position += names_size + len(padding(names_size))
+
+    arrays = list()
+    for dtype, count in (('<i4', num_rows), ('<i4', num_rows + 1), ('<i4', num_values),
+                         (numpy.dtype(DTYPES[itemsize]).newbyteorder('<'), num_values)):
+        array = numpy.frombuffer(data, dtype=dtype, count=count, offset=position)
+        arrays.append(array)
+        position += array.nbytes + len(padding(array.nbytes))
+
+    return {
+        'vertex_indices': arrays[0],
+        'offsets': arrays[1],
+        'influence_indices': arrays[2],
+        'values': arrays[3],
+        'influence_names': names.split('\n') if names else list()
+    }
+
+
+def encode(data):
+    """
+    Encodes given binary buffer so it can be sent inside a command reply
+    :param data: bytes
+    :return: str
+    """
+
+    return base64.b64encode(data).decode('ascii')
+
+
+def decode(data):
+    """
+    Decodes a buffer encoded with encode function
+    :param data: str
+    :return: bytes
+    """
+
+    return base64.b64decode(data)
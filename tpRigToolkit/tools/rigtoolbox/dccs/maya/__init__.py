@@ -9,6 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 import logging
 import traceback
+from functools import partial
 
 from tpRigToolkit.tools.rigtoolbox.core import consts
 
@@ -16,62 +17,89 @@ LOGGER = logging.getLogger(consts.TOOL_ID)
 
 
 def get_toolbox_widgets(client, commands_data, parent=None):
+    """
+    Returns the widgets of the RigToolbox for Maya
+    Widgets are placeholders whose contents are built (and external tool servers started) when they are first shown
+    :param client: RigToolboxClient
+    :param commands_data: dict
+    :param parent: QWidget
+    :return: list(LazyRigToolBoxWidget)
+    """
+
+    from tpRigToolkit.tools.rigtoolbox.widgets import base
 
     all_widgets = list()
+
+    general_commands_data = commands_data.get('general', dict())
+    if commands_data:
+        all_widgets.append(base.LazyRigToolBoxWidget(
+            'General', partial(_create_general_widget, client, general_commands_data), parent=parent))
+    else:
+        LOGGER.warning('General widget not loaded because not commands data found!')
+
+    joint_commmand_data = commands_data.get('joint', dict())
+    if joint_commmand_data:
+        all_widgets.append(base.LazyRigToolBoxWidget(
+            'Joint', partial(_create_joint_widget, client, joint_commmand_data), parent=parent))
+
+    skin_commmand_data = commands_data.get('skin', dict())
+    all_widgets.append(base.LazyRigToolBoxWidget(
+        'Skinning', partial(_create_skinning_widget, client, skin_commmand_data), parent=parent))
+    all_widgets.append(base.LazyRigToolBoxWidget('Rename', partial(_create_rename_widget, client), parent=parent))
+    all_widgets.append(base.LazyRigToolBoxWidget('Controls', partial(_create_control_widget, client), parent=parent))
+    all_widgets.append(base.LazyRigToolBoxWidget('SymMesh', partial(_create_symmesh_widget, client), parent=parent))
+
+    return all_widgets
+
+
+def _create_general_widget(client, commands_data):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import general
-        general_commands_data = commands_data.get('general', dict())
-        if commands_data:
-            general_widget = general.GeneralWidget(commands_data=general_commands_data, client=client, parent=parent)
-            all_widgets.append(general_widget)
-        else:
-            LOGGER.warning('General widget not loaded because not commands data found!')
+        return general.GeneralWidget(commands_data=commands_data, client=client)
     except Exception:
         LOGGER.exception('Error while creating general widget: "{}"'.format(traceback.format_exc()))
 
+
+def _create_joint_widget(client, commands_data):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import joint
-        joint_commmand_data = commands_data.get('joint', dict())
-        if joint_commmand_data:
-            joint_widget = joint.JointWidget(commands_data=joint_commmand_data, client=client, parent=parent)
-            all_widgets.append(joint_widget)
+        return joint.JointWidget(commands_data=commands_data, client=client)
     except Exception:
         LOGGER.exception('Error while creating joint widget: "{}"'.format(traceback.format_exc()))
 
+
+def _create_skinning_widget(client, commands_data):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import skin
-        skin_commmand_data = commands_data.get('skin', dict())
-        skinning_widget = skin.SkinningWidget(commands_data=skin_commmand_data, client=client, parent=parent)
+        skinning_widget = skin.SkinningWidget(commands_data=commands_data, client=client)
         skinning_widget.refresh()
-        all_widgets.append(skinning_widget)
+        return skinning_widget
     except Exception:
         LOGGER.exception('Error while creating skinning widget: "{}"'.format(traceback.format_exc()))
 
+
+def _create_rename_widget(client):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import rename
         client.setup_renamer_client()
-        rename_widget = rename.RenameWidget()
-        rename_widget.setParent(parent)
-        all_widgets.append(rename_widget)
+        return rename.RenameWidget()
     except Exception:
         LOGGER.exception('Error while creating renamer widget: "{}"'.format(traceback.format_exc()))
 
+
+def _create_control_widget(client):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import control
         client.setup_control_rig_client()
-        control_widget = control.ControlWidget()
-        control_widget.setParent(parent)
-        all_widgets.append(control_widget)
+        return control.ControlWidget()
     except Exception:
         LOGGER.exception('Error while creating control widget: "{}"'.format(traceback.format_exc()))
 
+
+def _create_symmesh_widget(client):
     try:
         from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import symmesh
         client.setup_symmesh_client()
-        symmesh_widget = symmesh.SymmeshWidget()
-        symmesh_widget.setParent(parent)
-        all_widgets.append(symmesh_widget)
+        return symmesh.SymmeshWidget()
     except Exception:
         LOGGER.exception('Error while creating symmesh widget: "{}"'.format(traceback.format_exc()))
-
-    return all_widgets
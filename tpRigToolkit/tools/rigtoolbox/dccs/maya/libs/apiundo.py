@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to register Maya API modifications into Maya undo queue
+Modifications done through Maya API (such as MFnSkinCluster.setWeights) are not undoable by default. This module
+stores undo/redo callables that are consumed by tpApiUndo plugin command, so those modifications become part of the
+current undo chunk.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import logging
+
+import maya.cmds
+
+LOGGER = logging.getLogger('tpRigToolkit-tools-rigtoolbox')
+
+COMMAND_NAME = 'tpApiUndo'
+
+# List of (undo, redo) callables waiting to be consumed by tpApiUndo command
+_PENDING = list()
+
+
+def is_available():
+    """
+    Returns whether or not tpApiUndo plugin command is loaded
+    :return: bool
+    """
+
+    return hasattr(maya.cmds, COMMAND_NAME)
+
+
+def commit(undo, redo):
+    """
+    Executes given redo function and registers given undo function into Maya undo queue
+    If tpApiUndo plugin command is not available, modification is executed but it will not be undoable
+    :param undo: callable, function that reverts the modification
+    :param redo: callable, function that applies the modification
+    :return: bool, True if the modification was registered into Maya undo queue; False otherwise
+    """
+
+    if not is_available():
+        LOGGER.warning('{} command is not loaded. Modification will not be undoable!'.format(COMMAND_NAME))
+        redo()
+        return False
+
+    _PENDING.append((undo, redo))
+    try:
+        getattr(maya.cmds, COMMAND_NAME)()
+    finally:
+        # Make sure that a failing command does not leave its callables queued for the next one
+        if _PENDING and _PENDING[-1][1] is redo:
+            _PENDING.pop()
+
+    return True
+
+
+def pop_pending():
+    """
+    Returns and removes the last (undo, redo) callables pair registered. Used by tpApiUndo plugin command
+    :return: tuple(callable, callable) or None
+    """
+
+    return _PENDING.pop() if _PENDING else None
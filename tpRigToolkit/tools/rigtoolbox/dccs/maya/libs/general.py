@@ -8,6 +8,8 @@ Module that contains library with general functions
 from __future__ import print_function, division, absolute_import
 
 import re
+import logging
+from functools import partial
 
 import maya.cmds
 import maya.mel
@@ -15,13 +17,25 @@ import maya.mel
 from tpDcc import dcc
 from tpDcc.managers import tools
 from tpDcc.libs.python import python
-from tpDcc.dccs.maya.core import decorators, transform as xform_utils, curve as curve_utils
+from tpDcc.dccs.maya.core import transform as xform_utils, curve as curve_utils
 
 from tpRigToolkit.tools.rigtoolbox.widgets import library
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import transaction, transformapi
 
+LOGGER = logging.getLogger('tpRigToolkit-tools-rigtoolbox')
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+# NumPy is not available by default in all Maya versions. If not available, we fallback to constraints
+try:
+    import numpy
+    from tpRigToolkit.tools.rigtoolbox.core import matrixmath
+except ImportError as exc:
+    LOGGER.info('Vectorized transform functions are not available: {}'.format(exc))
+    numpy = None
+    matrixmath = None
+
+
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def delete_history(transforms=None):
     """
     Delete history of selected transforms
@@ -34,24 +48,13 @@ def delete_history(transforms=None):
         out_dict['msg'] = 'No nodes to delete history of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Deleting history: {}'.format(node))
-        try:
-            dcc.delete_history(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to delete history in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _run_batched(
+        transforms, partial(maya.cmds.delete, constructionHistory=True), dcc.delete_history, out_dict,
+        'delete history')
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def freeze_transforms(transforms=None):
     """
     Freeze selected transforms
@@ -64,24 +67,14 @@ def freeze_transforms(transforms=None):
         out_dict['msg'] = 'No transforms to freeze transforms of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
+    return _run_batched(
+        transforms, partial(
+            maya.cmds.makeIdentity, apply=True, translate=True, rotate=True, scale=True, normal=False,
+            preserveNormals=True), dcc.freeze_transforms, out_dict, 'freeze transforms')
 
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Freezing transforms: {}'.format(node))
-        try:
-            dcc.freeze_transforms(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to freeze transforms in node: "{}" : {}'.format(node, exc)
-            return out_dict
 
-    out_dict['success'] = True
-
-    return out_dict
-
-
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def move_pivot_to_zero(transforms=None):
     """
     Moves selected nodes pivots to zero (0, 0, 0 in the world)
@@ -94,10 +87,10 @@ def move_pivot_to_zero(transforms=None):
         out_dict['msg'] = 'No transforms to move pivot to zero of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
+    progress = library.ProgressReporter(len(transforms))
 
     for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Moving pivot to zero: {}'.format(node))
+        progress.update(i + 1, 'Moving pivot to zero: {}', node)
         try:
             dcc.move_pivot_to_zero(node)
             out_dict['result'].append(node)
@@ -110,8 +103,8 @@ def move_pivot_to_zero(transforms=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def lock_all_transforms(transforms=None):
     """
     Locks all the transform channels of the given transforms nodes
@@ -124,26 +117,11 @@ def lock_all_transforms(transforms=None):
         out_dict['msg'] = 'No transforms to lock all transform channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
+    return _set_transforms_locked(transforms, transformapi.TRANSFORM_ATTRIBUTES, True, out_dict)
 
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Locking all transforms: {}'.format(node))
-        try:
-            dcc.lock_translate_attributes(node)
-            dcc.lock_rotate_attributes(node)
-            dcc.lock_scale_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to lock all transforms for node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
 
-    return out_dict
-
-
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def lock_translation(transforms=None):
     """
     Locks all translation channels of the given transforms nodes
@@ -156,24 +134,11 @@ def lock_translation(transforms=None):
         out_dict['msg'] = 'No transforms to lock all translation channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Locking translation channels: {}'.format(node))
-        try:
-            dcc.lock_translate_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to lock translate channels in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.TRANSLATE_ATTRIBUTES, True, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def lock_rotation(transforms=None):
     """
     Locks all rotation channels of the given transforms nodes
@@ -186,24 +151,11 @@ def lock_rotation(transforms=None):
         out_dict['msg'] = 'No transforms to lock all rotation channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
+    return _set_transforms_locked(transforms, transformapi.ROTATE_ATTRIBUTES, True, out_dict)
 
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Locking rotation channels: {}'.format(node))
-        try:
-            dcc.lock_rotate_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to lock rotations channel in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
 
-
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def lock_scale(transforms=None):
     """
     Locks all scale channels of the given transforms nodes
@@ -216,24 +168,11 @@ def lock_scale(transforms=None):
         out_dict['msg'] = 'No transforms to lock all scale channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Locking scale channels: {}'.format(node))
-        try:
-            dcc.lock_scale_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to lock scale channels in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.SCALE_ATTRIBUTES, True, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def lock_visibility(transforms=None):
     """
     Locks visibility channel of the given transforms nodes
@@ -246,24 +185,11 @@ def lock_visibility(transforms=None):
         out_dict['msg'] = 'No transforms to lock all scale channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Locking visibility channel: {}'.format(node))
-        try:
-            dcc.lock_visibility_attribute(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to lock visibility channel in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.VISIBILITY_ATTRIBUTES, True, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def unlock_all_transforms(transforms=None):
     """
     Locks all the transform channels of the given transforms nodes
@@ -276,26 +202,11 @@ def unlock_all_transforms(transforms=None):
         out_dict['msg'] = 'No transforms to unlock all transform channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Unlocking all transforms: {}'.format(node))
-        try:
-            dcc.unlock_translate_attributes(node)
-            dcc.unlock_rotate_attributes(node)
-            dcc.unlock_scale_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to unlock all transforms for node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.TRANSFORM_ATTRIBUTES, False, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def unlock_translation(transforms=None):
     """
     Locks all translation channels of the given transforms nodes
@@ -308,24 +219,11 @@ def unlock_translation(transforms=None):
         out_dict['msg'] = 'No transforms to unlock all translation channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Unlocking translation channels: {}'.format(node))
-        try:
-            dcc.unlock_translate_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to unlock translate channels in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.TRANSLATE_ATTRIBUTES, False, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def unlock_rotation(transforms=None):
     """
     Locks all rotation channels of the given transforms nodes
@@ -338,24 +236,11 @@ def unlock_rotation(transforms=None):
         out_dict['msg'] = 'No transforms to unlock all rotation channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Unlocking rotation channels: {}'.format(node))
-        try:
-            dcc.unlock_rotate_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to unlock rotations channel in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
+    return _set_transforms_locked(transforms, transformapi.ROTATE_ATTRIBUTES, False, out_dict)
 
-    return out_dict
 
-
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def unlock_scale(transforms=None):
     """
     Locks all scale channels of the given transforms nodes
@@ -368,24 +253,11 @@ def unlock_scale(transforms=None):
         out_dict['msg'] = 'No transforms to unlock all scale channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
-
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Unlocking scale channels: {}'.format(node))
-        try:
-            dcc.unlock_scale_attributes(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to unlock scale channels in node: "{}" : {}'.format(node, exc)
-            return out_dict
-
-    out_dict['success'] = True
-
-    return out_dict
+    return _set_transforms_locked(transforms, transformapi.SCALE_ATTRIBUTES, False, out_dict)
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def unlock_visibility(transforms=None):
     """
     Locks visibility channel of the given transforms nodes
@@ -398,24 +270,34 @@ def unlock_visibility(transforms=None):
         out_dict['msg'] = 'No transforms to unlock all scale channels of. Select at least one.'
         return out_dict
 
-    percentage = 100.0 / len(transforms)
+    return _set_transforms_locked(transforms, transformapi.VISIBILITY_ATTRIBUTES, False, out_dict)
 
-    for i, node in enumerate(transforms):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Unlocking scale channels: {}'.format(node))
-        try:
-            dcc.unlock_visibility_attribute(node)
-            out_dict['result'].append(node)
-        except Exception as exc:
-            out_dict['msg'] = 'Was not possible to unlock visibility channel in node: "{}" : {}'.format(node, exc)
-            return out_dict
 
-    out_dict['success'] = True
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def set_transforms_locked(transforms=None, attributes=None, lock=True):
+    """
+    Locks or unlocks the given attributes of all the given transforms nodes in a single step
+    :param transforms: list(str) or None, nodes to lock attributes of. If not given, selected transforms are used
+    :param attributes: list(str) or None, attributes to lock. If not given, all transform attributes are used
+    :param lock: bool
+    :return: dict, result contains the modified nodes and status contains whether or not each node was modified
+    """
 
-    return out_dict
+    out_dict = {'success': False, 'result': list()}
+
+    transforms = python.force_list(transforms or dcc.selected_nodes_of_type(node_type='transform') or list())
+    if not transforms:
+        out_dict['msg'] = 'No transforms to {} attributes of. Select at least one.'.format('lock' if lock else 'unlock')
+        return out_dict
 
+    attributes = python.force_list(attributes or transformapi.TRANSFORM_ATTRIBUTES)
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+    return _set_transforms_locked(transforms, attributes, lock, out_dict)
+
+
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def match_transform(source_transform=None, target_transform=None):
     """
     Matches all the transforms of the source node to the transforms of the given target node(s)
@@ -435,29 +317,26 @@ def match_transform(source_transform=None, target_transform=None):
     source_transform = python.force_list(source_transform)
     target_transform = python.force_list(target_transform)
 
-    percentage = 100.0 / len(source_transform)
-
-    for i, source in enumerate(source_transform):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Matching transforms: {}'.format(source))
+    if matrixmath:
         try:
-            maya.cmds.delete(maya.cmds.parentConstraint(target_transform, source, maintainOffset=False))
-            maya.cmds.delete(maya.cmds.scaleConstraint(target_transform, source, maintainOffset=False))
-
-            # For joints, we store now rotation data in jointOrient attribute
-            if dcc.node_type(source) == 'joint':
-                for axis in 'XYZ':
-                    joint_orient_attr = 'jointOrient{}'.format(axis)
-                    joint_rotation_attr = 'rotate{}'.format(axis)
-                    dcc.set_attribute_value(source, joint_orient_attr, 0.0)
-                    joint_rotation = dcc.get_attribute_value(source, joint_rotation_attr)
-                    dcc.set_attribute_value(source, joint_orient_attr, joint_rotation)
-                    dcc.set_attribute_value(source, joint_rotation_attr, 0.0)
-
-            out_dict['result'].append(source)
+            _match_transforms(source_transform, target_transform)
+            out_dict['result'].extend(source_transform)
         except Exception as exc:
             out_dict['msg'] = 'Was not possible to match node "{}" transforms to "{}" : {}'.format(
                 source_transform, target_transform, exc)
             return out_dict
+    else:
+        progress = library.ProgressReporter(len(source_transform))
+
+        for i, source in enumerate(source_transform):
+            progress.update(i + 1, 'Matching transforms: {}', source)
+            try:
+                _constraint_match_transform(source, target_transform)
+                out_dict['result'].append(source)
+            except Exception as exc:
+                out_dict['msg'] = 'Was not possible to match node "{}" transforms to "{}" : {}'.format(
+                    source_transform, target_transform, exc)
+                return out_dict
 
     matched_nodes = out_dict.get('result', None)
     if matched_nodes:
@@ -468,8 +347,8 @@ def match_transform(source_transform=None, target_transform=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def match_translation(source_transform=None, target_transform=None):
     """
     Matches translation of the source node to the translation of the given target node(s)
@@ -489,10 +368,10 @@ def match_translation(source_transform=None, target_transform=None):
     source_transform = python.force_list(source_transform)
     target_transform = python.force_list(target_transform)
 
-    percentage = 100.0 / len(source_transform)
+    progress = library.ProgressReporter(len(source_transform))
 
     for i, source in enumerate(source_transform):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Matching translation: {}'.format(source))
+        progress.update(i + 1, 'Matching translation: {}', source)
         try:
             maya.cmds.delete(maya.cmds.pointConstraint(target_transform, source, maintainOffset=False))
             out_dict['result'].append(source)
@@ -510,8 +389,8 @@ def match_translation(source_transform=None, target_transform=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def match_rotation(source_transform=None, target_transform=None):
     """
     Matches rotation of the source node to the rotation of the given target node(s)
@@ -531,10 +410,10 @@ def match_rotation(source_transform=None, target_transform=None):
     source_transform = python.force_list(source_transform)
     target_transform = python.force_list(target_transform)
 
-    percentage = 100.0 / len(source_transform)
+    progress = library.ProgressReporter(len(source_transform))
 
     for i, source in enumerate(source_transform):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Matching rotation: {}'.format(source))
+        progress.update(i + 1, 'Matching rotation: {}', source)
         try:
             maya.cmds.delete(maya.cmds.orientConstraint(target_transform, source, maintainOffset=False))
 
@@ -563,8 +442,8 @@ def match_rotation(source_transform=None, target_transform=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def match_scale(source_transform=None, target_transform=None):
     """
     Matches scale of the source node to the scale of the given target node(s)
@@ -584,10 +463,10 @@ def match_scale(source_transform=None, target_transform=None):
     source_transform = python.force_list(source_transform)
     target_transform = python.force_list(target_transform)
 
-    percentage = 100.0 / len(source_transform)
+    progress = library.ProgressReporter(len(source_transform))
 
     for i, source in enumerate(source_transform):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Matching scale: {}'.format(source))
+        progress.update(i + 1, 'Matching scale: {}', source)
         try:
             maya.cmds.delete(maya.cmds.scaleConstraint(target_transform, source, maintainOffset=False))
             out_dict['result'].append(source)
@@ -605,8 +484,8 @@ def match_scale(source_transform=None, target_transform=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def combine_meshes(meshes=None, new_mesh_name=None):
     """
     Combines given meshes into one transform
@@ -648,8 +527,8 @@ def combine_meshes(meshes=None, new_mesh_name=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def separate_meshes(meshes=None, new_mesh_name=None):
     """
     Separates given meshes into one transform
@@ -684,8 +563,8 @@ def separate_meshes(meshes=None, new_mesh_name=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def mirror_mesh(mesh=None):
     """
     Mirror given meshes
@@ -724,8 +603,8 @@ def mirror_mesh(mesh=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def open_mirror_meshes_options():
 
     out_dict = {'success': False}
@@ -757,8 +636,8 @@ def open_symmetry_tool():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def detach_components(components=None):
     """
     Detach selected components
@@ -782,8 +661,8 @@ def detach_components(components=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def detach_edges(edges=None):
     """
     Detach selected edges in different groups
@@ -828,8 +707,8 @@ def detach_edges(edges=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def create_curve_from_mesh_edge_loop(mesh_edge_list=None):
     """
     Creates new curve from given mesh edge loop
@@ -853,3 +732,122 @@ def create_curve_from_mesh_edge_loop(mesh_edge_list=None):
     out_dict['success'] = True
 
     return out_dict
+
+
+def _match_transforms(source_transforms, target_transforms):
+    """
+    Internal function that matches the world transform of all the given source nodes with the world transform of the
+    given target nodes (or with their average transform if multiple targets are given)
+    World matrices are read once and local values of all the nodes are computed at once and written in a single step.
+    Joints rotation is stored in their joint orient. Nodes with non-zero pivots are matched using constraints
+    :param source_transforms: list(str)
+    :param target_transforms: list(str)
+    """
+
+    match_data = transformapi.get_match_data(source_transforms)
+    if any(match_data['pivots']):
+        for node, has_pivots in zip(source_transforms, match_data['pivots']):
+            if has_pivots:
+                _constraint_match_transform(node, target_transforms)
+        keep = [i for i, has_pivots in enumerate(match_data['pivots']) if not has_pivots]
+        if not keep:
+            return
+        source_transforms = [source_transforms[i] for i in keep]
+        match_data = dict((key, [node_values[i] for i in keep]) for key, node_values in match_data.items())
+
+    target_matrices = numpy.array(transformapi.get_world_matrices(target_transforms)).reshape(-1, 4, 4)
+    world_matrix = target_matrices[0] if len(target_matrices) == 1 else matrixmath.average_matrix(target_matrices)
+
+    values = matrixmath.compute_match_values(
+        world_matrix, numpy.array(match_data['parent_inverse_matrices']).reshape(-1, 4, 4),
+        rotate_orders=match_data['rotate_orders'], rotate_axes=match_data['rotate_axes'],
+        joints=match_data['joints'], inverse_scales=match_data['inverse_scales'])
+
+    joint_orients = [
+        orient if is_joint else None for orient, is_joint in zip(values['jointOrient'], match_data['joints'])]
+    transformapi.set_values(source_transforms, {
+        'translate': values['translate'],
+        'rotate': values['rotate'],
+        'scale': values['scale'],
+        'jointOrient': joint_orients
+    })
+
+
+def _constraint_match_transform(source_transform, target_transforms):
+    """
+    Internal function that matches the world transform of the given source node with the world transform of the given
+    target nodes using temporary constraints. Joints rotation is stored in their joint orient
+    :param source_transform: str
+    :param target_transforms: list(str)
+    """
+
+    maya.cmds.delete(maya.cmds.parentConstraint(target_transforms, source_transform, maintainOffset=False))
+    maya.cmds.delete(maya.cmds.scaleConstraint(target_transforms, source_transform, maintainOffset=False))
+
+    # For joints, we store now rotation data in jointOrient attribute
+    if dcc.node_type(source_transform) == 'joint':
+        for axis in 'XYZ':
+            joint_orient_attr = 'jointOrient{}'.format(axis)
+            joint_rotation_attr = 'rotate{}'.format(axis)
+            dcc.set_attribute_value(source_transform, joint_orient_attr, 0.0)
+            joint_rotation = dcc.get_attribute_value(source_transform, joint_rotation_attr)
+            dcc.set_attribute_value(source_transform, joint_orient_attr, joint_rotation)
+            dcc.set_attribute_value(source_transform, joint_rotation_attr, 0.0)
+
+
+def _set_transforms_locked(transforms, attributes, lock, out_dict):
+    """
+    Internal function that locks or unlocks the given attributes of all the given transforms in a single undo step
+    :param transforms: list(str)
+    :param attributes: list(str)
+    :param lock: bool
+    :param out_dict: dict, command result dictionary to fill
+    :return: dict
+    """
+
+    status = transformapi.set_locked(transforms, attributes, lock=lock)
+
+    return _update_status(transforms, status, out_dict, 'lock' if lock else 'unlock')
+
+
+def _run_batched(transforms, batch_fn, node_fn, out_dict, action_name):
+    """
+    Internal function that executes the given batch function with all the given nodes in a single call
+    If batch call fails, given node function is called per node to find which nodes cannot be processed
+    :param transforms: list(str)
+    :param batch_fn: callable, function that receives the list of nodes
+    :param node_fn: callable, function that receives a single node
+    :param out_dict: dict, command result dictionary to fill
+    :param action_name: str, name of the action used in error messages
+    :return: dict
+    """
+
+    try:
+        batch_fn(transforms)
+        status = [True] * len(transforms)
+    except Exception as exc:
+        LOGGER.debug('Batch {} failed, processing nodes one by one: {}'.format(action_name, exc))
+        status = list()
+        progress = library.ProgressReporter(len(transforms))
+        for i, node in enumerate(transforms):
+            progress.update(i + 1, '{}: {}', action_name.capitalize(), node)
+            try:
+                node_fn(node)
+                status.append(True)
+            except Exception:
+                status.append(False)
+
+    return _update_status(transforms, status, out_dict, action_name)
+
+
+def _update_status(transforms, status, out_dict, action_name):
+    out_dict['status'] = status
+    out_dict['result'] = [node for node, valid in zip(transforms, status) if valid]
+    invalid_nodes = [node for node, valid in zip(transforms, status) if not valid]
+    if invalid_nodes:
+        out_dict['msg'] = 'Was not possible to {} in nodes: {}'.format(action_name, ', '.join(invalid_nodes))
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
@@ -12,7 +12,9 @@ import maya.cmds
 from tpDcc import dcc
 from tpDcc.libs.python import python
 
-from tpDcc.dccs.maya.core import decorators, joint as joint_utils, curve as curve_utils
+from tpDcc.dccs.maya.core import joint as joint_utils, curve as curve_utils
+
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import transaction
 
 
 def get_valid_joints(joints=None):
@@ -30,8 +32,8 @@ def get_valid_joints(joints=None):
     return valid_joints
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def start_joint_tool():
     """
     Initializes joint tool
@@ -50,8 +52,8 @@ def start_joint_tool():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def create_new_joint_on_center(transforms=None):
     """
     Creates a new joint in the center of the selected transforms
@@ -78,8 +80,8 @@ def create_new_joint_on_center(transforms=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def create_joints_on_selected_components_center():
     """
     Creates new joints on the selected components center
@@ -106,8 +108,8 @@ def create_joints_on_selected_components_center():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def insert_joints(joints=None, num_joints=1):
     """
     Inserts new joints between selected joint and its direct child
@@ -136,8 +138,8 @@ def insert_joints(joints=None, num_joints=1):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def create_joints_on_curve(curve=None, num_joints=1):
 
     out_dict = {'success': False, 'result': list()}
@@ -166,8 +168,8 @@ def create_joints_on_curve(curve=None, num_joints=1):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def snap_joints_to_curve(joints=None, curve=None, num_joints=1):
 
     out_dict = {'success': False, 'result': dict()}
@@ -231,8 +233,8 @@ def check_joint_labels(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def toggle_local_rotation_axis(joints=None):
     """
      Toggles the visibility of all (if the user has nothing selected) or all joints local rotation axis
@@ -257,8 +259,8 @@ def toggle_local_rotation_axis(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def toggle_all_local_rotation_axis(flag=None):
     """
     Toggles the visibility of all joints local rotation axis
@@ -273,8 +275,8 @@ def toggle_all_local_rotation_axis(flag=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def toggle_selected_local_rotation_axis(flag=None):
     """
     Toggles the visibility of selected joints local rotation axis
@@ -294,8 +296,8 @@ def toggle_selected_local_rotation_axis(flag=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def toggle_joints_xray():
     out_dict = {'success': False, 'result': dict()}
 
@@ -306,8 +308,8 @@ def toggle_joints_xray():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def set_joints_xray(flag=None):
     out_dict = {'success': False, 'result': dict()}
 
@@ -322,8 +324,8 @@ def set_joints_xray(flag=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def set_joints_display_size(value=None):
     out_dict = {'success': False, 'result': dict()}
 
@@ -337,8 +339,8 @@ def set_joints_display_size(value=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def select_hierarchy():
     out_dict = {'success': False, 'result': dict()}
 
@@ -349,8 +351,8 @@ def select_hierarchy():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def orient_joints(joints=None, force_orient_attributes=True):
     """
     Orients all joints that have OrientJointAttributes added
@@ -374,8 +376,8 @@ def orient_joints(joints=None, force_orient_attributes=True):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def orient_all_joints(force_orient_attributes=True):
     """
     Orients all joints
@@ -396,8 +398,8 @@ def orient_all_joints(force_orient_attributes=True):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def orient_selected_joints(force_orient_attributes=True):
     """
     Orient selected joints
@@ -418,8 +420,8 @@ def orient_selected_joints(force_orient_attributes=True):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def add_orient_data(joints=None):
     """
     Add orient data to joints
@@ -441,8 +443,8 @@ def add_orient_data(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def add_orient_data_all_joints():
     """
     Add orient data to all joints in current scene
@@ -462,8 +464,8 @@ def add_orient_data_all_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def add_orient_data_selected_joints():
     """
     Add orient data to selected joints
@@ -483,8 +485,8 @@ def add_orient_data_selected_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def clean_orient_data(joints=None):
     """
     Clean orient data from joints
@@ -506,8 +508,8 @@ def clean_orient_data(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def clean_orient_data_all_joints():
     """
     Clean orient data from all joints in current scene
@@ -527,8 +529,8 @@ def clean_orient_data_all_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def clean_orient_data_selected_joints():
     """
     Cleans orient data from selected joints
@@ -548,8 +550,8 @@ def clean_orient_data_selected_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def zero_joint_orient(joints=None):
     """
     Zeroes out the data of joints
@@ -571,8 +573,8 @@ def zero_joint_orient(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def zero_joint_orient_all_joints():
     """
     Zeroes out the orient of all joints in current scene
@@ -592,8 +594,8 @@ def zero_joint_orient_all_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def zero_joint_orient_selected_joints():
     """
     Zeroes out the orient of selected joints
@@ -613,8 +615,8 @@ def zero_joint_orient_selected_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def mirror_joints(joints=None):
     """
     Mirror joints
@@ -636,8 +638,8 @@ def mirror_joints(joints=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def mirror_all_joints():
     """
     Mirror all joints in current scene
@@ -657,8 +659,8 @@ def mirror_all_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def mirror_selected_joints():
     """
     Mirror selected joints
@@ -678,8 +680,8 @@ def mirror_selected_joints():
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def mirror_hierarchy_joints():
     """
     Mirror hierarchy joints
@@ -0,0 +1,322 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains a cache of mesh topology, symmetry and skinning data
+Entries are keyed by shape node and topology hash, so interactive edits on the same mesh do not need to walk its
+topology or to look for its skin cluster again. Entries are evicted when the topology changes or the node is deleted.
+Topology edits that keep the number of elements are detected with a topology changed callback registered per mesh
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+from maya.api import OpenMaya, OpenMayaAnim
+
+from tpDcc.dccs.maya.core import skin as skin_utils
+
+from tpRigToolkit.tools.rigtoolbox.core import topology, symmetry
+
+# Dictionaries of cached entries keyed by node MObjectHandle hash code
+_MESHES = dict()
+_SKIN_CLUSTERS = dict()
+
+
+class _MeshEntry(object):
+    def __init__(self, handle, topology_hash):
+        self.handle = handle
+        self.topology_hash = topology_hash
+        self.topology_changed = False
+        self.callback_id = None
+        self.offsets = None
+        self.neighbours = None
+        self.skin_cluster = None
+        self.triangles = None
+        self.symmetry = dict()
+
+
+class _SkinClusterEntry(object):
+    def __init__(self, handle, influence_paths):
+        self.handle = handle
+        self.influence_paths = [influence_path.fullPathName() for influence_path in influence_paths]
+        self.influence_names = [influence_path.partialPathName() for influence_path in influence_paths]
+        self.influence_indices = dict((name, i) for i, name in enumerate(self.influence_names))
+        self.influence_full_indices = dict(
+            (influence_path.fullPathName(), i) for i, influence_path in enumerate(influence_paths))
+
+
+def get_mesh_path(node):
+    """
+    Returns the DAG path of the mesh shape of the given node
+    :param node: str or OpenMaya.MDagPath, transform, shape or component name (pSphere1.vtx[0])
+    :return: OpenMaya.MDagPath
+    """
+
+    if isinstance(node, OpenMaya.MDagPath):
+        mesh_path = OpenMaya.MDagPath(node)
+    else:
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(node.split('.')[0])
+        mesh_path = selection_list.getDagPath(0)
+    mesh_path.extendToShape()
+
+    return mesh_path
+
+
+def topology_hash(mesh_path):
+    """
+    Returns a hash that identifies the topology of the given mesh
+    Only elements count is taken into account, so it can be checked without walking the mesh. Edits that keep the
+    number of elements (such as spinning an edge) are detected by the topology changed callback of each cached mesh
+    :param mesh_path: OpenMaya.MDagPath
+    :return: int
+    """
+
+    mesh_fn = OpenMaya.MFnMesh(mesh_path)
+
+    return hash((mesh_fn.numVertices, mesh_fn.numEdges, mesh_fn.numPolygons, mesh_fn.numFaceVertices))
+
+
+def purge():
+    """
+    Removes all entries whose nodes have been deleted
+    """
+
+    for cache in (_MESHES, _SKIN_CLUSTERS):
+        for key in [key for key, entry in cache.items() if not entry.handle.isValid()]:
+            _remove_callback(cache.pop(key))
+
+
+def clear(node=None):
+    """
+    Removes cached entries
+    :param node: str or None, node to remove entries of. If None, all entries are removed
+    """
+
+    if node is None:
+        for entry in _MESHES.values():
+            _remove_callback(entry)
+        _MESHES.clear()
+        _SKIN_CLUSTERS.clear()
+        return
+
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add(node)
+    handle = OpenMaya.MObjectHandle(selection_list.getDependNode(0))
+    _SKIN_CLUSTERS.pop(handle.hashCode(), None)
+    try:
+        _remove_callback(_MESHES.pop(OpenMaya.MObjectHandle(get_mesh_path(node).node()).hashCode(), None))
+    except Exception:
+        pass
+
+
+def _get_mesh_entry(mesh_path):
+    """
+    Internal function that returns the cached entry of the given mesh, creating a new one if it does not exist or if
+    mesh topology changed since the entry was created
+    :param mesh_path: OpenMaya.MDagPath
+    :return: _MeshEntry
+    """
+
+    purge()
+
+    handle = OpenMaya.MObjectHandle(mesh_path.node())
+    mesh_hash = topology_hash(mesh_path)
+    entry = _MESHES.get(handle.hashCode())
+    if not entry or entry.topology_changed or entry.topology_hash != mesh_hash:
+        _remove_callback(entry)
+        entry = _MeshEntry(handle, mesh_hash)
+        _add_topology_callback(entry, mesh_path.node())
+        _MESHES[handle.hashCode()] = entry
+
+    return entry
+
+
+def _add_topology_callback(entry, mesh_node):
+    """
+    Internal function that registers a callback that flags the given entry when its mesh topology changes
+    :param entry: _MeshEntry
+    :param mesh_node: OpenMaya.MObject
+    """
+
+    def _on_topology_changed(*args):
+        entry.topology_changed = True
+
+    entry.callback_id = OpenMaya.MPolyMessage.addPolyTopologyChangedCallback(mesh_node, _on_topology_changed)
+
+
+def _remove_callback(entry):
+    """
+    Internal function that removes the topology changed callback of the given entry (if any)
+    :param entry: _MeshEntry or _SkinClusterEntry or None
+    """
+
+    callback_id = getattr(entry, 'callback_id', None)
+    if callback_id is None:
+        return
+
+    try:
+        OpenMaya.MMessage.removeCallback(callback_id)
+    except RuntimeError:
+        pass
+    entry.callback_id = None
+
+
+def get_adjacency(node):
+    """
+    Returns the vertex adjacency of the given mesh in CSR format
+    :param node: str or OpenMaya.MDagPath
+    :return: tuple(numpy.array, numpy.array), CSR offsets and neighbours arrays
+    """
+
+    mesh_path = get_mesh_path(node)
+    entry = _get_mesh_entry(mesh_path)
+    if entry.offsets is None:
+        mesh_fn = OpenMaya.MFnMesh(mesh_path)
+        polygon_counts, polygon_connects = mesh_fn.getVertices()
+        entry.offsets, entry.neighbours = topology.adjacency_from_polygons(
+            numpy.array(polygon_counts), numpy.array(polygon_connects), mesh_fn.numVertices)
+
+    return entry.offsets, entry.neighbours
+
+
+def get_triangles(node):
+    """
+    Returns the triangles of the given mesh
+    :param node: str or OpenMaya.MDagPath
+    :return: numpy.array, (triangles x 3) vertex indices of each triangle
+    """
+
+    mesh_path = get_mesh_path(node)
+    entry = _get_mesh_entry(mesh_path)
+    if entry.triangles is None:
+        _, triangle_vertices = OpenMaya.MFnMesh(mesh_path).getTriangles()
+        entry.triangles = numpy.array(triangle_vertices, dtype=numpy.int64).reshape(-1, 3)
+
+    return entry.triangles
+
+
+def get_positions(node, world=True):
+    """
+    Returns the positions of all the vertices of the given mesh
+    :param node: str or OpenMaya.MDagPath
+    :param world: bool, whether to return world space or object space positions
+    :return: numpy.array, (vertices x 3) positions
+    """
+
+    space = OpenMaya.MSpace.kWorld if world else OpenMaya.MSpace.kObject
+    points = OpenMaya.MFnMesh(get_mesh_path(node)).getPoints(space)
+
+    return numpy.array(points, dtype=numpy.float64).reshape(-1, 4)[:, :3]
+
+
+def get_symmetry_map(node, axis=0, tolerance=0.001):
+    """
+    Returns the object space positions of the given mesh and the symmetric vertex of each one of its vertices
+    Symmetry is only computed again if mesh topology or mesh points changed since last call
+    :param node: str or OpenMaya.MDagPath
+    :param axis: int, 0 for X (YZ plane), 1 for Y (XZ plane) and 2 for Z (XY plane)
+    :param tolerance: float, maximum distance between a mirrored vertex and its symmetric vertex
+    :return: tuple(numpy.array, numpy.array), (vertices x 3) positions and symmetric vertex of each vertex (-1 if it
+        has no symmetric vertex)
+    """
+
+    mesh_path = get_mesh_path(node)
+    entry = _get_mesh_entry(mesh_path)
+    positions = get_positions(mesh_path, world=False)
+
+    key = (axis, tolerance)
+    cached_positions, vertex_map = entry.symmetry.get(key, (None, None))
+    if cached_positions is None or not numpy.array_equal(cached_positions, positions):
+        vertex_map = symmetry.symmetry_map(positions, axis=axis, tolerance=tolerance)
+        entry.symmetry[key] = (positions, vertex_map)
+
+    return positions, vertex_map
+
+
+def find_related_skin_cluster(node):
+    """
+    Returns the skin cluster deforming the given mesh
+    :param node: str or OpenMaya.MDagPath
+    :return: str or None
+    """
+
+    mesh_path = get_mesh_path(node)
+    entry = _get_mesh_entry(mesh_path)
+    if not entry.skin_cluster or not entry.skin_cluster.isValid():
+        skin_cluster_name = skin_utils.find_related_skin_cluster(mesh_path.partialPathName())
+        if not skin_cluster_name:
+            return None
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(skin_cluster_name)
+        entry.skin_cluster = OpenMaya.MObjectHandle(selection_list.getDependNode(0))
+
+    return OpenMaya.MFnDependencyNode(entry.skin_cluster.object()).name()
+
+
+def get_influence_indices(skin_cluster_name, full_path=False):
+    """
+    Returns a dictionary that maps the influence names of the given skin cluster with its influence indices
+    Cached influences are compared with the current skin cluster influences, so added, removed or replaced influences
+    are always taken into account
+    :param skin_cluster_name: str
+    :param full_path: bool, whether dictionary keys are influences full path names or partial path names
+    :return: dict(str, int)
+    """
+
+    entry = _get_skin_cluster_entry(skin_cluster_name)
+
+    return entry.influence_full_indices if full_path else entry.influence_indices
+
+
+def get_influence_names(skin_cluster_name):
+    """
+    Returns the names of the influences of the given skin cluster sorted by its influence index
+    :param skin_cluster_name: str
+    :return: list(str)
+    """
+
+    return _get_skin_cluster_entry(skin_cluster_name).influence_names
+
+
+def _get_skin_cluster_entry(skin_cluster_name):
+    """
+    Internal function that returns the cached entry of the given skin cluster
+    :param skin_cluster_name: str
+    :return: _SkinClusterEntry
+    """
+
+    purge()
+
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add(skin_cluster_name)
+    skin_cluster_node = selection_list.getDependNode(0)
+    handle = OpenMaya.MObjectHandle(skin_cluster_node)
+    influence_paths = OpenMayaAnim.MFnSkinCluster(skin_cluster_node).influenceObjects()
+    entry = _SKIN_CLUSTERS.get(handle.hashCode())
+    if not entry or entry.influence_paths != [influence_path.fullPathName() for influence_path in influence_paths]:
+        entry = _SkinClusterEntry(handle, influence_paths)
+        _SKIN_CLUSTERS[handle.hashCode()] = entry
+
+    return entry
+
+
+def find_vertices_path(start, end, use_distance=True):
+    """
+    Returns the vertices between the given mesh vertices following the shortest path that connects them
+    :param start: str, start vertex name (pSphere1.vtx[0])
+    :param end: str, end vertex name (pSphere1.vtx[20])
+    :param use_distance: bool, whether to weight path edges by its length or to return the path with less edges
+    :return: list(str), vertex names of the path (start and end vertices not included)
+    """
+
+    mesh_name = start.split('.')[0]
+    start_index = int(start.split('[')[-1].split(']')[0])
+    end_index = int(end.split('[')[-1].split(']')[0])
+    offsets, neighbours = get_adjacency(mesh_name)
+
+    positions = get_positions(mesh_name) if use_distance else None
+    path = topology.shortest_path(offsets, neighbours, start_index, end_index, positions=positions)
+
+    return ['{}.vtx[{}]'.format(mesh_name, vertex_index) for vertex_index in path[1:-1]]
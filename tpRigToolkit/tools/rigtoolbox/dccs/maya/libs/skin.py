@@ -7,9 +7,12 @@ Module that contains library with skinning related functions
 
 from __future__ import print_function, division, absolute_import
 
+import os
+import time
 import logging
-import cStringIO
 import traceback
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 
 import maya.cmds
 import maya.mel
@@ -18,16 +21,42 @@ from tpDcc import dcc
 from tpDcc.libs.python import python, kdtree, bezier
 
 from tpDcc.dccs.maya.api import skin as api_skin, mathlib as api_mathlib
-from tpDcc.dccs.maya.core import decorators, geometry as geo_utils, mesh as mesh_utils, joint as joint_utils
+from tpDcc.dccs.maya.core import geometry as geo_utils, mesh as mesh_utils, joint as joint_utils
 from tpDcc.dccs.maya.core import skin as skin_utils
 
 from tpRigToolkit.tools.rigtoolbox.widgets import library
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import transaction
 
 LOGGER = logging.getLogger('tpRigToolkit-tools-rigtoolbox')
 
-
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+# NumPy is not available by default in all Maya versions. If not available, we fallback to skinPercent
+try:
+    import numpy
+    from tpRigToolkit.tools.rigtoolbox.core import (
+        skinmath, skinweights, spatial, symmetry, transfer, wireformat, weightsio)
+    from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import skinapi, meshcache
+except ImportError as exc:
+    LOGGER.info('Vectorized skin weights functions are not available: {}'.format(exc))
+    numpy = None
+    skinmath = None
+    skinweights = None
+    spatial = None
+    symmetry = None
+    transfer = None
+    wireformat = None
+    weightsio = None
+    skinapi = None
+    meshcache = None
+
+# Axis perpendicular to each one of the mirror planes
+MIRROR_AXES = {'YZ': 0, 'XZ': 1, 'XY': 2}
+
+# Maya joint label type used for labels defined by otherType attribute
+OTHER_JOINT_LABEL_TYPE = 18
+
+
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def apply_smooth_bind_skin(geo=None, show_options=False):
     """
     Initializes joint tool
@@ -58,8 +87,8 @@ def apply_smooth_bind_skin(geo=None, show_options=False):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def apply_rigid_skin(geo=None, show_options=False):
 
     out_dict = {'success': False, 'result': None}
@@ -87,8 +116,8 @@ def apply_rigid_skin(geo=None, show_options=False):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def detach_bind_skin(geo=None, show_options=False):
 
     out_dict = {'success': False, 'result': list()}
@@ -116,8 +145,8 @@ def detach_bind_skin(geo=None, show_options=False):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def open_pain_skin_weights_tool(show_options=False):
 
     out_dict = {'success': False, 'result': None}
@@ -134,11 +163,28 @@ def open_pain_skin_weights_tool(show_options=False):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
-def mirror_skin_weights(mesh=None, show_options=False, **kwargs):
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def mirror_skin_weights(
+        mesh=None, mirror_mode='YZ', mirror_inverse=False, tolerance=0.001, auto_assign_labels=False,
+        left_side_label=None, right_side_label=None, show_options=False, **kwargs):
+    """
+    Mirrors the skin weights of the given meshes
+    Vertices symmetry is cached per mesh and influences are matched using its joint labels, so mirroring is a single
+    gather of the weights array. Mesh is expected to be in its bind pose
+    :param mesh: str or list(str) or None, skinned meshes to mirror weights of. If None, selected meshes are used
+    :param mirror_mode: str, mirror plane ('YZ', 'XZ' or 'XY')
+    :param mirror_inverse: bool, whether to mirror from negative side to positive side or vice versa
+    :param tolerance: float, maximum distance between a mirrored vertex and its symmetric vertex
+    :param auto_assign_labels: bool, whether to assign labels to the influences without label
+    :param left_side_label: str, pattern used to find left side influences when assigning labels
+    :param right_side_label: str, pattern used to find right side influences when assigning labels
+    :param show_options: bool, whether to show Maya mirror skin weights options dialog instead
+    :return: dict, result maps each mirrored mesh with its number of mirrored vertices and the number of vertices
+        without symmetric vertex
+    """
 
-    out_dict = {'success': False, 'result': None}
+    out_dict = {'success': False, 'result': dict()}
 
     transforms = mesh or dcc.selected_nodes_of_type('transform')
     transforms = python.force_list(transforms)
@@ -146,9 +192,53 @@ def mirror_skin_weights(mesh=None, show_options=False, **kwargs):
         out_dict['msg'] = 'No meshes to mirror skin weights of found.'
         return out_dict
 
+    if show_options or not skinapi:
+        try:
+            out_dict['result'] = skin_utils.mirror_skin_weights(
+                mesh=mesh, show_options=show_options, auto_assign_labels=auto_assign_labels,
+                left_side_label=left_side_label, right_side_label=right_side_label, **kwargs)
+        except Exception as exc:
+            out_dict['msg'] = 'Was not possible to mirror skin weights: {}'.format(exc)
+            return out_dict
+        out_dict['success'] = True
+        return out_dict
+
     try:
-        result = skin_utils.mirror_skin_weights(mesh=mesh, show_options=show_options, **kwargs)
-        out_dict['result'] = result
+        axis = MIRROR_AXES[mirror_mode.upper()]
+        progress = library.ProgressReporter(len(transforms))
+        for i, transform in enumerate(transforms):
+            progress.update(i + 1, 'Mirroring Skin Weights: {}', transform)
+            skin_cluster_name = _find_related_skin_cluster(transform)
+            if not skin_cluster_name:
+                LOGGER.warning('Mesh "{}" is not skinned. Skipping mirror skin weights ...'.format(transform))
+                continue
+
+            influence_names = meshcache.get_influence_names(skin_cluster_name)
+            sides, labels = _get_influences_labels(influence_names)
+            if auto_assign_labels and symmetry.NO_SIDE in sides:
+                joint_utils.auto_assign_labels_to_mesh_influences(
+                    [transform], input_left=left_side_label, input_right=right_side_label, check_labels=True)
+                sides, labels = _get_influences_labels(influence_names)
+            influence_positions = [
+                maya.cmds.xform(influence_name, query=True, worldSpace=True, translation=True)
+                for influence_name in influence_names]
+            permutation = symmetry.influence_mirror_permutation(
+                sides, labels, names=influence_names, positions=influence_positions, axis=axis)
+
+            positions, vertex_map = meshcache.get_symmetry_map(transform, axis=axis, tolerance=tolerance)
+            vertices = symmetry.side_vertices(
+                positions, axis=axis, positive_to_negative=not mirror_inverse, tolerance=tolerance)
+            unmatched = vertex_map[vertices] < 0
+            vertices = vertices[~unmatched]
+            if unmatched.any():
+                LOGGER.warning('{} vertices of "{}" have no symmetric vertex. Their weights are not mirrored'.format(
+                    int(unmatched.sum()), transform))
+
+            if len(vertices):
+                weights, _ = skinapi.get_weights(skin_cluster_name)
+                skinapi.set_weights(
+                    skin_cluster_name, vertices, symmetry.mirror_weights(weights, vertex_map, permutation, vertices))
+            out_dict['result'][transform] = {'vertices': len(vertices), 'unmatched': int(unmatched.sum())}
     except Exception as exc:
         out_dict['msg'] = 'Was not possible to mirror skin weights: {}'.format(exc)
         return out_dict
@@ -158,23 +248,89 @@ def mirror_skin_weights(mesh=None, show_options=False, **kwargs):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
-def copy_skin_weights(source_mesh=None, target_mesh=None, show_options=False, **kwargs):
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def copy_skin_weights(source_mesh=None, target_mesh=None, candidates=8, workers=None, show_options=False, **kwargs):
+    """
+    Copies the skin weights of the given source mesh into the given target meshes using closest point on surface
+    Source surface spatial index is built once and the weights of all targets are computed concurrently. Each target
+    weights are written in a single call. Influences are matched by name and targets are bound to the source
+    influences they are not bound to
+    :param source_mesh: str or None, skinned mesh to copy weights from. If None, first selected mesh is used
+    :param target_mesh: str or list(str) or None, meshes to copy weights into. If None, the rest of selected meshes
+        are used
+    :param candidates: int, number of source triangles checked to find the closest surface point of each vertex
+    :param workers: int or None, number of threads used to compute targets weights. If None, one per CPU is used
+    :param show_options: bool, whether to show Maya copy skin weights options dialog instead
+    :return: dict, result maps each target mesh with its number of vertices, maximum distance to the source surface
+        and the time spent computing and writing its weights
+    """
 
-    out_dict = {'success': False, 'result': None}
+    out_dict = {'success': False, 'result': dict()}
 
     selection = dcc.selected_nodes_of_type('transform')
     source_transform = source_mesh or (selection[0] if python.index_exists_in_list(selection, 1) else None)
-    target_transform = target_mesh or (selection[1] if python.index_exists_in_list(selection, 1) else None)
-    if not source_transform or not target_transform:
+    target_transforms = python.force_list(target_mesh or selection[1:])
+    if not source_transform or not target_transforms:
         out_dict['msg'] = 'Select source mesh and target mesh before executing Copy Skin Weights.'
         return out_dict
 
+    if show_options or not skinapi:
+        try:
+            out_dict['result'] = skin_utils.copy_skin_weights(
+                source_mesh=source_mesh, target_mesh=target_mesh, show_options=show_options, **kwargs)
+        except Exception as exc:
+            out_dict['msg'] = 'Was not possible to copy skin weights: {}'.format(exc)
+            return out_dict
+        out_dict['success'] = True
+        return out_dict
+
+    source_skin_cluster = _find_related_skin_cluster(source_transform)
+    if not source_skin_cluster:
+        out_dict['msg'] = 'Source mesh "{}" is not skinned.'.format(source_transform)
+        return out_dict
+
     try:
-        result = skin_utils.copy_skin_weights(
-            source_mesh=source_mesh, target_mesh=target_mesh, show_options=show_options, **kwargs)
-        out_dict['result'] = result
+        source_weights, influence_names = skinapi.get_weights(source_skin_cluster)
+        sampler = transfer.SurfaceSampler(
+            meshcache.get_positions(source_transform), meshcache.get_triangles(source_transform),
+            candidates=candidates)
+        targets_positions = [meshcache.get_positions(target_transform) for target_transform in target_transforms]
+
+        # Sampling does not access the scene, so targets are computed by worker threads while Maya main thread
+        # writes the weights of the targets that are already computed
+        def _compute_weights(target_positions):
+            start = time.time()
+            vertices, coordinates, distances = sampler.sample(target_positions)
+            weights = transfer.interpolate_weights(source_weights, vertices, coordinates)
+            return weights, distances, time.time() - start
+
+        progress = library.ProgressReporter(len(target_transforms))
+        pool = ThreadPool(workers or min(len(target_transforms), multiprocessing.cpu_count()))
+        try:
+            targets_weights = pool.imap(_compute_weights, targets_positions)
+            for i, (target_transform, (weights, distances, compute_time)) in enumerate(
+                    zip(target_transforms, targets_weights)):
+                progress.update(i + 1, 'Copying Skin Weights: {}', target_transform)
+                start = time.time()
+                target_skin_cluster = _bind_influences(target_transform, influence_names)
+                influence_indices = meshcache.get_influence_indices(target_skin_cluster)
+                target_weights = numpy.zeros((len(weights), len(influence_indices)), dtype=numpy.float64)
+                target_weights[:, [influence_indices[name] for name in influence_names]] = weights
+                skinapi.set_weights(target_skin_cluster, numpy.arange(len(weights)), target_weights)
+                write_time = time.time() - start
+                out_dict['result'][target_transform] = {
+                    'vertices': len(weights),
+                    'max_distance': float(distances.max()) if len(distances) else 0.0,
+                    'compute_time': compute_time,
+                    'write_time': write_time,
+                    'time': compute_time + write_time
+                }
+                LOGGER.debug('Skin weights copied into "{}" in {:.3f} seconds'.format(
+                    target_transform, compute_time + write_time))
+        finally:
+            pool.close()
+            pool.join()
     except Exception as exc:
         out_dict['msg'] = 'Was not possible to copy skin weights: {}'.format(exc)
         return out_dict
@@ -184,11 +340,21 @@ def copy_skin_weights(source_mesh=None, target_mesh=None, show_options=False, **
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
-def prune_skin_weights(mesh=None, show_options=False, **kwargs):
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def prune_skin_weights(mesh=None, threshold=0.01, max_influences=None, show_options=False, **kwargs):
+    """
+    Discards the skin weights lower than the given threshold and limits the number of influences of each vertex
+    Weights of each mesh are read once, pruned and normalized as sparse weights and written back in a single call
+    :param mesh: str or list(str) or None, skinned meshes to prune weights of. If None, selected meshes are used
+    :param threshold: float, weights lower or equal than this value are discarded
+    :param max_influences: int or None, maximum number of influences per vertex. If None, it is not limited
+    :param show_options: bool, whether to show Maya prune weights options dialog instead
+    :return: dict, result maps each pruned mesh with its influences per vertex histograms before and after pruning
+        and its number of modified vertices
+    """
 
-    out_dict = {'success': False, 'result': None}
+    out_dict = {'success': False, 'result': dict()}
 
     transforms = mesh or dcc.selected_nodes_of_type('transform')
     transforms = python.force_list(transforms)
@@ -196,9 +362,38 @@ def prune_skin_weights(mesh=None, show_options=False, **kwargs):
         out_dict['msg'] = 'No meshes to prune skin weights of found.'
         return out_dict
 
+    if show_options or not skinapi:
+        try:
+            out_dict['result'] = skin_utils.prune_skin_weights(mesh=mesh, show_options=show_options, **kwargs)
+        except Exception as exc:
+            out_dict['msg'] = 'Was not possible to prune skin weights: {}'.format(exc)
+            return out_dict
+        out_dict['success'] = True
+        return out_dict
+
     try:
-        result = skin_utils.prune_skin_weights(mesh=mesh, show_options=show_options, **kwargs)
-        out_dict['result'] = result
+        progress = library.ProgressReporter(len(transforms))
+        for i, transform in enumerate(transforms):
+            progress.update(i + 1, 'Pruning Skin Weights: {}', transform)
+            skin_cluster_name = _find_related_skin_cluster(transform)
+            if not skin_cluster_name:
+                LOGGER.warning('Mesh "{}" is not skinned. Skipping prune skin weights ...'.format(transform))
+                continue
+            weights, influence_names = skinapi.get_weights(skin_cluster_name)
+            pruned_weights = skinweights.SkinWeights.from_dense(weights, influence_names).prune(
+                threshold=threshold, max_influences=max_influences, normalize=False).to_dense()
+            pruned_weights = skinmath.normalize_weights(pruned_weights)
+
+            # Only vertices whose weights changed are written, so undo only stores those ones. Sparse weights are
+            # stored in single precision, so differences below its precision are ignored
+            vertex_indices = numpy.flatnonzero(numpy.any(numpy.abs(pruned_weights - weights) > 1e-6, axis=1))
+            if len(vertex_indices):
+                skinapi.set_weights(skin_cluster_name, vertex_indices, pruned_weights[vertex_indices])
+            out_dict['result'][transform] = {
+                'before': skinmath.influence_count_histogram(weights).tolist(),
+                'after': skinmath.influence_count_histogram(pruned_weights).tolist(),
+                'vertices': len(vertex_indices)
+            }
     except Exception as exc:
         out_dict['msg'] = 'Was not possible to prune skin weights: {}'.format(exc)
         return out_dict
@@ -208,8 +403,8 @@ def prune_skin_weights(mesh=None, show_options=False, **kwargs):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def transfer_uvs_to_skinned_geometry(source_mesh=None, target_mesh=None, use_intermediate_shape=False, **kwargs):
 
     out_dict = {'success': False, 'result': None}
@@ -234,8 +429,8 @@ def transfer_uvs_to_skinned_geometry(source_mesh=None, target_mesh=None, use_int
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def freeze_skinned_mesh(skinned_mesh, **kwargs):
 
     out_dict = {'success': False, 'result': list()}
@@ -250,10 +445,10 @@ def freeze_skinned_mesh(skinned_mesh, **kwargs):
             meshes, input_left=kwargs.pop('left_side_label', None),
             input_right=kwargs.pop('right_side_label', None), check_labels=True)
 
-    percentage = 100.0 / len(meshes)
+    progress = library.ProgressReporter(len(meshes))
 
     for i, mesh in enumerate(meshes):
-        library.Command.progressCommand.emit(percentage * (i + 1), 'Cleaning Skinned Mesh: {}'.format(mesh))
+        progress.update(i + 1, 'Cleaning Skinned Mesh: {}', mesh)
         try:
             skin_cluster_name = skin_utils.find_related_skin_cluster(mesh)
             if not skin_cluster_name:
@@ -279,8 +474,8 @@ def freeze_skinned_mesh(skinned_mesh, **kwargs):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def combine_skinned_meshes(meshes=None):
 
     out_dict = {'success': False, 'result': None}
@@ -302,8 +497,8 @@ def combine_skinned_meshes(meshes=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def extract_skinned_selected_components(selected_components=None, **kwargs):
 
     out_dict = {'success': False, 'result': None}
@@ -326,9 +521,16 @@ def extract_skinned_selected_components(selected_components=None, **kwargs):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
-def delete_unused_influences(skinned_objects=None):
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def delete_unused_influences(skinned_objects=None, tolerance=1e-6):
+    """
+    Removes the influences whose weights sum is lower or equal than the given tolerance from the skin clusters of the
+    given meshes. Weights of each skin cluster are read once and all its unused influences are removed in a single edit
+    :param skinned_objects: str or list(str) or None, skinned meshes to clean. If None, selected nodes are used
+    :param tolerance: float, influences whose total weight is lower or equal than this value are removed
+    :return: dict
+    """
 
     out_dict = {'success': False, 'result': list()}
 
@@ -338,12 +540,13 @@ def delete_unused_influences(skinned_objects=None):
         out_dict['msg'] = 'No components to extract from found.'
         return out_dict
 
-    percentage = 100.0 / len(skinned_objects)
+    progress = library.ProgressReporter(len(skinned_objects))
 
+    cleaned_skin_clusters = set()
     for i, mesh in enumerate(skinned_objects):
         try:
-            library.Command.progressCommand.emit(percentage * (i + 1), 'Deleting unused influences: {}'.format(mesh))
-            skin_cluster_name = skin_utils.find_related_skin_cluster(mesh)
+            progress.update(i + 1, 'Deleting unused influences: {}', mesh)
+            skin_cluster_name = _find_related_skin_cluster(mesh)
             if not skin_cluster_name:
                 shape = maya.cmds.listRelatives(mesh, shapes=True) or None
                 if shape:
@@ -351,28 +554,27 @@ def delete_unused_influences(skinned_objects=None):
                         'Impossible to delete unused influences because mesh "{}" '
                         'has no skin cluster attached to it!'.format(mesh))
                 continue
+            if skin_cluster_name in cleaned_skin_clusters:
+                out_dict['result'].append(mesh)
+                continue
 
-            attached_joints = maya.cmds.skinCluster(skin_cluster_name, query=True, influence=True)
-            weighted_joints = maya.cmds.skinCluster(skin_cluster_name, query=True, weightedInfluence=True)
-
-            non_influenced = list()
-            for attached in attached_joints:
-                if attached in weighted_joints:
-                    continue
-                non_influenced.append(attached)
-
-            for joint in non_influenced:
-                maya.cmds.skinCluster(skin_cluster_name, edit=True, removeInfluence=joint)
+            unused_influences = _find_unused_influences(skin_cluster_name, tolerance=tolerance)
+            if unused_influences:
+                _remove_influences(skin_cluster_name, unused_influences)
+                LOGGER.info('Removed {} unused influences from "{}"'.format(len(unused_influences), skin_cluster_name))
+            cleaned_skin_clusters.add(skin_cluster_name)
             out_dict['result'].append(mesh)
         except Exception as exc:
             out_dict['msg'] = 'Was not possible to delete unused influences: "{}" | {}'.format(skinned_objects, exc)
             return out_dict
 
+    out_dict['success'] = True
+
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def restore_to_bind_pose(skinned_mesh=None):
 
     out_dict = {'success': False, 'result': None}
@@ -400,8 +602,8 @@ def restore_to_bind_pose(skinned_mesh=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def remove_bind_poses():
 
     out_dict = {'success': False, 'result': None}
@@ -434,7 +636,7 @@ def hammer_vertices(vertices_to_hammer=None, return_as_list=True):
     return out_dict
 
 
-@decorators.undo
+@transaction.undo
 def average_vertices_weights(selection, use_distance, curve_weight_points=None):
     """
     Generates an average weight from all selected vertices to apply to the last selected vertex
@@ -459,7 +661,7 @@ def average_vertices_weights(selection, use_distance, curve_weight_points=None):
     if '.e[' in selection[0]:
         is_edge_selection = True
 
-    skin_cluster_name = skin_utils.find_related_skin_cluster(obj)
+    skin_cluster_name = _find_related_skin_cluster(obj)
     maya.cmds.setAttr('{0}.envelope'.format(skin_cluster_name), 0)
 
     try:
@@ -469,11 +671,12 @@ def average_vertices_weights(selection, use_distance, curve_weight_points=None):
             if is_edge_selection:
                 base_list = mesh_utils.edges_to_smooth(edges_list=selection)
 
-            percentage = 99.0 / len(base_list)
+            progress = library.ProgressReporter(len(base_list), end=99.0)
 
             for i, vert_list in enumerate(base_list):
-                library.Command.progressCommand.emit(
-                    percentage * (i + 1), 'Pass 1: Averaging vertex weights: {}'.format(i))
+                # Each vertices list is processed in three passes, each one of them with its own progress range
+                passes_progress = progress.sub_task(i, i + 1, total=3)
+                passes_progress.update(1, 'Pass 1: Averaging vertex weights: {}', i)
 
                 start = vert_list[0]
                 end = vert_list[-1]
@@ -487,7 +690,13 @@ def average_vertices_weights(selection, use_distance, curve_weight_points=None):
                 poly = False
                 if obj_type == 'mesh':
                     poly = True
-                    order = mesh_utils.find_shortest_vertices_path_between_vertices(vert_list)
+                    if meshcache:
+                        order = meshcache.find_vertices_path(start, end, use_distance=use_distance)
+                    else:
+                        order = mesh_utils.find_shortest_vertices_path_between_vertices(vert_list)
+                    if not order:
+                        # Start and end vertices are adjacent, so there are no vertices to interpolate weights of
+                        continue
                     added = 0.0
                     amount = len(order) + 1
                     total_distance = api_mathlib.distance_between_nodes(order[-1], end)
@@ -517,104 +726,79 @@ def average_vertices_weights(selection, use_distance, curve_weight_points=None):
                 if not order:
                     return
 
-                list_bone_influences = maya.cmds.skinCluster(obj, query=True, inf=True)
-                weights_start = maya.cmds.skinPercent(skin_cluster_name, start, query=True, v=True)
-                weights_end = maya.cmds.skinPercent(skin_cluster_name, end, query=True, v=True)
-
-                lengths = list()
-                if use_distance:
-                    for j, vertex in enumerate(order):
-                        if j == 0:
-                            length = api_mathlib.distance_between_nodes(start, vertex)
-                        else:
-                            length = api_mathlib.distance_between_nodes(order[j - 1], vertex)
-                        if poly:
-                            total_distance += length
-                        lengths.append(length)
-
-                percentage = float(1.0) / (amount + added)
-                current_length = 0.0
+                if poly and skinapi:
+                    passes_progress.update(2, 'Pass 2: Averaging vertex weights: {}', i)
+                    _interpolate_path_weights(
+                        skin_cluster_name, start, end, order, use_distance=use_distance,
+                        curve_weight_points=curve_weight_points)
+                else:
+                    list_bone_influences = maya.cmds.skinCluster(obj, query=True, inf=True)
+                    weights_start = maya.cmds.skinPercent(skin_cluster_name, start, query=True, v=True)
+                    weights_end = maya.cmds.skinPercent(skin_cluster_name, end, query=True, v=True)
 
-                for index, vertex in enumerate(order):
-                    library.Command.progressCommand.emit(
-                        percentage * (index + 1), 'Pass 2: Averaging vertex weights: {}'.format(index))
+                    lengths = list()
                     if use_distance:
-                        current_length += lengths[index]
-                        current_percentage = (current_length / total_distance)
-                    else:
-                        current_percentage = index * percentage
-                        if poly:
-                            current_percentage = (index + 1) * percentage
-                    if curve_weight_points:
-                        current_percentage = bezier.get_data_on_percentage(current_percentage, curve_weight_points)
+                        for j, vertex in enumerate(order):
+                            if j == 0:
+                                length = api_mathlib.distance_between_nodes(start, vertex)
+                            else:
+                                length = api_mathlib.distance_between_nodes(order[j - 1], vertex)
+                            if poly:
+                                total_distance += length
+                            lengths.append(length)
+
+                    percentage = float(1.0) / (amount + added)
+                    current_length = 0.0
+                    vertex_progress = passes_progress.sub_task(1, 2, total=len(order))
+
+                    for index, vertex in enumerate(order):
+                        vertex_progress.update(index + 1, 'Pass 2: Averaging vertex weights: {}', index)
+                        if use_distance:
+                            current_length += lengths[index]
+                            current_percentage = (current_length / total_distance)
+                        else:
+                            current_percentage = index * percentage
+                            if poly:
+                                current_percentage = (index + 1) * percentage
+                        if curve_weight_points:
+                            current_percentage = bezier.get_data_on_percentage(current_percentage, curve_weight_points)
 
-                    new_weight_list = list()
-                    for j, weight in enumerate(weights_start):
-                        value1 = weights_end[j] * current_percentage
-                        value2 = weights_start[j] * (1 - current_percentage)
-                        new_weight_list.append((list_bone_influences[j], value1 + value2))
+                        new_weight_list = list()
+                        for j, weight in enumerate(weights_start):
+                            value1 = weights_end[j] * current_percentage
+                            value2 = weights_start[j] * (1 - current_percentage)
+                            new_weight_list.append((list_bone_influences[j], value1 + value2))
 
-                    maya.cmds.skinPercent(skin_cluster_name, vertex, transformValue=new_weight_list)
+                        maya.cmds.skinPercent(skin_cluster_name, vertex, transformValue=new_weight_list)
 
                 maya.cmds.select([start, end], r=True)
 
                 maya.cmds.setAttr('{}.envelope'.format(skin_cluster_name), 1)
                 maya.cmds.select(vert_list, replace=True)
                 maya.cmds.refresh()
-                library.Command.progressCommand.emit(
-                    percentage * i, 'Pass 3: Updating skin cluster for vertex: {}'.format(i))
+                passes_progress.update(3, 'Pass 3: Updating skin cluster for vertex: {}', i)
                 maya.cmds.setAttr('{}.envelope'.format(skin_cluster_name), 0)
         else:
             last_selected = selection[-1]
             point_list = [x for x in selection if x != last_selected]
-            mesh_name = last_selected.split('.')[0]
-
-            list_joint_influences = maya.cmds.skinCluster(mesh_name, query=True, weightedInfluence=True)
-            influence_size = len(list_joint_influences)
-
-            temp_vertex_joints = list()
-            temp_vertex_weights = list()
-            for pnt in point_list:
-                for jnt in range(influence_size):
-                    point_weights = maya.cmds.skinPercent(
-                        skin_cluster_name, pnt, transform=list_joint_influences[jnt], query=True, value=True)
-                    if point_weights < 0.000001:
-                        continue
-                    temp_vertex_joints.append(list_joint_influences[jnt])
-                    temp_vertex_weights.append(point_weights)
-
-            total_values = 0.0
-            average_values = list()
-            clean_list = list()
-            for i in temp_vertex_joints:
-                if i not in clean_list:
-                    clean_list.append(i)
-
-            for i in range(len(clean_list)):
-                working_value = 0.0
-                for j in range(len(temp_vertex_joints)):
-                    if not temp_vertex_joints[j] == clean_list[i]:
-                        continue
-                    working_value += temp_vertex_weights[j]
-                num_points = len(point_list)
-                average_values.append(working_value / num_points)
-                total_values += average_values[i]
-
-            summary = 0
-            for value in range(len(average_values)):
-                temp_value = average_values[value] / total_values
-                average_values[value] = temp_value
-                summary += average_values[value]
-
-            cmd = cStringIO.StringIO()
-            cmd.write('maya.cmds.skinPercent("%s","%s", transformValue=[' % (skin_cluster_name, last_selected))
-
-            for count, skin_joint in enumerate(clean_list):
-                cmd.write('("%s", %s)' % (skin_joint, average_values[count]))
-                if not count == len(clean_list) - 1:
-                    cmd.write(', ')
-            cmd.write('])')
-            eval(cmd.getvalue())
+
+            if skinapi and all('.vtx[' in point for point in selection):
+                _average_weights_into_vertex(skin_cluster_name, point_list, last_selected)
+            else:
+                influences = maya.cmds.skinCluster(skin_cluster_name, query=True, influence=True)
+                total_weights = [0.0] * len(influences)
+                for pnt in point_list:
+                    point_weights = maya.cmds.skinPercent(skin_cluster_name, pnt, query=True, value=True)
+                    for j, weight in enumerate(point_weights):
+                        if weight < 0.000001:
+                            continue
+                        total_weights[j] += weight
+
+                # Average values are normalized, so there is no need to divide by the number of points
+                total_value = sum(total_weights)
+                transform_values = [
+                    (influences[j], weight / total_value) for j, weight in enumerate(total_weights) if weight > 0.0]
+                maya.cmds.skinPercent(skin_cluster_name, last_selected, transformValue=transform_values)
     except Exception:
         out_dict['msg'] = 'Was not possible to average vertex weights: {}'.format(traceback.format_exc())
         maya.cmds.setAttr('{}.envelope'.format(skin_cluster_name), 1)
@@ -627,8 +811,386 @@ def average_vertices_weights(selection, use_distance, curve_weight_points=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def smooth_vertices_weights(components=None, weight=1.0):
+    """
+    Blends the weights of the given vertices towards the average weights of its connected vertices
+    Each mesh vertices are smoothed by a single tpAverageVertexWeights command, so they can be undone in one step
+    :param components: list(str) or None, list of vertices to smooth. If None, selected vertices are used
+    :param weight: float, 0.0 keeps the original weights and 1.0 sets the connected vertices average weights
+    :return: dict
+    """
+
+    out_dict = {'success': False, 'result': list()}
+
+    components = components or maya.cmds.ls(sl=True, flatten=True)
+    components = maya.cmds.polyListComponentConversion(components, toVertex=True) if components else None
+    if not components:
+        out_dict['msg'] = 'Select vertices to smooth weights of'
+        return out_dict
+
+    if not hasattr(maya.cmds, 'tpAverageVertexWeights'):
+        out_dict['msg'] = 'tpAverageVertexWeights command is not loaded'
+        return out_dict
+
+    # Vertices are not flattened, so ranges are sent to the command as they are (pSphere1.vtx[0:20])
+    mesh_components = dict()
+    for component in maya.cmds.ls(components):
+        mesh_components.setdefault(component.split('.')[0], list()).append(component)
+
+    try:
+        for mesh, vertices in mesh_components.items():
+            skin_cluster_name = _find_related_skin_cluster(mesh)
+            if not skin_cluster_name:
+                LOGGER.warning('Mesh "{}" is not skinned. Skipping smooth weights ...'.format(mesh))
+                continue
+            maya.cmds.tpAverageVertexWeights(skinCluster=skin_cluster_name, index=' '.join(vertices), weight=weight)
+            out_dict['result'].append(mesh)
+    except Exception as exc:
+        out_dict['msg'] = 'Was not possible to smooth vertices weights: {}'.format(exc)
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
+
+
+def get_skin_weights(mesh=None, vertex_indices=None, binary=False, precision=32):
+    """
+    Returns the skin weights of the given mesh in sparse (CSR) format
+    :param mesh: str or None, skinned mesh to retrieve weights of. If None, first selected mesh is used
+    :param vertex_indices: list(int) or None, vertices to retrieve weights of. If None, all vertices are returned
+    :param binary: bool, whether to return weights packed in binary format (see core.wireformat) or as lists
+    :param precision: int, bits used to store weight values in binary format (16, 32 or 64)
+    :return: dict
+    """
+
+    out_dict = {'success': False, 'result': None}
+
+    if not skinapi:
+        out_dict['msg'] = 'Retrieving skin weights requires NumPy'
+        return out_dict
+
+    mesh = mesh or (dcc.selected_nodes_of_type('transform') or [None])[0]
+    skin_cluster_name = _find_related_skin_cluster(mesh) if mesh else None
+    if not skin_cluster_name:
+        out_dict['msg'] = 'No skinned mesh to retrieve weights of found.'
+        return out_dict
+
+    try:
+        weights, influence_names = skinapi.get_weights(skin_cluster_name, vertex_indices=vertex_indices)
+        if vertex_indices is None:
+            vertex_indices = numpy.arange(len(weights))
+        offsets, influence_indices, values = skinmath.sparse_weights(weights)
+        if binary:
+            data = wireformat.encode(wireformat.pack_weights(
+                vertex_indices, offsets, influence_indices, values, influence_names,
+                dtype=wireformat.DTYPES[precision // 8]))
+        else:
+            data = {
+                'vertex_indices': numpy.asarray(vertex_indices).tolist(),
+                'offsets': offsets.tolist(),
+                'influence_indices': influence_indices.tolist(),
+                'values': values.tolist(),
+                'influence_names': influence_names
+            }
+        out_dict['result'] = {
+            'mesh': mesh,
+            'skin_cluster': skin_cluster_name,
+            'binary': binary,
+            'data': data
+        }
+    except Exception as exc:
+        out_dict['msg'] = 'Was not possible to retrieve skin weights: {}'.format(exc)
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
+
+
+@transaction.undo
+def set_skin_weights(mesh, data, binary=False):
+    """
+    Sets the skin weights of the given mesh from sparse (CSR) weights
+    :param mesh: str, skinned mesh to set weights of
+    :param data: str or dict, weights packed in binary format (see core.wireformat) or dictionary with lists
+    :param binary: bool, whether given data is packed in binary format or not
+    :return: dict
+    """
+
+    out_dict = {'success': False, 'result': None}
+
+    if not skinapi:
+        out_dict['msg'] = 'Setting skin weights requires NumPy'
+        return out_dict
+
+    skin_cluster_name = _find_related_skin_cluster(mesh) if mesh else None
+    if not skin_cluster_name:
+        out_dict['msg'] = 'No skinned mesh to set weights of found.'
+        return out_dict
+
+    try:
+        weights_data = wireformat.unpack_weights(wireformat.decode(data)) if binary else data
+        influence_indices = meshcache.get_influence_indices(skin_cluster_name)
+        missing_influences = [name for name in weights_data['influence_names'] if name not in influence_indices]
+        if missing_influences:
+            out_dict['msg'] = 'Skin cluster "{}" is not bound to influences: {}'.format(
+                skin_cluster_name, missing_influences)
+            return out_dict
+        influence_map = numpy.array(
+            [influence_indices[name] for name in weights_data['influence_names']], dtype=numpy.int64)
+        weights = skinmath.dequantize_weights(
+            weights_data['offsets'], influence_map[numpy.asarray(weights_data['influence_indices'], dtype=numpy.int64)],
+            weights_data['values'], len(influence_indices))
+        skinapi.set_weights(skin_cluster_name, weights_data['vertex_indices'], weights)
+    except Exception as exc:
+        out_dict['msg'] = 'Was not possible to set skin weights: {}'.format(exc)
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
+
+
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def export_skin_weights(meshes=None, directory=None, precision=32):
+    """
+    Exports the skin weights of the given meshes into the given directory. One sparse weights file is written per mesh
+    :param meshes: list(str) or None, skinned meshes to export weights of. If None, selected meshes are used
+    :param directory: str, directory where weights files are stored
+    :param precision: int, bits used to store weight values (16, 32 or 64)
+    :return: dict
+    """
+
+    out_dict = {'success': False, 'result': list()}
+
+    if not skinapi:
+        out_dict['msg'] = 'Exporting skin weights requires NumPy'
+        return out_dict
+
+    meshes = python.force_list(meshes or dcc.selected_nodes_of_type('transform'))
+    if not meshes or not directory:
+        out_dict['msg'] = 'No meshes or directory to export skin weights into given.'
+        return out_dict
+
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        meshes_data = weightsio.read_index(directory)
+        progress = library.ProgressReporter(len(meshes))
+        for i, mesh in enumerate(meshes):
+            progress.update(i + 1, 'Exporting Skin Weights: {}', mesh)
+            skin_cluster_name = _find_related_skin_cluster(mesh)
+            if not skin_cluster_name:
+                LOGGER.warning('Mesh "{}" is not skinned. Skipping export skin weights ...'.format(mesh))
+                continue
+            weights, influence_names = skinapi.get_weights(skin_cluster_name)
+            offsets, influence_indices, values = skinmath.sparse_weights(weights)
+            file_name = weightsio.get_weights_file_name(mesh)
+            weightsio.write_weights(
+                os.path.join(directory, file_name), numpy.arange(len(weights)), offsets, influence_indices, values,
+                influence_names, dtype=wireformat.DTYPES[precision // 8])
+            meshes_data[mesh] = {
+                'file': file_name,
+                'vertex_count': len(weights),
+                'influences': influence_names
+            }
+            out_dict['result'].append(mesh)
+        weightsio.write_index(directory, meshes_data)
+    except Exception as exc:
+        out_dict['msg'] = 'Was not possible to export skin weights: {}'.format(exc)
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
+
+
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
+def import_skin_weights(meshes=None, directory=None):
+    """
+    Imports the skin weights of the given meshes from the given directory
+    Meshes without skin cluster are bound to the exported influences and missing influences are added to the skin
+    cluster, so weights can be imported after updating a model without changing its topology
+    :param meshes: list(str) or None, meshes to import weights of. If None, all the meshes of the directory are used
+    :param directory: str, directory where weights files are stored
+    :return: dict
+    """
+
+    out_dict = {'success': False, 'result': list()}
+
+    if not skinapi:
+        out_dict['msg'] = 'Importing skin weights requires NumPy'
+        return out_dict
+
+    meshes_data = weightsio.read_index(directory) if directory else dict()
+    meshes = python.force_list(meshes or dcc.selected_nodes_of_type('transform') or sorted(meshes_data.keys()))
+    if not meshes or not meshes_data:
+        out_dict['msg'] = 'No meshes or directory to import skin weights from given.'
+        return out_dict
+
+    try:
+        progress = library.ProgressReporter(len(meshes))
+        for i, mesh in enumerate(meshes):
+            progress.update(i + 1, 'Importing Skin Weights: {}', mesh)
+            mesh_data = meshes_data.get(mesh, None) or meshes_data.get(dcc.node_short_name(mesh), None)
+            if not mesh_data or not maya.cmds.objExists(mesh):
+                LOGGER.warning('No skin weights to import into "{}" found. Skipping ...'.format(mesh))
+                continue
+            weights_data = weightsio.read_weights(os.path.join(directory, mesh_data['file']))
+            vertex_count = maya.cmds.polyEvaluate(mesh, vertex=True)
+            if vertex_count != mesh_data['vertex_count']:
+                LOGGER.warning('Mesh "{}" topology changed ({} vertices, {} exported). Skipping ...'.format(
+                    mesh, vertex_count, mesh_data['vertex_count']))
+                continue
+
+            influence_names = weights_data['influence_names']
+            skin_cluster_name = _bind_influences(mesh, influence_names)
+            influence_indices = meshcache.get_influence_indices(skin_cluster_name)
+
+            # Only influences with weights (in the file or in the skin cluster) are written, so the dense weights
+            # block does not grow with the number of skin cluster influences
+            influence_map = numpy.array([influence_indices[name] for name in influence_names], dtype=numpy.int64)
+            weighted_influences = maya.cmds.skinCluster(skin_cluster_name, query=True, weightedInfluence=True) or list()
+            columns = sorted(
+                set(influence_map[numpy.unique(weights_data['influence_indices'])].tolist()) |
+                set(influence_indices[name] for name in weighted_influences if name in influence_indices))
+            column_map = numpy.zeros(len(influence_indices), dtype=numpy.int64)
+            column_map[columns] = numpy.arange(len(columns))
+            weights = skinmath.dequantize_weights(
+                weights_data['offsets'], column_map[influence_map[weights_data['influence_indices']]],
+                weights_data['values'], len(columns))
+            skinapi.set_weights(
+                skin_cluster_name, weights_data['vertex_indices'], weights,
+                influence_indices=columns)
+            out_dict['result'].append(mesh)
+    except Exception as exc:
+        out_dict['msg'] = 'Was not possible to import skin weights: {}'.format(exc)
+        return out_dict
+
+    out_dict['success'] = True
+
+    return out_dict
+
+
+def _find_related_skin_cluster(node):
+    """
+    Internal function that returns the skin cluster deforming the given node
+    Skin clusters of meshes are cached, so they are not looked for again on each call
+    :param node: str
+    :return: str or None
+    """
+
+    if meshcache:
+        try:
+            return meshcache.find_related_skin_cluster(node)
+        except Exception:
+            pass
+
+    return skin_utils.find_related_skin_cluster(node)
+
+
+def _bind_influences(mesh, influence_names):
+    """
+    Internal function that returns the skin cluster of the given mesh making sure it is bound to the given influences
+    If the mesh is not skinned, it is bound to the given influences. Otherwise, missing influences are added with
+    zero weights
+    :param mesh: str
+    :param influence_names: list(str)
+    :return: str
+    """
+
+    skin_cluster_name = _find_related_skin_cluster(mesh)
+    if not skin_cluster_name:
+        return maya.cmds.skinCluster(
+            influence_names, mesh, toSelectedBones=True, bindMethod=0, normalizeWeights=True)[0]
+
+    influence_indices = meshcache.get_influence_indices(skin_cluster_name)
+    for influence_name in influence_names:
+        if influence_name not in influence_indices:
+            maya.cmds.skinCluster(skin_cluster_name, edit=True, addInfluence=influence_name, weight=0.0)
+
+    return skin_cluster_name
+
+
+def _get_influences_labels(influence_names):
+    """
+    Internal function that returns the side and the label of each one of the given influences
+    Influences that are not joints are considered center influences and joints without label have no side
+    :param influence_names: list(str)
+    :return: tuple(list(int), list), side and label of each influence
+    """
+
+    sides = list()
+    labels = list()
+    for influence_name in influence_names:
+        if not maya.cmds.objectType(influence_name, isAType='joint'):
+            sides.append(symmetry.CENTER_SIDE)
+            labels.append(influence_name)
+            continue
+        label_type = maya.cmds.getAttr('{}.type'.format(influence_name))
+        if not label_type:
+            sides.append(symmetry.NO_SIDE)
+            labels.append(influence_name)
+            continue
+        if label_type == OTHER_JOINT_LABEL_TYPE:
+            label_type = maya.cmds.getAttr('{}.otherType'.format(influence_name))
+        sides.append(maya.cmds.getAttr('{}.side'.format(influence_name)))
+        labels.append(label_type)
+
+    return sides, labels
+
+
+def _interpolate_path_weights(skin_cluster_name, start, end, path, use_distance=True, curve_weight_points=None):
+    """
+    Internal function that interpolates the weights of the given mesh vertices path between the weights of the start
+    and end vertices. Weights are read once, interpolated in a single array operation and written back in a single call
+    :param skin_cluster_name: str
+    :param start: str, start vertex name
+    :param end: str, end vertex name
+    :param path: list(str), ordered list of vertices between start and end vertices
+    :param use_distance: bool, whether to interpolate weights based on the distance along the path or not
+    :param curve_weight_points: list or None, falloff curve points used to remap interpolation percentages
+    """
+
+    start_index = skinapi.get_component_index(start)
+    end_index = skinapi.get_component_index(end)
+    path_indices = [skinapi.get_component_index(vertex) for vertex in path]
+
+    limit_weights, _ = skinapi.get_weights(skin_cluster_name, [start_index, end_index])
+    positions = None
+    if use_distance:
+        positions = skinapi.get_vertex_positions(skin_cluster_name, [start_index] + path_indices + [end_index])
+    percentages = skinmath.path_percentages(len(path_indices), positions=positions)
+    if curve_weight_points:
+        percentages = [bezier.get_data_on_percentage(percentage, curve_weight_points) for percentage in percentages]
+
+    new_weights = skinmath.interpolate_weights(limit_weights[0], limit_weights[1], percentages)
+    skinapi.set_weights(skin_cluster_name, path_indices, new_weights)
+
+
+def _average_weights_into_vertex(skin_cluster_name, source_vertices, target_vertex):
+    """
+    Internal function that sets the normalized average weights of the given source vertices into the target vertex
+    Source weights are read in a single call and target weights are written in a single call
+    :param skin_cluster_name: str
+    :param source_vertices: list(str), list of vertices names to average weights of
+    :param target_vertex: str, name of the vertex to set average weights into
+    """
+
+    source_indices = [skinapi.get_component_index(vertex) for vertex in source_vertices]
+    target_index = skinapi.get_component_index(target_vertex)
+
+    source_weights, _ = skinapi.get_weights(skin_cluster_name, source_indices)
+    average_weights = skinmath.average_weights(source_weights)
+    skinapi.set_weights(skin_cluster_name, [target_index], average_weights.reshape(1, -1))
+
+
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def move_skin_weights(source_joint=None, target_joint=None, mesh=None):
 
     out_dict = {'success': False, 'result': None}
@@ -661,8 +1223,8 @@ def move_skin_weights(source_joint=None, target_joint=None, mesh=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def swap_skin_weights(source_joint=None, target_joint=None, mesh=None):
 
     out_dict = {'success': False, 'result': None}
@@ -695,8 +1257,8 @@ def swap_skin_weights(source_joint=None, target_joint=None, mesh=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def select_influencing_joints(mesh_node=None):
 
     out_dict = {'success': False, 'result': None}
@@ -720,8 +1282,8 @@ def select_influencing_joints(mesh_node=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def select_influence_components(joint_nodes=None, mesh_node=None):
 
     out_dict = {'success': False, 'result': None}
@@ -738,8 +1300,8 @@ def select_influence_components(joint_nodes=None, mesh_node=None):
     return out_dict
 
 
-@decorators.undo
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.undo
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def delete_influences(skinned_objects=None, influences_to_remove=None, fast=True):
     """
     Deletes given influences from given meshes and stores the unbind influences weights into other influences
@@ -760,11 +1322,11 @@ def delete_influences(skinned_objects=None, influences_to_remove=None, fast=True
     return valid_deletion
 
 
-@decorators.undo
+@transaction.undo
 def unbind_influences_quick(skinned_objects=None, influences_to_unbind=None, delete=False):
     """
     Unbind given influences from given meshes and stores the unbind influences weights into other influences
-    The weights reassignation is handled by Maya
+    Unbind influences weights are set to zero and remaining influences weights are normalized
     :param skinned_objects: list(str), meshes which joints need to be removed
     :param influences_to_unbind: list(str), list of joints that need to be unbind
     :param delete: bool, Whether or not to delete unbind influences after unbind process is completed
@@ -783,15 +1345,22 @@ def unbind_influences_quick(skinned_objects=None, influences_to_unbind=None, del
     influences_to_unbind_short = [dcc.node_short_name(joint_node) for joint_node in influences_to_unbind]
 
     skin_clusters = list()
-    skin_percentage = 100.0 / len(skinned_objects)
+    progress = library.ProgressReporter(len(skinned_objects))
 
     for i, skin_object in enumerate(skinned_objects):
 
-        library.Command.progressCommand.emit(skin_percentage * (i + 1), 'Unbinding Influence: {}'.format(i))
+        progress.update(i + 1, 'Unbinding Influence: {}', i)
 
-        skin_cluster_name = skin_utils.find_related_skin_cluster(skin_object)
+        skin_cluster_name = _find_related_skin_cluster(skin_object)
         if not skin_cluster_name:
             continue
+
+        # Bulk path does not need to select influence vertices to modify its weights
+        if skinapi:
+            _remove_influences_weights(skin_cluster_name, influences_to_unbind)
+            skin_clusters.append(skin_cluster_name)
+            continue
+
         joints_attached = maya.cmds.skinCluster(skin_cluster_name, query=True, inf=True)
 
         influence_verts = skin_utils.get_influence_vertices(influences_to_unbind, skin_object)
@@ -810,28 +1379,15 @@ def unbind_influences_quick(skinned_objects=None, influences_to_unbind=None, del
         skin_clusters.append(skin_cluster_name)
 
     for skin_cluster in skin_clusters:
-        joints_attached = maya.cmds.skinCluster(skin_cluster, query=True, inf=True)
-        for jnt in influences_to_unbind_short:
-            if jnt not in joints_attached:
-                continue
-            maya.cmds.skinCluster(skin_cluster, edit=True, removeInfluence=jnt)
+        _remove_influences(skin_cluster, influences_to_unbind_short)
 
     if delete:
-        for joint_to_remove in influences_to_unbind:
-            child_joints = maya.cmds.listRelatives(joint_to_remove, children=True)
-            parent = maya.cmds.listRelatives(joint_to_remove, parent=True)
-            if not child_joints:
-                continue
-            if not parent:
-                maya.cmds.parent(child_joints, world=True)
-                continue
-            maya.cmds.parent(child_joints, parent)
-        maya.cmds.delete(influences_to_unbind)
+        _delete_influences(influences_to_unbind)
 
     return True
 
 
-@decorators.undo
+@transaction.undo
 def unbind_influences(skinned_objects=None, influences_to_unbind=None, delete=False, use_parent=True):
     """
     Unbind given influences from given meshes and stores the unbind influences weights into other influences
@@ -844,6 +1400,14 @@ def unbind_influences(skinned_objects=None, influences_to_unbind=None, delete=Fa
     :return: bool
     """
 
+    if skinapi:
+        unbind_data = read_unbind_influences(
+            skinned_objects=skinned_objects, influences_to_unbind=influences_to_unbind, use_parent=use_parent)
+        if not unbind_data:
+            return False
+        compute_unbind_influences(unbind_data)
+        return write_unbind_influences(unbind_data, delete=delete)
+
     selected_transforms = dcc.selected_nodes_of_type('transform')
     selected_joints = dcc.selected_nodes_of_type('joint')
     influences_to_unbind = influences_to_unbind or selected_joints
@@ -856,79 +1420,349 @@ def unbind_influences(skinned_objects=None, influences_to_unbind=None, delete=Fa
     influences_to_unbind_short = [dcc.node_short_name(joint_node) for joint_node in influences_to_unbind]
 
     skin_clusters = list()
-    skin_percentage = 100.0 / len(skinned_objects)
+    progress = library.ProgressReporter(len(skinned_objects))
+
+    # Spatial indices are built once per skeleton and shared by all the meshes bound to it
+    joint_indices = dict()
 
     for skin_index, skin_object in enumerate(skinned_objects):
-        skin_cluster_name = skin_utils.find_related_skin_cluster(skin_object)
+        skin_cluster_name = _find_related_skin_cluster(skin_object)
         if not skin_cluster_name:
             continue
         joints_attached = maya.cmds.skinCluster(skin_cluster_name, query=True, inf=True)
+        target_joints = _find_unbind_target_joints(
+            influences_to_unbind, joints_attached, use_parent=use_parent, joint_indices=joint_indices)
 
-        if not use_parent:
-            for joint_to_remove in influences_to_unbind_short:
-                if joint_to_remove in joints_attached:
-                    joints_attached.remove(joint_to_remove)
+        joint_progress = progress.sub_task(skin_index, skin_index + 1, total=len(influences_to_unbind))
+        for joint_index, jnt in enumerate(influences_to_unbind):
+            move_skin_weights(jnt, target_joints[jnt], skin_object)
 
-        source_positions = list()
-        source_joints = list()
-        for joint_attached in joints_attached:
-            pos = maya.cmds.xform(joint_attached, query=True, worldSpace=True, t=True)
-            source_positions.append(pos)
-            source_joints.append([joint_attached, pos])
+            joint_progress.update(joint_index + 1, 'Unbinding Influence: {}', jnt)
 
-        source_kdtree = kdtree.KDTree.construct_from_data(source_positions)
+        skin_clusters.append(skin_cluster_name)
 
-        joint_percentage = skin_percentage / len(influences_to_unbind)
-        for joint_index, jnt in enumerate(influences_to_unbind):
-            jnt1 = jnt
-            if use_parent:
-                jnt2 = maya.cmds.listRelatives(jnt, parent=True)
-                jnt2 = jnt2[0] if jnt2 else None
-                if jnt2 is None:
-                    remove_pos = maya.cmds.xform(jnt, query=True, worldSpace=True, t=True)
-                    points = source_kdtree.query(query_point=remove_pos, t=1)
-                    for index, position in enumerate(source_joints):
-                        if position[1] != points[0]:
-                            continue
-                        jnt2 = position[0]
-            else:
-                remove_pos = maya.cmds.xform(jnt, query=True, worldSpace=True, t=True)
-                points = source_kdtree.query(query_point=remove_pos, t=True)
-                for index, position in enumerate(source_joints):
-                    if position[1] != points[0]:
-                        continue
-                    jnt2 = position[0]
+    for skin_cluster in skin_clusters:
+        _remove_influences(skin_cluster, influences_to_unbind_short)
+
+    if delete:
+        _delete_influences(influences_to_unbind)
+
+    return True
+
+
+def read_unbind_influences(skinned_objects=None, influences_to_unbind=None, use_parent=True):
+    """
+    Reads the data needed to unbind given influences from given meshes. Scene is not modified
+    Unbind is done in three steps: read (Maya main thread), compute (any thread) and write (Maya main thread)
+    :param skinned_objects: list(str), meshes which joints need to be removed
+    :param influences_to_unbind: list(str), list of joints that need to be unbind
+    :param use_parent: bool, If True, removed influences weights will be stored on its parent; if False it will look
+        for the closest joint using a point cloud system
+    :return: dict or None, unbind data or None if there is nothing to unbind
+    """
+
+    selected_transforms = dcc.selected_nodes_of_type('transform')
+    selected_joints = dcc.selected_nodes_of_type('joint')
+    influences_to_unbind = influences_to_unbind or selected_joints
+    if not skinned_objects:
+        skinned_objects = [xform for xform in selected_transforms if xform not in selected_joints]
+    if not skinned_objects or not influences_to_unbind:
+        return None
+    skinned_objects = python.force_list(skinned_objects)
+    influences_to_unbind = python.force_list(influences_to_unbind)
 
-            move_skin_weights(jnt1, jnt2, skin_object)
+    skin_clusters = list()
+    skin_weights = list()
+    progress = library.ProgressReporter(len(skinned_objects))
 
-            library.Command.progressCommand.emit(
-                ((joint_index + 1) * joint_percentage) + (skin_index * skin_percentage), 'Unbinding Influence: {}')
+    # Spatial indices are built once per skeleton and shared by all the meshes bound to it
+    joint_indices = dict()
 
+    for skin_index, skin_object in enumerate(skinned_objects):
+        progress.update(skin_index + 1, 'Reading Influences Weights: {}', skin_object)
+        skin_cluster_name = _find_related_skin_cluster(skin_object)
+        if not skin_cluster_name:
+            continue
+        joints_attached = maya.cmds.skinCluster(skin_cluster_name, query=True, inf=True)
+        target_joints = _find_unbind_target_joints(
+            influences_to_unbind, joints_attached, use_parent=use_parent, joint_indices=joint_indices)
+        weights_data = _read_unbind_weights(skin_cluster_name, target_joints)
+        if weights_data:
+            skin_weights.append(weights_data)
         skin_clusters.append(skin_cluster_name)
 
-    for skin_cluster in skin_clusters:
-        joints_attached = maya.cmds.skinCluster(skin_cluster, query=True, inf=True)
-        for jnt in influences_to_unbind_short:
-            if jnt not in joints_attached:
-                continue
-            maya.cmds.skinCluster(skin_cluster, edit=True, removeInfluence=jnt)
+    return {
+        'influences_to_unbind': influences_to_unbind,
+        'skin_clusters': skin_clusters,
+        'skin_weights': skin_weights
+    }
+
+
+def compute_unbind_influences(unbind_data):
+    """
+    Computes the weights of the meshes once the influences are unbind. Scene is not accessed, so this function can be
+    executed outside Maya main thread
+    :param unbind_data: dict, unbind data returned by read_unbind_influences function
+    :return: dict, given unbind data
+    """
+
+    for weights_data in unbind_data['skin_weights']:
+        _compute_unbind_weights(weights_data)
+
+    return unbind_data
+
+
+@transaction.undo
+def write_unbind_influences(unbind_data, delete=False):
+    """
+    Writes the weights computed by compute_unbind_influences function and removes the unbind influences from the skin
+    clusters. All the modifications are done within a single undo chunk
+    :param unbind_data: dict, unbind data processed by compute_unbind_influences function
+    :param delete: bool, Whether or not to delete unbind influences after unbind process is completed
+    :return: bool
+    """
+
+    influences_to_unbind = unbind_data['influences_to_unbind']
+    influences_to_unbind_short = [dcc.node_short_name(joint_node) for joint_node in influences_to_unbind]
+
+    progress = library.ProgressReporter(len(unbind_data['skin_weights']))
+    for skin_index, weights_data in enumerate(unbind_data['skin_weights']):
+        progress.update(skin_index + 1, 'Unbinding Influences: {}', weights_data['skin_cluster'])
+        _write_unbind_weights(weights_data)
+
+    for skin_cluster in unbind_data['skin_clusters']:
+        _remove_influences(skin_cluster, influences_to_unbind_short)
 
     if delete:
-        for joint_to_remove in influences_to_unbind:
-            child_joints = maya.cmds.listRelatives(joint_to_remove, children=True)
-            parent = maya.cmds.listRelatives(joint_to_remove, parent=True)
-            if not child_joints:
-                continue
-            if not parent:
-                maya.cmds.parent(child_joints, world=True)
-                continue
-            maya.cmds.parent(child_joints, parent)
-        maya.cmds.delete(influences_to_unbind)
+        _delete_influences(influences_to_unbind)
 
     return True
 
 
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+def _delete_influences(influences):
+    """
+    Internal function that deletes given influences, reparenting its children to its parent
+    :param influences: list(str)
+    """
+
+    for joint_to_remove in influences:
+        child_joints = maya.cmds.listRelatives(joint_to_remove, children=True)
+        parent = maya.cmds.listRelatives(joint_to_remove, parent=True)
+        if not child_joints:
+            continue
+        if not parent:
+            maya.cmds.parent(child_joints, world=True)
+            continue
+        maya.cmds.parent(child_joints, parent)
+    maya.cmds.delete(influences)
+
+
+def _find_unused_influences(skin_cluster_name, tolerance=1e-6):
+    """
+    Internal function that returns the influences of the given skin cluster whose weights sum is lower or equal than
+    the given tolerance. At least one influence is always kept
+    :param skin_cluster_name: str
+    :param tolerance: float
+    :return: list(str)
+    """
+
+    if skinapi:
+        weights, influence_names = skinapi.get_weights(skin_cluster_name)
+        unused = weights.sum(axis=0) <= tolerance
+        if unused.all():
+            unused[0] = False
+        return [influence_names[i] for i in numpy.flatnonzero(unused)]
+
+    attached_influences = maya.cmds.skinCluster(skin_cluster_name, query=True, influence=True) or list()
+    weighted_influences = set(maya.cmds.skinCluster(skin_cluster_name, query=True, weightedInfluence=True) or list())
+    unused_influences = [influence for influence in attached_influences if influence not in weighted_influences]
+    if len(unused_influences) == len(attached_influences):
+        unused_influences = unused_influences[1:]
+
+    return unused_influences
+
+
+def _remove_influences(skin_cluster_name, influences):
+    """
+    Internal function that removes the given influences from the given skin cluster in a single edit
+    :param skin_cluster_name: str
+    :param influences: list(str), influences to remove. Influences not bound to the skin cluster are ignored
+    """
+
+    joints_attached = maya.cmds.skinCluster(skin_cluster_name, query=True, inf=True)
+    influences_to_remove = [jnt for jnt in influences if jnt in joints_attached]
+    if not influences_to_remove:
+        return
+
+    maya.cmds.skinCluster(skin_cluster_name, edit=True, removeInfluence=influences_to_remove)
+
+
+def _remove_influences_weights(skin_cluster_name, influences):
+    """
+    Internal function that sets the weights of the given influences to zero and normalizes remaining weights
+    Weights of the vertices influenced by the given influences are read once, modified in memory and written back in
+    a single call, without selecting any component. Vertices only weighted to the given influences receive its
+    weights in the parent joint of each influence (if it is bound) or in the closest remaining influence
+    :param skin_cluster_name: str
+    :param influences: list(str), influences to remove weights of
+    """
+
+    influence_indices = meshcache.get_influence_indices(skin_cluster_name, full_path=True)
+    long_names = [maya.cmds.ls(jnt, long=True)[0] for jnt in influences]
+    columns = [influence_indices[long_name] for long_name in long_names if long_name in influence_indices]
+    if not columns:
+        return
+
+    influence_weights, _ = skinapi.get_weights(skin_cluster_name, influence_indices=columns)
+    vertex_indices = numpy.flatnonzero(influence_weights.sum(axis=1) > 0.0)
+    if not len(vertex_indices):
+        return
+
+    influences = [jnt for jnt, long_name in zip(influences, long_names) if long_name in influence_indices]
+    joints_attached = maya.cmds.skinCluster(skin_cluster_name, query=True, inf=True)
+    target_joints = _find_unbind_target_joints(influences, joints_attached)
+    unbound_parents = [
+        jnt for jnt in influences if maya.cmds.ls(target_joints[jnt], long=True)[0] not in influence_indices]
+    if unbound_parents:
+        target_joints.update(_find_unbind_target_joints(unbound_parents, joints_attached, use_parent=False))
+    fallback_columns = [influence_indices[maya.cmds.ls(target_joints[jnt], long=True)[0]] for jnt in influences]
+
+    weights, _ = skinapi.get_weights(skin_cluster_name, vertex_indices=vertex_indices)
+    skinapi.set_weights(
+        skin_cluster_name, vertex_indices, skinmath.remove_weights(weights, columns, fallback_columns))
+
+
+def _find_unbind_target_joints(influences_to_unbind, joints_attached, use_parent=True, joint_indices=None):
+    """
+    Internal function that returns the joints that will receive the weights of the influences to unbind
+    Influences are resolved to its parent joint (if use_parent is True) or to the closest attached joint. Closest joints
+    are queried in a single batch against a spatial index built over the attached joints that are not being unbind
+    :param influences_to_unbind: list(str), list of joints that need to be unbind
+    :param joints_attached: list(str), influences of the skin cluster
+    :param use_parent: bool, whether to move weights to the parent joint (if any) or to the closest joint
+    :param joint_indices: dict or None, spatial indices cache, keyed by skeleton joints, shared between calls
+    :return: dict(str, str), dictionary that maps each influence to unbind with its target joint
+    """
+
+    joint_indices = joint_indices if joint_indices is not None else dict()
+    influences_to_unbind_short = [dcc.node_short_name(joint_node) for joint_node in influences_to_unbind]
+
+    target_joints = dict()
+    closest_joints = list()
+    for jnt in influences_to_unbind:
+        # Weights are moved to the first parent that is not being unbind
+        parent = maya.cmds.listRelatives(jnt, parent=True) if use_parent else None
+        while parent and dcc.node_short_name(parent[0]) in influences_to_unbind_short:
+            parent = maya.cmds.listRelatives(parent[0], parent=True)
+        if parent:
+            target_joints[jnt] = parent[0]
+        else:
+            closest_joints.append(jnt)
+    if not closest_joints:
+        return target_joints
+
+    skeleton_joints = tuple(sorted(
+        joint_attached for joint_attached in joints_attached if joint_attached not in influences_to_unbind_short))
+    if not skeleton_joints:
+        raise RuntimeError('No joints left to move unbind influences weights to')
+    remove_positions = [maya.cmds.xform(jnt, query=True, worldSpace=True, t=True) for jnt in closest_joints]
+
+    skeleton_index = joint_indices.get(skeleton_joints)
+    if skeleton_index is None:
+        skeleton_positions = [maya.cmds.xform(jnt, query=True, worldSpace=True, t=True) for jnt in skeleton_joints]
+        if spatial:
+            skeleton_index = spatial.PointIndex(skeleton_positions)
+        else:
+            skeleton_index = (
+                kdtree.KDTree.construct_from_data(skeleton_positions),
+                dict((tuple(position), i) for i, position in enumerate(skeleton_positions)))
+        joint_indices[skeleton_joints] = skeleton_index
+
+    if spatial:
+        _, indices = skeleton_index.query(remove_positions)
+    else:
+        tree, position_indices = skeleton_index
+        indices = [position_indices[tuple(tree.query(query_point=pos, t=1)[0])] for pos in remove_positions]
+
+    for jnt, index in zip(closest_joints, indices):
+        target_joints[jnt] = skeleton_joints[index]
+
+    return target_joints
+
+
+def _read_unbind_weights(skin_cluster_name, target_joints):
+    """
+    Internal function that reads the weights needed to move the weights of the given influences into its target joints
+    Only the weights of the moved and receiving influences of the vertices weighted to the moved influences are read
+    :param skin_cluster_name: str
+    :param target_joints: dict(str, str), dictionary that maps each influence to move weights of with its target joint
+    :return: dict or None, unbind data of the skin cluster or None if there are no weights to move
+    """
+
+    influence_indices = meshcache.get_influence_indices(skin_cluster_name, full_path=True)
+    source_names = [maya.cmds.ls(jnt, long=True)[0] for jnt in target_joints]
+    target_names = [maya.cmds.ls(target_joints[jnt], long=True)[0] for jnt in target_joints]
+    moved = [i for i, source_name in enumerate(source_names) if source_name in influence_indices]
+    if not moved:
+        return None
+    source_names = [source_names[i] for i in moved]
+    target_names = [target_names[i] for i in moved]
+
+    # Target joints not bound to the skin cluster yet are read as columns without weights
+    influences = sorted(set(source_names + target_names))
+    bound_columns = [column for column, name in enumerate(influences) if name in influence_indices]
+    bound_weights, _ = skinapi.get_weights(
+        skin_cluster_name, influence_indices=[influence_indices[influences[column]] for column in bound_columns])
+    source_columns = [influences.index(name) for name in source_names]
+    vertex_indices = numpy.flatnonzero(bound_weights[:, [bound_columns.index(c) for c in source_columns]].sum(axis=1))
+    if not len(vertex_indices):
+        return None
+
+    weights = numpy.zeros((len(vertex_indices), len(influences)), dtype=numpy.float64)
+    weights[:, bound_columns] = bound_weights[vertex_indices]
+
+    return {
+        'skin_cluster': skin_cluster_name,
+        'influences': influences,
+        'vertex_indices': vertex_indices,
+        'weights': weights,
+        'source_columns': source_columns,
+        'target_columns': [influences.index(name) for name in target_names],
+        'new_weights': None
+    }
+
+
+def _compute_unbind_weights(unbind_data):
+    """
+    Internal function that moves the weights of the unbind influences into its target joints in a single array
+    operation. It does not access the scene, so it can be executed outside Maya main thread
+    :param unbind_data: dict, unbind data returned by _read_unbind_weights
+    """
+
+    unbind_data['new_weights'] = skinmath.move_weights(
+        unbind_data['weights'], unbind_data['source_columns'], unbind_data['target_columns'])
+
+
+def _write_unbind_weights(unbind_data):
+    """
+    Internal function that writes the computed unbind weights in a single call
+    Target joints not bound to the skin cluster are added without weights before writing
+    :param unbind_data: dict, unbind data processed by _compute_unbind_weights
+    """
+
+    skin_cluster_name = unbind_data['skin_cluster']
+    influence_indices = meshcache.get_influence_indices(skin_cluster_name, full_path=True)
+    for influence_name in unbind_data['influences']:
+        if influence_name not in influence_indices:
+            maya.cmds.skinCluster(skin_cluster_name, edit=True, addInfluence=influence_name, weight=0.0)
+    influence_indices = meshcache.get_influence_indices(skin_cluster_name, full_path=True)
+
+    skinapi.set_weights(
+        skin_cluster_name, unbind_data['vertex_indices'], unbind_data['new_weights'],
+        influence_indices=[influence_indices[influence_name] for influence_name in unbind_data['influences']])
+
+
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def br_smooth_weights():
     """
     Executes Brave Rabbit Smooth Weights command if available
@@ -943,7 +1777,7 @@ def br_smooth_weights():
     return True
 
 
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def br_smooth_weights_options():
     """
     Opens Brave Rabbit Smooth Weights tool if available
@@ -958,7 +1792,7 @@ def br_smooth_weights_options():
     return True
 
 
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def br_transfer_weights():
     """
     Executes Brave Rabbit Transfer Weights command if available
@@ -976,7 +1810,7 @@ def br_transfer_weights():
     return True
 
 
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def br_transfer_weights_options():
     """
     Opens Brave Rabbit Transfer Weights tool if available
@@ -995,7 +1829,7 @@ def br_transfer_weights_options():
     return True
 
 
-@decorators.repeat_static_command(__name__, skip_arguments=True)
+@transaction.repeat_static_command(__name__, skip_arguments=True)
 def ng_skin_tools():
     """
     Opens ngSkinTools tool if available
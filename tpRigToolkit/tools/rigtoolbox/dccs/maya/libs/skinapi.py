@@ -0,0 +1,184 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to read and write skin weights blocks through Maya API 2.0
+Weights are returned as (vertices x influences) NumPy arrays, so they can be processed with a single array operation
+and written back with a single MFnSkinCluster.setWeights call
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import numpy
+
+from maya.api import OpenMaya, OpenMayaAnim
+
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import apiundo
+
+
+def get_skin_cluster_fn(skin_cluster_name):
+    """
+    Returns MFnSkinCluster of the given skin cluster node
+    :param skin_cluster_name: str
+    :return: OpenMayaAnim.MFnSkinCluster
+    """
+
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add(skin_cluster_name)
+
+    return OpenMayaAnim.MFnSkinCluster(selection_list.getDependNode(0))
+
+
+def get_shape_path(skin_fn):
+    """
+    Returns the DAG path of the shape deformed by the given skin cluster
+    :param skin_fn: OpenMayaAnim.MFnSkinCluster
+    :return: OpenMaya.MDagPath
+    """
+
+    output_geometry = skin_fn.getOutputGeometry()
+    if not len(output_geometry):
+        raise RuntimeError('Skin cluster "{}" is not deforming any geometry'.format(skin_fn.name()))
+
+    return OpenMaya.MDagPath.getAPathTo(output_geometry[0])
+
+
+def get_influence_names(skin_cluster_name):
+    """
+    Returns the names of the influences of the given skin cluster sorted by its influence index
+    :param skin_cluster_name: str
+    :return: list(str)
+    """
+
+    skin_fn = get_skin_cluster_fn(skin_cluster_name)
+
+    return [influence_path.partialPathName() for influence_path in skin_fn.influenceObjects()]
+
+
+def get_component_index(component_name):
+    """
+    Returns the index of the given single indexed component name
+    :param component_name: str, component name (pCube1.vtx[4])
+    :return: int
+    """
+
+    return int(component_name.split('[')[-1].split(']')[0])
+
+
+def create_vertex_component(vertex_indices=None, num_vertices=None):
+    """
+    Creates a mesh vertex component with the given vertex indices
+    :param vertex_indices: list(int) or None, if None, a complete component with num_vertices is created
+    :param num_vertices: int, total number of vertices of the mesh, used when no vertex indices are given
+    :return: tuple(OpenMaya.MObject, numpy.array), component and its element indices (in component order)
+    """
+
+    component_fn = OpenMaya.MFnSingleIndexedComponent()
+    component = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    if vertex_indices is None:
+        component_fn.setCompleteData(num_vertices)
+        elements = numpy.arange(num_vertices, dtype=numpy.int64)
+    else:
+        component_fn.addElements([int(index) for index in vertex_indices])
+        elements = numpy.array(component_fn.getElements(), dtype=numpy.int64)
+
+    return component, elements
+
+
+def get_weights(skin_cluster_name, vertex_indices=None, influence_indices=None):
+    """
+    Returns the weights of the given vertices reading the full weights block in a single call
+    :param skin_cluster_name: str
+    :param vertex_indices: list(int) or None, vertices to retrieve weights of. If None, all vertices are returned
+    :param influence_indices: list(int) or None, influences to retrieve weights of. If None, all influences are returned
+    :return: tuple(numpy.array, list(str)), (vertices x influences) weights array, with rows sorted in the same order
+        as the given vertex indices, and the names of the influences
+    """
+
+    skin_fn = get_skin_cluster_fn(skin_cluster_name)
+    shape_path = get_shape_path(skin_fn)
+    influence_names = [influence_path.partialPathName() for influence_path in skin_fn.influenceObjects()]
+
+    if vertex_indices is None:
+        num_vertices = OpenMaya.MFnMesh(shape_path).numVertices
+        component, elements = create_vertex_component(num_vertices=num_vertices)
+    else:
+        vertex_indices = numpy.asarray(vertex_indices, dtype=numpy.int64)
+        component, elements = create_vertex_component(numpy.unique(vertex_indices))
+
+    if influence_indices is None:
+        flat_weights, num_influences = skin_fn.getWeights(shape_path, component)
+    else:
+        influence_indices = [int(index) for index in influence_indices]
+        influence_names = [influence_names[index] for index in influence_indices]
+        flat_weights = skin_fn.getWeights(shape_path, component, OpenMaya.MIntArray(influence_indices))
+        num_influences = len(influence_indices)
+    weights = numpy.array(flat_weights, dtype=numpy.float64).reshape(-1, num_influences)
+    if vertex_indices is None:
+        return weights, influence_names
+
+    # Components do not keep elements order, so we reorder rows to match the order of the given vertex indices
+    sort_order = numpy.argsort(elements)
+    rows = sort_order[numpy.searchsorted(elements, vertex_indices, sorter=sort_order)]
+
+    return weights[rows], influence_names
+
+
+def set_weights(skin_cluster_name, vertex_indices, weights, influence_indices=None, normalize=False):
+    """
+    Writes given weights block in a single MFnSkinCluster.setWeights call
+    The modification is registered into Maya undo queue through tpApiUndo command
+    :param skin_cluster_name: str
+    :param vertex_indices: list(int), vertices to set weights of (one per weights row)
+    :param weights: numpy.array, (vertices x influences) weights array
+    :param influence_indices: list(int) or None, influences indices weights columns belong to. If None, weights
+        are expected to contain all skin cluster influences
+    :param normalize: bool, whether or not skin cluster should normalize weights after setting them
+    :return: bool, True if the modification was registered into Maya undo queue; False otherwise
+    """
+
+    skin_fn = get_skin_cluster_fn(skin_cluster_name)
+    shape_path = get_shape_path(skin_fn)
+
+    weights = numpy.asarray(weights, dtype=numpy.float64)
+    vertex_indices = numpy.asarray(vertex_indices, dtype=numpy.int64)
+    if influence_indices is None:
+        influence_indices = range(len(skin_fn.influenceObjects()))
+    influence_indices = [int(index) for index in influence_indices]
+    if weights.shape != (len(vertex_indices), len(influence_indices)):
+        raise ValueError('Weights shape {} does not match the number of vertices ({}) and influences ({})'.format(
+            weights.shape, len(vertex_indices), len(influence_indices)))
+
+    # Components do not keep elements order, so we reorder rows to match component order
+    component, elements = create_vertex_component(vertex_indices)
+    sort_order = numpy.argsort(vertex_indices)
+    rows = sort_order[numpy.searchsorted(vertex_indices, elements, sorter=sort_order)]
+
+    influences_array = OpenMaya.MIntArray(influence_indices)
+    weights_array = OpenMaya.MDoubleArray(weights[rows].ravel().tolist())
+    old_weights = dict()
+
+    def _redo():
+        old_weights['weights'] = skin_fn.setWeights(
+            shape_path, component, influences_array, weights_array, normalize, True)
+
+    def _undo():
+        skin_fn.setWeights(shape_path, component, influences_array, old_weights['weights'], False)
+
+    return apiundo.commit(_undo, _redo)
+
+
+def get_vertex_positions(skin_cluster_name, vertex_indices):
+    """
+    Returns world space positions of the given vertices of the geometry deformed by the given skin cluster
+    :param skin_cluster_name: str
+    :param vertex_indices: list(int)
+    :return: numpy.array, (vertices x 3) array of positions
+    """
+
+    skin_fn = get_skin_cluster_fn(skin_cluster_name)
+    shape_path = get_shape_path(skin_fn)
+    points = OpenMaya.MFnMesh(shape_path).getPoints(OpenMaya.MSpace.kWorld)
+
+    return numpy.array(
+        [(points[index].x, points[index].y, points[index].z) for index in vertex_indices], dtype=numpy.float64)
@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains undo transactions used by rig toolbox library functions
+Only the outermost transaction opens a Maya undo chunk, so library functions that call each other (or that are
+executed many times within a single client request) do not create nested undo chunks nor repeat last registrations.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import functools
+import contextlib
+
+import maya.cmds
+
+from tpDcc.dccs.maya.core import decorators
+
+# Number of transactions currently opened
+_TRANSACTION_DEPTH = 0
+
+# Number of repeatable library functions currently running
+_REPEAT_DEPTH = 0
+
+
+def is_active():
+    """
+    Returns whether or not a transaction is currently opened
+    :return: bool
+    """
+
+    return _TRANSACTION_DEPTH > 0
+
+
+@contextlib.contextmanager
+def transaction(name=None):
+    """
+    Context manager that groups all the modifications done within it into a single undo chunk
+    Nested transactions are merged into the outermost one
+    :param name: str or None, name of the undo chunk. Only used by the outermost transaction
+    """
+
+    global _TRANSACTION_DEPTH
+
+    if _TRANSACTION_DEPTH == 0:
+        if name:
+            maya.cmds.undoInfo(openChunk=True, chunkName=name)
+        else:
+            maya.cmds.undoInfo(openChunk=True)
+    _TRANSACTION_DEPTH += 1
+    try:
+        yield
+    finally:
+        _TRANSACTION_DEPTH -= 1
+        if _TRANSACTION_DEPTH == 0:
+            maya.cmds.undoInfo(closeChunk=True)
+
+
+def undo(fn):
+    """
+    Decorator that executes the decorated function within a transaction
+    """
+
+    @functools.wraps(fn)
+    def _undo(*args, **kwargs):
+        with transaction(fn.__name__):
+            return fn(*args, **kwargs)
+
+    return _undo
+
+
+def repeat_static_command(class_name, skip_arguments=False):
+    """
+    Decorator that registers the decorated function as Maya repeat last command
+    Functions called by other repeatable functions are not registered, so only the top level call can be repeated
+    :param class_name: str, name of the module the decorated function belongs to
+    :param skip_arguments: bool, whether or not to repeat the function without its arguments
+    """
+
+    def wrapper(fn):
+        repeat_fn = decorators.repeat_static_command(class_name, skip_arguments=skip_arguments)(fn)
+
+        @functools.wraps(fn)
+        def _repeat(*args, **kwargs):
+            global _REPEAT_DEPTH
+
+            if _REPEAT_DEPTH > 0:
+                return fn(*args, **kwargs)
+
+            _REPEAT_DEPTH += 1
+            try:
+                return repeat_fn(*args, **kwargs)
+            finally:
+                _REPEAT_DEPTH -= 1
+
+        return _repeat
+
+    return wrapper
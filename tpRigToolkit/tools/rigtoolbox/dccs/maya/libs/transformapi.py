@@ -0,0 +1,188 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to modify attributes of many transform nodes at once through Maya API 2.0
+Nodes are resolved with a single selection list and all modifications are registered as a single undo step
+"""
+
+from __future__ import print_function, division, absolute_import
+
+from maya.api import OpenMaya
+
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import apiundo
+
+TRANSLATE_ATTRIBUTES = ('translateX', 'translateY', 'translateZ')
+ROTATE_ATTRIBUTES = ('rotateX', 'rotateY', 'rotateZ')
+SCALE_ATTRIBUTES = ('scaleX', 'scaleY', 'scaleZ')
+VISIBILITY_ATTRIBUTES = ('visibility',)
+TRANSFORM_ATTRIBUTES = TRANSLATE_ATTRIBUTES + ROTATE_ATTRIBUTES + SCALE_ATTRIBUTES
+
+# Values that differ less than this tolerance from current ones are not set
+VALUE_TOLERANCE = 1e-9
+
+# Pivot attributes that are not taken into account when computing local values from a world matrix
+PIVOT_ATTRIBUTES = ('rotatePivot', 'scalePivot', 'rotatePivotTranslate', 'scalePivotTranslate')
+
+
+def get_plugs(nodes, attributes):
+    """
+    Returns the plugs of the given attributes of all the given nodes
+    :param nodes: list(str)
+    :param attributes: list(str)
+    :return: tuple(list(bool), list(OpenMaya.MPlug)), status of each node (False if the node does not exist or if it
+        has not all the given attributes) and plugs of all the valid nodes
+    """
+
+    status = list()
+    plugs = list()
+    for node in nodes:
+        selection_list = OpenMaya.MSelectionList()
+        try:
+            selection_list.add(node)
+            node_fn = OpenMaya.MFnDependencyNode(selection_list.getDependNode(0))
+            node_plugs = [node_fn.findPlug(attribute, False) for attribute in attributes]
+        except RuntimeError:
+            status.append(False)
+            continue
+        status.append(True)
+        plugs.extend(node_plugs)
+
+    return status, plugs
+
+
+def set_locked(nodes, attributes, lock=True):
+    """
+    Locks or unlocks the given attributes of all the given nodes within a single undo step
+    :param nodes: list(str)
+    :param attributes: list(str)
+    :param lock: bool
+    :return: list(bool), status of each node. False if the node does not exist or if it has not all the given
+        attributes
+    """
+
+    status, plugs = get_plugs(nodes, attributes)
+    plugs = [plug for plug in plugs if plug.isLocked != lock]
+    if not plugs:
+        return status
+
+    def _redo():
+        for plug in plugs:
+            plug.isLocked = lock
+
+    def _undo():
+        for plug in plugs:
+            plug.isLocked = not lock
+
+    apiundo.commit(_undo, _redo)
+
+    return status
+
+
+def get_dag_paths(nodes):
+    """
+    Returns DAG paths of the given nodes
+    :param nodes: list(str)
+    :return: list(OpenMaya.MDagPath)
+    """
+
+    dag_paths = list()
+    for node in nodes:
+        # Selection list merges duplicated items, so each node is resolved separately to keep nodes order
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(node)
+        dag_paths.append(selection_list.getDagPath(0))
+
+    return dag_paths
+
+
+def get_world_matrices(nodes):
+    """
+    Returns world matrices of the given nodes
+    :param nodes: list(str)
+    :return: list(list(float)), flattened 4x4 world matrix of each node
+    """
+
+    return [list(dag_path.inclusiveMatrix()) for dag_path in get_dag_paths(nodes)]
+
+
+def get_match_data(nodes):
+    """
+    Returns the data needed to compute the local transform values that match a world matrix
+    :param nodes: list(str)
+    :return: dict, dictionary with parent_inverse_matrices, rotate_orders, rotate_axes, joints, inverse_scales and
+        pivots lists. Pivots stores whether each node has non-zero pivots, so its local values cannot be computed
+        from its world matrix
+    """
+
+    match_data = {
+        'parent_inverse_matrices': list(),
+        'rotate_orders': list(),
+        'rotate_axes': list(),
+        'joints': list(),
+        'inverse_scales': list(),
+        'pivots': list()
+    }
+    for dag_path in get_dag_paths(nodes):
+        transform_fn = OpenMaya.MFnTransform(dag_path)
+        is_joint = dag_path.hasFn(OpenMaya.MFn.kJoint)
+        inverse_scale = [1.0, 1.0, 1.0]
+        if is_joint and transform_fn.findPlug('segmentScaleCompensate', False).asBool():
+            inverse_scale_plug = transform_fn.findPlug('inverseScale', False)
+            inverse_scale = [inverse_scale_plug.child(i).asDouble() for i in range(3)]
+        rotate_axis = transform_fn.findPlug('rotateAxis', False)
+        match_data['parent_inverse_matrices'].append(list(dag_path.exclusiveMatrixInverse()))
+        match_data['rotate_orders'].append(transform_fn.findPlug('rotateOrder', False).asInt())
+        match_data['rotate_axes'].append([rotate_axis.child(i).asDouble() for i in range(3)])
+        match_data['joints'].append(is_joint)
+        match_data['inverse_scales'].append(inverse_scale)
+        match_data['pivots'].append(_has_pivots(transform_fn))
+
+    return match_data
+
+
+def _has_pivots(transform_fn):
+    """
+    Internal function that returns whether any pivot of the given transform is not zero
+    :param transform_fn: OpenMaya.MFnTransform
+    :return: bool
+    """
+
+    for attribute in PIVOT_ATTRIBUTES:
+        plug = transform_fn.findPlug(attribute, False)
+        if any(abs(plug.child(i).asDouble()) > VALUE_TOLERANCE for i in range(3)):
+            return True
+
+    return False
+
+
+def set_values(nodes, values):
+    """
+    Sets the values of the given compound attributes of all the given nodes within a single undo step
+    Only values that differ from current ones are modified, so undo only stores the attributes that changed
+    :param nodes: list(str)
+    :param values: dict(str, list), dictionary that maps compound attribute names (such as translate or jointOrient)
+        with the list of values of each node. Angles are expressed in radians
+    :return: int, number of modified attributes
+    """
+
+    num_modified = 0
+    modifier = OpenMaya.MDGModifier()
+    for node_index, dag_path in enumerate(get_dag_paths(nodes)):
+        node_fn = OpenMaya.MFnDependencyNode(dag_path.node())
+        for attribute_name, attribute_values in values.items():
+            node_values = attribute_values[node_index]
+            if node_values is None:
+                continue
+            plug = node_fn.findPlug(attribute_name, False)
+            for i, value in enumerate(node_values):
+                child_plug = plug.child(i)
+                if abs(child_plug.asDouble() - value) <= VALUE_TOLERANCE:
+                    continue
+                modifier.newPlugValueDouble(child_plug, float(value))
+                num_modified += 1
+
+    if num_modified:
+        apiundo.commit(modifier.undoIt, modifier.doIt)
+
+    return num_modified
@@ -0,0 +1,72 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains API Undo Maya plugin implementation
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+
+from maya.api import OpenMaya as OpenMaya
+
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import apiundo
+
+
+def maya_useNewAPI():
+    pass
+
+
+class ApiUndoCommand(OpenMaya.MPxCommand):
+
+    commandName = apiundo.COMMAND_NAME
+
+    def __init__(self):
+        super(ApiUndoCommand, self).__init__()
+
+        self._undo = None
+        self._redo = None
+
+    @classmethod
+    def command_creator(cls):
+        return ApiUndoCommand()
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, args):
+        pending = apiundo.pop_pending()
+        if not pending:
+            # Command fails, so no empty entry is added to the undo queue
+            raise RuntimeError('{} : no pending modification to execute'.format(self.commandName))
+
+        self._undo, self._redo = pending
+
+        self.redoIt()
+
+    def undoIt(self):
+        if self._undo:
+            self._undo()
+
+    def redoIt(self):
+        if self._redo:
+            self._redo()
+
+
+def initializePlugin(mobj):
+    mplugin = OpenMaya.MFnPlugin(mobj, 'Tomas Poveda', '1.0', 'Any')
+    try:
+        mplugin.registerCommand(ApiUndoCommand.commandName, ApiUndoCommand.command_creator)
+    except Exception as exc:
+        sys.stderr.write('Failed to register command: {}'.format(ApiUndoCommand.commandName))
+        sys.stderr.write('{}\n'.format(exc))
+
+
+def uninitializePlugin(mobj):
+    mplugin = OpenMaya.MFnPlugin(mobj)
+    try:
+        mplugin.deregisterCommand(ApiUndoCommand.commandName)
+    except Exception as exc:
+        sys.stderr.write('Failed to unregister command: {}'.format(ApiUndoCommand.commandName))
+        sys.stderr.write('{}\n'.format(exc))
@@ -10,6 +10,18 @@ from __future__ import print_function, division, absolute_import
 import sys
 
 from maya.api import OpenMaya as OpenMaya
+from maya.api import OpenMayaAnim as OpenMayaAnim
+
+# NumPy is not available by default in all Maya versions
+try:
+    import numpy
+    from tpRigToolkit.tools.rigtoolbox.core import skinmath, topology
+    from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import meshcache
+except ImportError:
+    numpy = None
+    skinmath = None
+    topology = None
+    meshcache = None
 
 
 def maya_useNewAPI():
@@ -17,6 +29,12 @@ def maya_useNewAPI():
 
 
 class AverageVertexWeightsCommand(OpenMaya.MPxCommand):
+    """
+    Command that blends the skin weights of the given vertices towards the average weights of its connected vertices
+    tpAverageVertexWeights -skinCluster skinCluster1 -index "pSphere1.vtx[0:20] pSphere1.vtx[42]" -weight 0.5
+    If no skin cluster is given, the skin cluster deforming the mesh is used. If no vertices are given, current
+    selected vertices are used.
+    """
 
     commandName = 'tpAverageVertexWeights'
 
@@ -24,13 +42,14 @@ class AverageVertexWeightsCommand(OpenMaya.MPxCommand):
         super(AverageVertexWeightsCommand, self).__init__()
 
         self._index_arg = ''
-        self._weight_arg = None
+        self._weight_arg = 1.0
         self._skin_cluster_arg = ''
 
         self._skin_fn = None
         self._components = None
-        self._influence_indices = None
+        self._influence_indices = OpenMaya.MIntArray()
         self._dag_path = OpenMaya.MDagPath()
+        self._new_weights = OpenMaya.MDoubleArray()
         self._old_weights = OpenMaya.MDoubleArray()
 
     @classmethod
@@ -50,40 +69,51 @@ class AverageVertexWeightsCommand(OpenMaya.MPxCommand):
         return True
 
     def doIt(self, args):
+        # Errors are raised, so the command fails and callers (and Python scripts using maya.cmds) can catch them
+        if not skinmath:
+            raise RuntimeError('{} : NumPy is not available'.format(self.commandName))
+
         try:
             self._parse_args(args)
-        except Exception as exc:
-            OpenMaya.MGlobal.displayError('{} : invalid flag syntax'.format(self.commandName))
-            return
+        except Exception:
+            raise RuntimeError('{} : invalid flag syntax'.format(self.commandName))
+
+        try:
+            self._dag_path, self._components = self._get_mesh()
+        except Exception:
+            raise RuntimeError('{} : select mesh vertices to average weights of'.format(self.commandName))
 
         self._skin_fn = self._get_skin_cluster()
-        if not self._skin_cluster_arg:
-            OpenMaya.MGlobal.displayError('Select a mesh that contains a skinCluster node')
+        if not self._skin_fn:
+            raise RuntimeError('{} : select a mesh that contains a skinCluster node'.format(self.commandName))
 
-        self.redoIt()
+        # Weights are computed only once, so redo only needs to set the cached weights again
+        offsets, neighbours, neighbour_components = self._get_adjacency()
+        weights, influences_count = self._skin_fn.getWeights(self._dag_path, self._components)
+        neighbour_weights, _ = self._skin_fn.getWeights(self._dag_path, neighbour_components)
 
-    def undoIt(self):
-        pass
+        new_weights = skinmath.smooth_weights(
+            numpy.array(weights).reshape(-1, influences_count),
+            numpy.array(neighbour_weights).reshape(-1, influences_count),
+            offsets, neighbours, blend=self._weight_arg)
+        self._new_weights = OpenMaya.MDoubleArray(new_weights.ravel().tolist())
+        self._influence_indices = OpenMaya.MIntArray(range(influences_count))
 
-    def redoIt(self):
-        self._dag_path, self._components = self._get_mesh()
+        self.redoIt()
 
-        surrounding_weights = OpenMaya.MDoubleArray()
-        surrounding_vertex_array = OpenMaya.MIntArray()
-        influences_count = 0
-        influence = None
+    def undoIt(self):
+        if not self._skin_fn or not len(self._old_weights):
+            return
 
-        vertex_iterator = OpenMaya.MItMeshVertex(self._dag_path, self._components)
-        surrounding_vertex_array = vertex_iterator.getConnectedVertices()
-        surrounding_components = OpenMaya.MFnSingleIndexedComponent().create(OpenMaya.MFn.kMeshVertComponent)
-        OpenMaya.MFnSingleIndexedComponent(surrounding_components).addElements(surrounding_vertex_array)
+        self._skin_fn.setWeights(
+            self._dag_path, self._components, self._influence_indices, self._old_weights, False)
 
-        self._old_weights, influence = self._skin_fn.getWeights(self._dag_path, self._components)
-        surrounding_weights, influence = self._skin_fn.getWeights(self._dag_path, surrounding_components)
+    def redoIt(self):
+        if not self._skin_fn or not len(self._new_weights):
+            return
 
-        print(self._old_weights)
-        print(surrounding_weights)
-        print(influence)
+        self._old_weights = self._skin_fn.setWeights(
+            self._dag_path, self._components, self._influence_indices, self._new_weights, False, True)
 
     def _parse_args(self, args):
         args_data = OpenMaya.MArgDatabase(self.syntax(), args)
@@ -92,21 +122,53 @@ class AverageVertexWeightsCommand(OpenMaya.MPxCommand):
         if args_data.isFlagSet('i'):
             self._index_arg = args_data.flagArgumentString('i', 0)
         if args_data.isFlagSet('w'):
-            self._weight_arg = args_data.flagArgumentString('w', 0)
+            self._weight_arg = args_data.flagArgumentDouble('w', 0)
 
     def _get_skin_cluster(self):
-        selection_list = OpenMaya.MGlobal.getSelectionListByName(self._skin_cluster_arg)
-        skin_fn = selection_list.getDependNode(0)
+        if self._skin_cluster_arg:
+            selection_list = OpenMaya.MGlobal.getSelectionListByName(self._skin_cluster_arg)
+            return OpenMayaAnim.MFnSkinCluster(selection_list.getDependNode(0))
+
+        graph_iterator = OpenMaya.MItDependencyGraph(
+            self._dag_path.node(), OpenMaya.MFn.kSkinClusterFilter, OpenMaya.MItDependencyGraph.kUpstream)
+        if graph_iterator.isDone():
+            return None
 
-        return skin_fn
+        return OpenMayaAnim.MFnSkinCluster(graph_iterator.currentNode())
 
     def _get_mesh(self):
-        selection_list = OpenMaya.MGlobal.getSelectionListByName(self._index_arg)
-        dag_path = selection_list.getDagPath(0)
-        components = selection_list.getComponent(0)
+        if self._index_arg:
+            # Components of the same mesh are merged into a single component, so they are set in one call
+            selection_list = OpenMaya.MSelectionList()
+            for component_name in self._index_arg.split():
+                selection_list.add(component_name, mergeWithExisting=True)
+        else:
+            selection_list = OpenMaya.MGlobal.getActiveSelectionList()
+        dag_path, components = selection_list.getComponent(0)
+        if components.isNull():
+            raise ValueError('No components found')
 
         return dag_path, components
 
+    def _get_adjacency(self):
+        """
+        Internal function that returns the connectivity of the vertices to average in CSR format
+        Mesh adjacency is cached, so the mesh topology is only walked the first time a mesh is smoothed
+        :return: tuple(numpy.array, numpy.array, OpenMaya.MObject), offsets, neighbour rows and neighbours component
+        """
+
+        mesh_offsets, mesh_neighbours = meshcache.get_adjacency(self._dag_path)
+        elements = OpenMaya.MFnSingleIndexedComponent(self._components).getElements()
+        offsets, connected_vertices = topology.adjacency_rows(mesh_offsets, mesh_neighbours, elements)
+
+        # Unique vertices are sorted, so they match the rows returned by getWeights (component order)
+        neighbour_vertices, neighbours = numpy.unique(connected_vertices, return_inverse=True)
+        component_fn = OpenMaya.MFnSingleIndexedComponent()
+        neighbour_components = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+        component_fn.addElements(neighbour_vertices.tolist())
+
+        return offsets, neighbours, neighbour_components
+
 
 def initializePlugin(mobj):
     mplugin = OpenMaya.MFnPlugin(mobj, 'Tomas Poveda', '1.0', 'Any')
@@ -15,6 +15,9 @@ __email__ = "tpovedatd@gmail.com"
 import os
 import traceback
 
+import maya.cmds
+import maya.utils
+
 from tpDcc import dcc
 from tpDcc.core import server
 from tpDcc.libs.python import path as path_utils
@@ -31,7 +34,22 @@ from tpRigToolkit.tools.jointorient.dccs.maya import server as jointorient_serve
 from tpRigToolkit.tools.symmesh.core import tool as symmesh_tool
 from tpRigToolkit.tools.symmesh.dccs.maya import server as symmesh_server
 
-from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import general, joint, skin
+from tpRigToolkit.tools.rigtoolbox.core import jobs, metrics
+from tpRigToolkit.tools.rigtoolbox.widgets import library
+from tpRigToolkit.tools.rigtoolbox.dccs.maya.libs import general, joint, skin, transaction
+
+# Counter shared by all server instances, so Maya commands are never wrapped twice. Commands are wrapped the first
+# time calls counting is enabled and calls are only counted while an instrumented handler runs
+_CMDS_COUNTER = metrics.CallCounter()
+
+# Handlers that do not modify the scene, so they are not executed within an undo transaction
+_NON_UNDOABLE_HANDLERS = ('batch', 'submit_job', 'get_job', 'get_jobs', 'cancel_job')
+
+# Handlers that are not instrumented, so querying or configuring metrics does not modify them
+_METRICS_HANDLERS = ('get_metrics', 'configure_metrics')
+
+# Server methods that are not command handlers, so they are never instrumented
+_SERVER_METHODS = ('close',)
 
 
 class RigToolboxServer(server.DccServer, object):
@@ -45,6 +63,220 @@ class RigToolboxServer(server.DccServer, object):
         self._control_rig_client = None
         self._orient_joint_client = None
         self._symmesh_client = None
+        self._jobs = jobs.JobRunner(main_thread_executor=maya.utils.executeInMainThreadWithResult)
+
+        self._metrics = metrics.MetricsRecorder(call_counter=_CMDS_COUNTER)
+        self._instrument_handlers()
+
+    # =================================================================================================================
+    # BATCH
+    # =================================================================================================================
+
+    def batch(self, data, reply):
+        commands = data.get('commands', None) or list()
+
+        try:
+            reply['result'] = self._run_batch(commands)
+            reply['success'] = True
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while executing commands batch: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
+    def _run_batch(self, commands):
+        """
+        Internal function that executes given commands in order within a single undo chunk
+        :param commands: list(dict)
+        :return: list(dict), list of replies, one per command
+        """
+
+        with transaction.transaction('batch'):
+            return [self._run_command(command) for command in commands]
+
+    def _run_command(self, data):
+        """
+        Internal function that executes a single command and returns its reply
+        :param data: dict
+        :return: dict
+        """
+
+        command_reply = {'success': False, 'msg': '', 'result': None}
+
+        cmd = data.get('cmd', None) if isinstance(data, dict) else None
+        command_fn = None
+        if cmd and not cmd.startswith('_') and cmd != 'batch':
+            command_fn = getattr(self, cmd, None)
+        if not command_fn or not callable(command_fn):
+            command_reply['msg'] = 'Invalid command ({})'.format(cmd)
+        else:
+            try:
+                command_fn(data, command_reply)
+            except Exception:
+                command_reply['msg'] = 'Something went wrong while executing command "{}": {}'.format(
+                    cmd, traceback.format_exc())
+                command_reply['success'] = False
+
+        if not command_reply['success']:
+            command_reply['cmd'] = cmd
+            if not command_reply['msg']:
+                command_reply['msg'] = 'Unknown Error'
+
+        return command_reply
+
+    # =================================================================================================================
+    # METRICS
+    # =================================================================================================================
+
+    def get_metrics(self, data, reply):
+        percentiles = data.get('percentiles', None) or (50, 90, 99)
+        reply['result'] = self._metrics.summary(percentiles=percentiles)
+        if data.get('clear', False):
+            self._metrics.clear()
+        reply['success'] = True
+
+    def configure_metrics(self, data, reply):
+        count_calls = data.get('count_calls', None)
+        if count_calls:
+            _CMDS_COUNTER.install(maya.cmds)
+        if count_calls is not None:
+            self._metrics.count_calls = count_calls
+        reply['result'] = {
+            'count_calls': self._metrics.count_calls
+        }
+        reply['success'] = True
+
+    def _instrument_handlers(self):
+        """
+        Internal function that wraps all server command handlers, so its timings are recorded each time they run
+        and all the modifications done by a client request are grouped into a single undo chunk
+        """
+
+        for server_class in type(self).__mro__:
+            if not issubclass(server_class, RigToolboxServer):
+                continue
+            for name, value in server_class.__dict__.items():
+                if name.startswith('_') or name in self.__dict__:
+                    continue
+                if name in _METRICS_HANDLERS or name in _SERVER_METHODS:
+                    continue
+                if not callable(value) or isinstance(value, (staticmethod, classmethod)):
+                    continue
+                handler = getattr(self, name)
+                if name not in _NON_UNDOABLE_HANDLERS:
+                    handler = self._transaction_handler(name, handler)
+                setattr(self, name, self._metrics.instrument(name, handler))
+
+    def _transaction_handler(self, name, handler):
+        """
+        Internal function that returns a function that executes the given command handler within a transaction
+        :param name: str
+        :param handler: callable
+        :return: callable
+        """
+
+        def _handler(data, reply):
+            with transaction.transaction(name):
+                return handler(data, reply)
+
+        return _handler
+
+    # =================================================================================================================
+    # JOBS
+    # =================================================================================================================
+
+    def close(self):
+        """
+        Overrides base close function to stop job workers, so no job keeps running against a closed server
+        """
+
+        self._jobs.shutdown(wait=False, cancel_pending=True)
+        super_close = getattr(super(RigToolboxServer, self), 'close', None)
+        if super_close:
+            return super_close()
+
+    def submit_job(self, data, reply):
+        job_data = data.get('job', None)
+        cmd = job_data.get('cmd', None) if isinstance(job_data, dict) else None
+        if not cmd:
+            reply['msg'] = 'No command to execute as a job given'
+            reply['success'] = False
+            return
+
+        job_fn = getattr(self, '_{}_job'.format(cmd), None) or self._command_job
+        reply['result'] = self._jobs.submit(cmd, job_fn, job_data)
+        reply['success'] = True
+
+    def get_job(self, data, reply):
+        job = self._jobs.get_job(data.get('job_id', None))
+        if not job:
+            reply['msg'] = 'Job "{}" not found'.format(data.get('job_id', None))
+            reply['success'] = False
+            return
+
+        reply['result'] = job
+        reply['success'] = True
+
+    def get_jobs(self, data, reply):
+        reply['result'] = self._jobs.get_jobs()
+        reply['success'] = True
+
+    def cancel_job(self, data, reply):
+        reply['success'] = self._jobs.cancel(data.get('job_id', None))
+        if not reply['success']:
+            reply['msg'] = 'Job "{}" cannot be cancelled because it is already running or finished'.format(
+                data.get('job_id', None))
+
+    def _command_job(self, context, data):
+        """
+        Internal function that executes a command as a job. Commands without an specific job implementation are
+        executed in Maya main thread and library progress is forwarded to the job progress
+        :param context: jobs.JobContext
+        :param data: dict
+        :return: dict, command reply
+        """
+
+        return context.main_thread(self._run_command_with_progress, context, data)
+
+    def _run_command_with_progress(self, context, data):
+        """
+        Internal function that executes a command forwarding library progress to the given job context
+        :param context: jobs.JobContext
+        :param data: dict
+        :return: dict, command reply
+        """
+
+        library.Command.add_progress_listener(context.progress)
+        try:
+            return self._run_command(data)
+        finally:
+            library.Command.remove_progress_listener(context.progress)
+
+    def _unbind_influences_job(self, context, data):
+        """
+        Internal function that executes unbind influences command as a job. Weights are read and written in Maya main
+        thread while weights redistribution is computed in the worker thread
+        :param context: jobs.JobContext
+        :param data: dict
+        :return: dict, command reply
+        """
+
+        if not skin.skinapi:
+            return self._command_job(context, data)
+
+        context.progress(0, 'Reading influences weights')
+        unbind_data = context.main_thread(
+            skin.read_unbind_influences, skinned_objects=data.get('skinned_objects', None),
+            influences_to_unbind=data.get('influences_to_unbind', None), use_parent=data.get('use_parent', True))
+        if not unbind_data:
+            return {'success': False, 'msg': 'No influences to unbind found', 'result': None, 'cmd': data['cmd']}
+
+        context.progress(40, 'Computing weights')
+        skin.compute_unbind_influences(unbind_data)
+
+        context.progress(70, 'Writing weights')
+        success = context.main_thread(skin.write_unbind_influences, unbind_data, delete=data.get('delete', False))
+
+        return {'success': success, 'msg': '', 'result': None}
 
     # =================================================================================================================
     # RENAMER
@@ -261,6 +493,20 @@ class RigToolboxServer(server.DccServer, object):
                     traceback.format_exc())
             reply['success'] = False
 
+    def set_transforms_locked(self, data, reply):
+        transforms = data['transforms']
+        attributes = data.get('attributes', None)
+        lock = data.get('lock', True)
+
+        try:
+            result = general.set_transforms_locked(transforms, attributes=attributes, lock=lock)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while setting transforms channels lock state: {}'.format(
+                    traceback.format_exc())
+            reply['success'] = False
+
     def clean_student_license(self, data, reply):
         file_path = data.get('file_path', None)
 
@@ -782,11 +1028,14 @@ class RigToolboxServer(server.DccServer, object):
         auto_assign_labels = data['auto_assign_labels']
         left_side_label = data['left_side_label']
         right_side_label = data['right_side_label']
+        mirror_mode = data.get('mirror_mode', 'YZ')
+        mirror_inverse = data.get('mirror_inverse', False)
         show_options = data['show_options']
 
         try:
             result = skin.mirror_skin_weights(
-                mesh=mesh, auto_assign_labels=auto_assign_labels, left_side_label=left_side_label,
+                mesh=mesh, mirror_mode=mirror_mode, mirror_inverse=mirror_inverse,
+                auto_assign_labels=auto_assign_labels, left_side_label=left_side_label,
                 right_side_label=right_side_label, show_options=show_options)
             reply.update(result)
         except Exception:
@@ -801,12 +1050,14 @@ class RigToolboxServer(server.DccServer, object):
         auto_assign_labels = data['auto_assign_labels']
         left_side_label = data['left_side_label']
         right_side_label = data['right_side_label']
+        workers = data.get('workers', None)
         show_options = data['show_options']
 
         try:
             result = skin.copy_skin_weights(
-                source_mesh=source_mesh, target_mesh=target_mesh, auto_assign_labels=auto_assign_labels,
-                left_side_label=left_side_label, right_side_label=right_side_label, show_options=show_options)
+                source_mesh=source_mesh, target_mesh=target_mesh, workers=workers,
+                auto_assign_labels=auto_assign_labels, left_side_label=left_side_label,
+                right_side_label=right_side_label, show_options=show_options)
             reply.update(result)
         except Exception:
             if not reply['msg']:
@@ -816,9 +1067,12 @@ class RigToolboxServer(server.DccServer, object):
     def prune_skin_weights(self, data, reply):
         show_options = data['show_options']
         mesh = data['mesh']
+        threshold = data.get('threshold', 0.01)
+        max_influences = data.get('max_influences', None)
 
         try:
-            result = skin.prune_skin_weights(geo=mesh, show_options=show_options)
+            result = skin.prune_skin_weights(
+                mesh=mesh, threshold=threshold, max_influences=max_influences, show_options=show_options)
             reply.update(result)
         except Exception:
             if not reply['msg']:
@@ -892,9 +1146,10 @@ class RigToolboxServer(server.DccServer, object):
 
     def remove_unused_influences(self, data, reply):
         mesh = data['mesh']
+        tolerance = data.get('tolerance', 1e-6)
 
         try:
-            result = skin.delete_unused_influences(mesh)
+            result = skin.delete_unused_influences(mesh, tolerance=tolerance)
             reply.update(result)
         except Exception:
             if not reply['msg']:
@@ -951,6 +1206,70 @@ class RigToolboxServer(server.DccServer, object):
                 reply['msg'] = 'Something went wrong while averaging vertex weights: {}'.format(traceback.format_exc())
             reply['success'] = False
 
+    def smooth_vertex_weights(self, data, reply):
+        components = data['components']
+        weight = data['weight']
+
+        try:
+            result = skin.smooth_vertices_weights(components, weight=weight)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while smoothing vertex weights: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
+    def export_skin_weights(self, data, reply):
+        meshes = data.get('meshes', None)
+        directory = data['directory']
+        precision = data.get('precision', 32)
+
+        try:
+            result = skin.export_skin_weights(meshes=meshes, directory=directory, precision=precision)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while exporting skin weights: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
+    def import_skin_weights(self, data, reply):
+        meshes = data.get('meshes', None)
+        directory = data['directory']
+
+        try:
+            result = skin.import_skin_weights(meshes=meshes, directory=directory)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while importing skin weights: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
+    def get_skin_weights(self, data, reply):
+        mesh = data.get('mesh', None)
+        vertex_indices = data.get('vertex_indices', None)
+        binary = data.get('binary', False)
+        precision = data.get('precision', 32)
+
+        try:
+            result = skin.get_skin_weights(mesh, vertex_indices=vertex_indices, binary=binary, precision=precision)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while retrieving skin weights: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
+    def set_skin_weights(self, data, reply):
+        mesh = data['mesh']
+        weights_data = data['data']
+        binary = data.get('binary', False)
+
+        try:
+            result = skin.set_skin_weights(mesh, weights_data, binary=binary)
+            reply.update(result)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while setting skin weights: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
     def move_skin_weights(self, data, reply):
 
         try:
@@ -1001,6 +1320,21 @@ class RigToolboxServer(server.DccServer, object):
 
         reply['success'] = success
 
+    def unbind_influences(self, data, reply):
+        skinned_objects = data.get('skinned_objects', None)
+        influences_to_unbind = data.get('influences_to_unbind', None)
+        delete = data.get('delete', False)
+        use_parent = data.get('use_parent', True)
+
+        try:
+            reply['success'] = skin.unbind_influences(
+                skinned_objects=skinned_objects, influences_to_unbind=influences_to_unbind, delete=delete,
+                use_parent=use_parent)
+        except Exception:
+            if not reply['msg']:
+                reply['msg'] = 'Something went wrong while unbinding influences: {}'.format(traceback.format_exc())
+            reply['success'] = False
+
     def br_smooth_weights(self, data, reply):
 
         options = data.get('options', False)
@@ -13,7 +13,7 @@ from Qt.QtCore import QObject
 
 from tpDcc.libs.qt.core import qtutils
 
-from tpRigToolkit.tools.rigtoolbox.widgets import base
+from tpRigToolkit.tools.rigtoolbox.widgets import base, library
 
 LOGGER = logging.getLogger('tpRigToolkit-tools-rigtoolbox')
 
@@ -50,60 +50,79 @@ class GeneralWidgetController(object):
     def client(self):
         return self._client
 
+    @library.command
     def delete_history(self):
         return self._client.delete_history()
 
+    @library.command
     def freeze_transforms(self):
         return self._client.freeze_transforms()
 
+    @library.command
     def move_pivot_to_zero(self):
         return self._client.move_pivot_to_zero()
 
+    @library.command
     def lock_all_transforms(self):
         return self._client.lock_all_transforms()
 
+    @library.command
     def lock_translation(self):
         return self._client.lock_translation()
 
+    @library.command
     def lock_rotation(self):
         return self._client.lock_rotation()
 
+    @library.command
     def lock_scale(self):
         return self._client.lock_scale()
 
+    @library.command
     def lock_visibility(self):
         return self._client.lock_visibility()
 
+    @library.command
     def unlock_all_transforms(self):
         return self._client.unlock_all_transforms()
 
+    @library.command
     def unlock_translation(self):
         return self._client.unlock_translation()
 
+    @library.command
     def unlock_rotation(self):
         return self._client.unlock_rotation()
 
+    @library.command
     def unlock_scale(self):
         return self._client.unlock_scale()
 
+    @library.command
     def unlock_visibility(self):
         return self._client.unlock_visibility()
 
+    @library.command
     def clean_student_license(self):
         return self._client.clean_student_license()
 
+    @library.command
     def match_transform(self):
         return self._client.match_transform()
 
+    @library.command
     def match_translation(self):
         return self._client.match_translation()
 
+    @library.command
     def match_rotation(self):
         return self._client.match_rotation()
 
+    @library.command
     def match_scale(self):
         return self._client.match_scale()
 
+    @library.command
     def combine_meshes(self):
         new_mesh_name = None
         if qtutils.is_shift_modifier():
@@ -111,20 +130,26 @@ class GeneralWidgetController(object):
 
         return self._client.combine_meshes(new_mesh_name=new_mesh_name)
 
+    @library.command
     def separate_meshes(self):
         return self._client.separate_meshes()
 
+    @library.command
     def mirror_meshes(self):
         return self._client.mirror_meshes()
 
+    @library.command
     def mirror_meshes_options(self):
         return self._client.mirror_meshes_options()
 
+    @library.command
     def open_symmetry_tool(self):
         return self._client.open_symmetry_tool()
 
+    @library.command
     def detach_components(self):
         return self._client.detach_components()
 
+    @library.command
     def curve_from_edge_loop(self):
         return self._client.curve_from_edge_loop()
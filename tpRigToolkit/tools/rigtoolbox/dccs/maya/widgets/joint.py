@@ -15,7 +15,7 @@ from tpDcc.libs.qt.core import contexts as qt_contexts
 from tpDcc.libs.qt.widgets import layouts, label, spinbox, checkbox
 
 from tpRigToolkit.tools.rigtoolbox.core import consts
-from tpRigToolkit.tools.rigtoolbox.widgets import base
+from tpRigToolkit.tools.rigtoolbox.widgets import base, library
 
 LOGGER = logging.getLogger(consts.TOOL_ID)
 
@@ -278,111 +278,146 @@ class JointWidgetController(object):
     def change_joints_display_size_live(self, flag):
         self._model.joints_display_size_live = flag
 
+    @library.command
     def start_joint_tool(self):
         return self._client.start_joint_tool()
 
+    @library.command
     def create_new_joint_on_center(self):
         return self._client.create_new_joint_on_center()
 
+    @library.command
     def create_new_joints_on_selected_components(self):
         return self._client.create_new_joints_on_selected_components()
 
+    @library.command
     def insert_joints(self):
         joint_count = self._model.joints_to_insert
         return self._client.insert_joints(num_joints=joint_count)
 
+    @library.command
     def create_joints_on_curve(self):
         joints_on_curve = self._model.joints_on_curve
         return self._client.create_joints_on_curve(num_joints=joints_on_curve)
 
+    @library.command
     def snap_joints_to_curve(self):
         joints_to_snap = self._model.snap_joints_to_curve
         return self._client.snap_joints_to_curve(num_joints=joints_to_snap)
 
+    @library.command
     def toggle_local_rotation_axis(self):
         return self._client.toggle_local_rotation_axis()
 
+    @library.command
     def toggle_all_local_rotation_axis(self):
         return self._client.toggle_all_local_rotation_axis()
 
+    @library.command
     def toggle_selected_local_rotation_axis(self):
         return self._client.toggle_selected_local_rotation_axis()
 
+    @library.command
     def on_all_local_rotation_axis(self):
         return self._client.toggle_all_local_rotation_axis(flag=True)
 
+    @library.command
     def off_all_local_rotation_axis(self):
         return self._client.toggle_all_local_rotation_axis(flag=False)
 
+    @library.command
     def on_selected_local_rotation_axis(self):
         return self._client.toggle_selected_local_rotation_axis(flag=True)
 
+    @library.command
     def off_selected_local_rotation_axis(self):
         return self._client.toggle_selected_local_rotation_axis(flag=False)
 
+    @library.command
     def toggle_joints_xray(self):
         return self._client.toggle_joints_xray()
 
+    @library.command
     def on_joints_xray(self):
         return self._client.set_joints_xray(True)
 
+    @library.command
     def off_joints_xray(self):
         return self._client.set_joints_xray(False)
 
+    @library.command
     def joint_display_size(self):
         joints_display_size = self._model.joints_display_size
         return self._client.set_joints_display_size(joints_display_size)
 
+    @library.command
     def select_hierarchy(self):
         return self._client.select_hierarchy()
 
+    @library.command
     def orient_joints(self):
         return self._client.orient_joints()
 
+    @library.command
     def orient_all_joints(self):
         return self._client.orient_all_joints()
 
+    @library.command
     def orient_selected_joints(self):
         return self._client.orient_selected_joints()
 
+    @library.command
     def add_orient_data(self):
         return self._client.add_orient_data()
 
+    @library.command
     def add_orient_data_all_joints(self):
         return self._client.add_orient_data_all_joints()
 
+    @library.command
     def add_orient_data_selected_joints(self):
         return self._client.add_orient_data_selected_joints()
 
+    @library.command
     def clean_orient_data(self):
         return self._client.clean_orient_data()
 
+    @library.command
     def clean_orient_data_all_joints(self):
         return self._client.clean_orient_data_all_joints()
 
+    @library.command
     def clean_orient_data_selected_joints(self):
         return self._client.clean_orient_data_selected_joints()
 
+    @library.command
     def zero_joint_orient(self):
         return self._client.zero_joint_orient()
 
+    @library.command
     def zero_joint_orient_all_joints(self):
         return self._client.zero_joint_orient_all_joints()
 
+    @library.command
     def zero_joint_orient_selected_joints(self):
         return self._client.zero_joint_orient_selected_joints()
 
+    @library.command
     def orient_tool(self):
         return self._client.orient_tool()
 
+    @library.command
     def mirror_joints(self):
         return self._client.mirror_joints()
 
+    @library.command
     def mirror_all_joints(self):
         return self._client.mirror_all_joints()
 
+    @library.command
     def mirror_selected_joints(self):
         return self._client.mirror_selected_joints()
 
+    @library.command
     def mirror_hierarchy_joints(self):
         return self._client.mirror_hierarchy_joints()
@@ -13,10 +13,10 @@ from Qt.QtCore import Signal, QObject
 from Qt.QtWidgets import QWidget, QMessageBox
 
 from tpDcc.libs.qt.core import qtutils
-from tpDcc.libs.qt.widgets import layouts, checkbox
+from tpDcc.libs.qt.widgets import layouts, label, spinbox, checkbox
 
 from tpRigToolkit.tools.rigtoolbox.core import consts
-from tpRigToolkit.tools.rigtoolbox.widgets import base, fallofcurve
+from tpRigToolkit.tools.rigtoolbox.widgets import base, library, fallofcurve
 from tpRigToolkit.tools.rigtoolbox.dccs.maya.widgets import labelsdialog
 
 LOGGER = logging.getLogger(consts.TOOL_ID)
@@ -65,6 +65,25 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
         distance_layout.addWidget(self._average_falloff_curve)
         self._fast_delete_cbx = checkbox.BaseCheckBox('Fast Delete', self)
 
+        self._prune_weights_widget = QWidget()
+        prune_weights_layout = layouts.HorizontalLayout(spacing=0, margins=(0, 0, 0, 0))
+        self._prune_weights_widget.setLayout(prune_weights_layout)
+        prune_threshold_lbl = label.BaseLabel('Threshold: ', parent=self)
+        self._prune_threshold_spn = spinbox.BaseDoubleSpinBox(parent=self)
+        self._prune_threshold_spn.setDecimals(4)
+        self._prune_threshold_spn.setSingleStep(0.001)
+        self._prune_threshold_spn.setMinimum(0.0)
+        self._prune_threshold_spn.setMaximum(1.0)
+        prune_max_influences_lbl = label.BaseLabel(' Max. Influences: ', parent=self)
+        self._prune_max_influences_spn = spinbox.BaseSpinBox(parent=self)
+        self._prune_max_influences_spn.setMinimum(0)
+        self._prune_max_influences_spn.setMaximum(99999999)
+        self._prune_max_influences_spn.setSpecialValueText('No Limit')
+        prune_weights_layout.addWidget(prune_threshold_lbl)
+        prune_weights_layout.addWidget(self._prune_threshold_spn)
+        prune_weights_layout.addWidget(prune_max_influences_lbl)
+        prune_weights_layout.addWidget(self._prune_max_influences_spn)
+
         self._average_falloff_widget.setVisible(False)
         self._mirror_auto_assign_joints_labels_cbx.setVisible(False)
         self._copy_skin_weights_auto_assign_joints_labels_cbx.setVisible(False)
@@ -73,6 +92,7 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
         self._extract_skin_faces_auto_assign_joints_labels_cbx.setVisible(False)
         self._distance_widget.setVisible(False)
         self._fast_delete_cbx.setVisible(False)
+        self._prune_weights_widget.setVisible(False)
 
         self.main_layout.addWidget(self._average_falloff_widget)
         self.main_layout.addWidget(self._mirror_auto_assign_joints_labels_cbx)
@@ -82,6 +102,7 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
         self.main_layout.addWidget(self._extract_skin_faces_auto_assign_joints_labels_cbx)
         self.main_layout.addWidget(self._distance_widget)
         self.main_layout.addWidget(self._fast_delete_cbx)
+        self.main_layout.addWidget(self._prune_weights_widget)
 
     def setup_signals(self):
         self._mirror_auto_assign_joints_labels_cbx.toggled.connect(self._controller.set_mirror_auto_assign_labels)
@@ -95,6 +116,8 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
             self._controller.set_extract_skin_faces_auto_assign_labels)
         self._distance_average_cbx.toggled.connect(self._controller.set_distance_average)
         self._fast_delete_cbx.toggled.connect(self._controller.set_fast_delete)
+        self._prune_threshold_spn.valueChanged.connect(self._controller.set_prune_threshold)
+        self._prune_max_influences_spn.valueChanged.connect(self._controller.set_prune_max_influences)
         self._average_falloff_curve.curveUpdated.connect(self._controller.set_average_weights_curve_points)
 
         self._model.mirrorAutoAssignLabelsChanged.connect(self._mirror_auto_assign_joints_labels_cbx.setChecked)
@@ -108,6 +131,8 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
             self._extract_skin_faces_auto_assign_joints_labels_cbx.setChecked)
         self._model.useDistanceAverageChanged.connect(self._distance_average_cbx.setChecked)
         self._model.fastDeleteChanged.connect(self._fast_delete_cbx.setChecked)
+        self._model.pruneThresholdChanged.connect(self._prune_threshold_spn.setValue)
+        self._model.pruneMaxInfluencesChanged.connect(self._prune_max_influences_spn.setValue)
 
     def _check_command_availability(self, command_name):
 
@@ -148,6 +173,8 @@ class SkinningWidget(base.CommandRigToolBoxWidget, object):
             self._model.extract_skin_faces_auto_assign_labels)
         self._distance_average_cbx.setChecked(self._model.use_distance_average)
         self._fast_delete_cbx.setChecked(self._model.fast_delete)
+        self._prune_threshold_spn.setValue(self._model.prune_threshold)
+        self._prune_max_influences_spn.setValue(self._model.prune_max_influences)
 
         # NOTE: We do this to force model, to have point list value on startup
         self._controller.set_average_weights_curve_points(self._average_falloff_curve.curve_as_points())
@@ -162,6 +189,8 @@ class SkinningWidgetModel(QObject, object):
     extractSkinFacesAutoAssignLabelsChanged = Signal(bool)
     useDistanceAverageChanged = Signal(bool)
     fastDeleteChanged = Signal(bool)
+    pruneThresholdChanged = Signal(float)
+    pruneMaxInfluencesChanged = Signal(int)
 
     def __init__(self):
         super(SkinningWidgetModel, self).__init__()
@@ -173,6 +202,8 @@ class SkinningWidgetModel(QObject, object):
         self._extract_skin_faces_auto_assign_labels = True
         self._use_distance_average = True
         self._fast_delete = True
+        self._prune_threshold = 0.01
+        self._prune_max_influences = 0
         self._average_weights_curve_points = list()
 
     @property
@@ -238,6 +269,24 @@ class SkinningWidgetModel(QObject, object):
         self._fast_delete = bool(flag)
         self.fastDeleteChanged.emit(self._fast_delete)
 
+    @property
+    def prune_threshold(self):
+        return self._prune_threshold
+
+    @prune_threshold.setter
+    def prune_threshold(self, value):
+        self._prune_threshold = float(value)
+        self.pruneThresholdChanged.emit(self._prune_threshold)
+
+    @property
+    def prune_max_influences(self):
+        return self._prune_max_influences
+
+    @prune_max_influences.setter
+    def prune_max_influences(self, value):
+        self._prune_max_influences = int(value)
+        self.pruneMaxInfluencesChanged.emit(self._prune_max_influences)
+
     @property
     def average_weights_curve_points(self):
         return self._average_weights_curve_points
@@ -284,35 +333,48 @@ class SkinningWidgetController(object):
     def set_fast_delete(self, flag):
         self._model.fast_delete = flag
 
+    def set_prune_threshold(self, value):
+        self._model.prune_threshold = value
+
+    def set_prune_max_influences(self, value):
+        self._model.prune_max_influences = value
+
     def set_average_weights_curve_points(self, points_list):
         self._model.average_weights_curve_points = points_list
 
+    @library.command
     def smooth_bind_skin(self):
         return self._client.smooth_bind_skin(show_options=True)
 
+    @library.command
     def rigid_bind_skin(self):
         return self._client.rigid_bind_skin(show_options=True)
 
+    @library.command
     def detach_skin(self):
         return self._client.detach_bind_skin(show_options=False)
 
+    @library.command
     def detach_skin_options(self):
         return self._client.detach_bind_skin(show_options=True)
 
+    @library.command
     def open_paint_skin_weights_tool(self):
         return self._client.open_paint_skin_weights_tool(show_options=False)
 
+    @library.command
     def open_paint_skin_weights_tool_options(self):
         return self._client.open_paint_skin_weights_tool(show_options=True)
 
+    @library.command
     def mirror_skin_weights(self):
         auto_assign_labels = self._model.mirror_auto_assign_labels
         left_side, right_side = self._check_labels(auto_assign_labels)
 
         return self._client.mirror_skin_weights(
-            auto_assign_labels=auto_assign_labels, left_side_label=left_side,
-            right_side_label=right_side, show_options=True)
+            auto_assign_labels=auto_assign_labels, left_side_label=left_side, right_side_label=right_side)
 
+    @library.command
     def copy_skin_weights(self):
         auto_assign_labels = self._model.copy_skin_weights_auto_assign_labels
         left_side, right_side = self._check_labels(auto_assign_labels)
@@ -321,9 +383,19 @@ class SkinningWidgetController(object):
             auto_assign_labels=auto_assign_labels, left_side_label=left_side,
             right_side_label=right_side, show_options=True)
 
+    @library.command
     def prune_skin_weights(self):
+        # Zero maximum influences means that the number of influences per vertex is not limited
+        threshold = self._model.prune_threshold
+        max_influences = self._model.prune_max_influences or None
+
+        return self._client.prune_skin_weights(threshold=threshold, max_influences=max_influences)
+
+    @library.command
+    def prune_skin_weights_options(self):
         return self._client.prune_skin_weights(show_options=True)
 
+    @library.command
     def transfer_skin_uvs(self):
         auto_assign_labels = self._model.transfer_skin_uvs_auto_assign_labels
         left_side, right_side = self._check_labels(auto_assign_labels)
@@ -331,6 +403,7 @@ class SkinningWidgetController(object):
         return self._client.transfer_skin_uvs(
             auto_assign_labels=auto_assign_labels, left_side_label=left_side, right_side_label=right_side)
 
+    @library.command
     def clean_skinned_mesh(self):
         auto_assign_labels = self._model.clean_skin_mesh_auto_assign_labels
         left_side, right_side = self._check_labels(auto_assign_labels)
@@ -338,9 +411,11 @@ class SkinningWidgetController(object):
         return self._client.clean_skinned_mesh(
             auto_assign_labels=auto_assign_labels, left_side_label=left_side, right_side_label=right_side)
 
+    @library.command
     def combine_skinned_meshes(self):
         return self._client.combine_skinned_meshes()
 
+    @library.command
     def extract_skinned_faces(self):
         auto_assign_labels = self._model.extract_skin_faces_auto_assign_labels
         left_side, right_side = self._check_labels(auto_assign_labels)
@@ -348,9 +423,11 @@ class SkinningWidgetController(object):
         return self._client.extract_skinned_selected_faces(
             auto_assign_labels=auto_assign_labels, left_side_label=left_side, right_side_label=right_side)
 
+    @library.command
     def remove_unused_influences(self):
         return self._client.remove_unused_influences()
 
+    @library.command
     def restore_bind_pose(self):
         res = qtutils.show_question(None, 'Go to Bind Pose', 'Are you sure yo want to restore bind pose?')
         if res != QMessageBox.Yes:
@@ -358,6 +435,7 @@ class SkinningWidgetController(object):
 
         return self._client.restore_bind_pose()
 
+    @library.command
     def remove_bind_poses(self):
         res = qtutils.show_question(
             None, 'Remove Bind Poses', 'Are you sure yo want to remove all bind poses from the current scene?')
@@ -366,9 +444,11 @@ class SkinningWidgetController(object):
 
         return self._client.remove_bind_poses()
 
+    @library.command
     def weights_hammer(self):
         return self._client.weights_hammer()
 
+    @library.command
     def average_vertex_weights(self):
         use_distance_average = self._model.use_distance_average
         curve_weight_points = self._model.average_weights_curve_points
@@ -376,34 +456,48 @@ class SkinningWidgetController(object):
         return self._client.average_vertex_weights(
             use_distance=use_distance_average, curve_weight_points=curve_weight_points)
 
+    @library.command
+    def smooth_vertex_weights(self):
+        return self._client.smooth_vertex_weights()
+
+    @library.command
     def move_skin_weights(self):
         return self._client.move_skin_weights()
 
+    @library.command
     def swap_skin_weights(self):
         return self._client.swap_skin_weights()
 
+    @library.command
     def select_influences(self):
         return self._client.select_influences()
 
+    @library.command
     def select_influence_components(self):
         return self._client.select_influence_components()
 
+    @library.command
     def delete_influences(self):
         fast_delete = self._model.fast_delete
         return self._client.delete_influences(fast_delete=fast_delete)
 
+    @library.command
     def br_smooth_weights(self):
         return self._client.br_smooth_weights()
 
+    @library.command
     def br_smooth_weights_options(self):
         return self._client.br_smooth_weights(options=True)
 
+    @library.command
     def br_transfer_weights_options(self):
         return self._client.br_transfer_weights()
 
+    @library.command
     def br_transfer_weights(self):
         return self._client.br_transfer_weights(options=True)
 
+    @library.command
     def ng_skin_tools(self):
         return self._client.ng_skin_tools()
 
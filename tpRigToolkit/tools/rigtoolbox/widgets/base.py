@@ -8,20 +8,23 @@ Module that contains base class for tpRigToolbox widgets
 from __future__ import print_function, division, absolute_import
 
 import time
-import inspect
+import logging
 from functools import partial
+from collections import OrderedDict
 
 from Qt.QtCore import Qt, Signal, QPoint, QSize, QEvent
 from Qt.QtWidgets import QSizePolicy, QWidget, QFrame, QMenu, QAction, QWhatsThis
 from Qt.QtGui import QCursor, QColor, QPainter, QBrush, QPolygon
 
-from tpDcc.managers import resources
 from tpDcc.libs.python import python
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts, label, buttons, accordion, balloon
 
+from tpRigToolkit.tools.rigtoolbox.core import consts
 from tpRigToolkit.tools.rigtoolbox.widgets import library, info
 
+LOGGER = logging.getLogger(consts.TOOL_ID)
+
 
 class BaseRigToolBoxWidget(base.BaseFrame, object):
 
@@ -53,7 +56,94 @@ class BaseRigToolBoxWidget(base.BaseFrame, object):
         self.main_layout.addLayout(self._content_layout)
 
 
+class LazyRigToolBoxWidget(BaseRigToolBoxWidget, object):
+    """
+    Placeholder widget that builds its contents the first time it is shown
+    """
+
+    contentsCreated = Signal(object)
+
+    def __init__(self, title, create_fn, parent=None):
+        """
+        :param title: str, title of the widget
+        :param create_fn: callable, function that returns the widget to show. It is called the first time the widget
+            is shown, so any expensive setup (such as starting tool servers) should be done inside it
+        :param parent: QWidget
+        """
+
+        self._create_fn = create_fn
+        self._contents = None
+        self._info_visible = True
+
+        super(LazyRigToolBoxWidget, self).__init__(title=title, parent=parent)
+
+    @property
+    def contents(self):
+        return self._contents
+
+    def is_created(self):
+        return self._create_fn is None
+
+    def showEvent(self, event):
+        super(LazyRigToolBoxWidget, self).showEvent(event)
+        self.create_contents()
+
+    def create_contents(self):
+        """
+        Builds widget contents if they are not created yet
+        :return: QWidget or None
+        """
+
+        if self._create_fn is None:
+            return self._contents
+
+        create_fn = self._create_fn
+        self._create_fn = None
+        start = time.time()
+        contents = create_fn()
+        if not contents:
+            return None
+
+        contents.setParent(self)
+        if isinstance(contents, BaseRigToolBoxWidget):
+            contents.emitInfo.connect(self.emitInfo.emit)
+            contents.emitWarning.connect(self.emitWarning.emit)
+            contents.emitError.connect(self.emitError.emit)
+            contents.setInfo.connect(self.setInfo.emit)
+        if hasattr(contents, '_on_toggle_info'):
+            contents._on_toggle_info(self._info_visible)
+        self._content_layout.addWidget(contents)
+        self._contents = contents
+        LOGGER.debug('"{}" widget created in {:.3f} seconds'.format(self._title, time.time() - start))
+        self.contentsCreated.emit(contents)
+
+        return contents
+
+    def _on_toggle_info(self, flag):
+        self._info_visible = flag
+        if self._contents is not None and hasattr(self._contents, '_on_toggle_info'):
+            self._contents._on_toggle_info(flag)
+
+
 class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
+
+    # Stylesheet shared by all command buttons. It is applied once per widget instead of once per button, so Qt does
+    # not need to recompute the style of each button when it is created
+    STYLESHEET = """
+    QPushButton[commandPart="main"] {
+        border-top-right-radius: 0px;
+        border-bottom-right-radius: 0px;
+        border-right: 0px;
+    }
+    QPushButton[commandPart="options"] {
+        border-top-left-radius: 0px;
+        border-bottom-left-radius: 0px;
+    }
+    QPushButton[commandPart="options"]::menu-indicator {
+        image: none;
+    }
+    """
+
     def __init__(self, title, commands_data, controller, parent=None):
 
         self._commands_data = commands_data or dict()
@@ -66,27 +156,29 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
         super(CommandRigToolBoxWidget, self).__init__(title=title, parent=parent)
 
         if self._controller:
-            predicate = inspect.ismethod if python.is_python2() else inspect.isfunction
-            controller_functions = inspect.getmembers(self._controller.__class__, predicate=predicate)
-            for controller_fn_data in controller_functions:
-                if controller_fn_data[0] in ['__init__']:
-                    continue
-                controller_fn = getattr(self._controller, controller_fn_data[0])
-                if not controller_fn:
-                    continue
-                self._controller_functions_mapping[controller_fn_data[0]] = controller_fn
-
-        added_categories = list()
-        for name, data in self._commands_data.items():
-            categories = data.get('categories', list())
+            for command_name in library.get_controller_commands(self._controller.__class__):
+                self._controller_functions_mapping[command_name] = getattr(self._controller, command_name)
+
+        # Categories are sorted by first appearance, so commands buttons are created in a single pass
+        categories_commands = OrderedDict()
+        for command_name, command_data in self._commands_data.items():
+            if not command_data:
+                continue
+            categories = [category for category in command_data.get('categories', list()) if category]
+            for category in categories:
+                categories_commands.setdefault(category, list())
+            command_function = self._controller_functions_mapping.get(command_name, None)
+            if not command_function:
+                continue
+            is_available = self._check_command_availability(command_name)
             for category in categories:
-                if not category or category in added_categories:
-                    continue
-                category_widget = self._add_category(category)
-                if not category_widget:
-                    continue
-                self._accordion.add_item(category, category_widget)
-                added_categories.append(category)
+                categories_commands[category].append(
+                    self._create_command(command_name, command_data, command_function, is_available))
+
+        for category, category_commands in categories_commands.items():
+            if not category_commands:
+                continue
+            self._accordion.add_item(category, self._create_category_widget(category_commands))
 
     def ui(self):
         super(CommandRigToolBoxWidget, self).ui()
@@ -104,6 +196,7 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
 
         self._accordion = accordion.AccordionWidget(parent=self)
         self._content_layout.addWidget(self._accordion)
+        self.setStyleSheet(self.STYLESHEET)
 
         self.main_layout.addWidget(self._info_widget)
         self.main_layout.addWidget(self._info_frame)
@@ -136,50 +229,50 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
 
         return super(BaseRigToolBoxWidget, self).eventFilter(obj, event)
 
-    def _add_category(self, category_name):
-        if not self._controller:
-            return False
-
-        commands_to_add = list()
+    def _create_command(self, command_name, command_data, command_function, is_available=True):
+        """
+        Internal function that creates the button of the given command
+        :param command_name: str
+        :param command_data: dict
+        :param command_function: callable
+        :param is_available: bool
+        :return: QWidget
+        """
 
-        for command_name, command_data in self._commands_data.items():
-            command_function = self._controller_functions_mapping.get(command_name, None)
-            if not command_data or command_name not in self._controller_functions_mapping:
+        options = list()
+        command_actions = command_data.get('options', dict())
+        for command_option_name, command_option_data in command_actions.items():
+            command_option_function = self._controller_functions_mapping.get(command_option_name, None)
+            if not command_option_function:
                 continue
-            command_categories = command_data.get('categories', list())
-            if category_name not in command_categories:
-                continue
-            options = list()
-            command_actions = command_data.get('options', dict())
-            for command_option_name, command_option_data in command_actions.items():
-                command_option_function = self._controller_functions_mapping.get(command_option_name, None)
-                if not command_option_function:
-                    continue
-                option_data = command_option_data.copy()
-                option_data['fn'] = command_option_function
-                options.append(option_data)
-
-            new_command_data = command_data.copy()
-            new_command_data.pop('categories')       # categories is not part of the command creation
-            new_command_data.pop('options', None)
-            new_command = self._create_button(fn=command_function, settings=options, **new_command_data)
+            option_data = command_option_data.copy()
+            option_data['fn'] = command_option_function
+            options.append(option_data)
 
-            is_available = self._check_command_availability(command_name)
-            if not is_available:
-                new_command.setToolTip('Command "{}" is not available!'.format(command_name))
-                new_command.setEnabled(False)
+        new_command_data = command_data.copy()
+        new_command_data.pop('categories')       # categories is not part of the command creation
+        new_command_data.pop('options', None)
+        new_command = self._create_button(fn=command_function, settings=options, **new_command_data)
+
+        if not is_available:
+            new_command.setToolTip('Command "{}" is not available!'.format(command_name))
+            new_command.setEnabled(False)
 
-            commands_to_add.append(new_command)
+        return new_command
 
-        if not commands_to_add:
-            return False
+    def _create_category_widget(self, commands):
+        """
+        Internal function that creates the widget that contains the given commands buttons
+        :param commands: list(QWidget)
+        :return: QWidget
+        """
 
         category_widget = QWidget()
         category_layout = layouts.FlowLayout()
         category_layout.setAlignment(Qt.AlignLeft)
         category_widget.setLayout(category_layout)
 
-        for command in commands_to_add:
+        for command in commands:
             category_layout.addWidget(command)
 
         return category_widget
@@ -212,7 +305,7 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
         new_btn = CommandButton(parent=self).small()
         if icon:
             if python.is_string(icon):
-                icon = resources.icon(icon)
+                icon = library.get_icon(icon)
             new_btn.setIcon(icon)
         else:
             new_btn.setText(name)
@@ -223,7 +316,6 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
         new_btn.setProperty('description', description or tooltip or status or '')
         new_btn.setProperty('instructions', instructions or '')
         new_btn.setProperty('tooltip_help', {'title': name, 'description': description})
-        new_btn.setStyleSheet('qproperty-iconSize: 20px 20px;')
         new_btn.setIconSize(QSize(20, 20))
         new_btn.setWhatsThis(whats_this or tooltip or name)
         new_btn.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -246,7 +338,6 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
         if settings:
             settings_icon = 'menu_dots' if settings and len(settings) > 1 else 'settings'
             buttons_widget = QWidget()
-            buttons_widget.setStyleSheet('QPushButton::menu-indicator{ image: none; };')
             buttons_layout = layouts.HorizontalLayout(spacing=0, margins=(0, 0, 0, 0))
             buttons_widget.setLayout(buttons_layout)
 
@@ -267,7 +358,7 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
                         continue
                     option_description = setting.get('description', '')
                     option_instructions = setting.get('instructions', '')
-                    option_icon = resources.icon(setting.get('icon', 'tpRigToolkit'))
+                    option_icon = library.get_icon(setting.get('icon', 'tpRigToolkit'))
                     option_action = QAction(option_icon, option_name, self)
                     option_action.setProperty('description', option_description or '')
                     option_action.setProperty('instructions', option_instructions or '')
@@ -287,17 +378,15 @@ class CommandRigToolBoxWidget(BaseRigToolBoxWidget, object):
                 options_btn = self._create_button(
                     icon=settings_icon, fn=option_fn, name=option_name, description=option_description)
 
+            # Split buttons borders are defined in the widget stylesheet (see STYLESHEET)
+            new_btn.setProperty('commandPart', 'main')
             new_btn.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding)
-            new_btn.setStyleSheet(
-                new_btn.styleSheet() + ';border-top-right-radius: 0px; border-bottom-right-radius: 0px; '
-                                       'border-right: 0px;')
             new_btn.setMaximumWidth(28)
 
+            options_btn.setProperty('commandPart', 'options')
             options_btn.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding)
             options_btn.setMaximumWidth(18)
-            options_btn.setStyleSheet(
-                options_btn.styleSheet() + ';border-top-left-radius: 0px; border-bottom-left-radius: 0px; '
-                                           'qproperty-iconSize: 12px 12px;')
+            options_btn.setIconSize(QSize(12, 12))
             buttons_layout.addWidget(new_btn)
             buttons_layout.addWidget(options_btn)
 
@@ -3,9 +3,10 @@ from __future__ import print_function, division, absolute_import
 from Qt.QtCore import Qt, Signal, QSize, QEvent
 from Qt.QtWidgets import QWidget, QDockWidget, QLabel, QLineEdit, QToolButton, QGroupBox
 
-from tpDcc.managers import resources
 from tpDcc.libs.qt.widgets import layouts
 
+from tpRigToolkit.tools.rigtoolbox.widgets import library
+
 
 class DockWidget(QDockWidget, object):
     closed = Signal(object)
@@ -54,11 +55,11 @@ class DockTitleBar(QWidget, object):
         self._button_size = QSize(15, 15)
 
         self._dock_btn = QToolButton(self)
-        self._dock_btn.setIcon(resources.icon('restore_window', theme='color'))
+        self._dock_btn.setIcon(library.get_icon('restore_window', theme='color'))
         self._dock_btn.setMaximumSize(self._button_size)
         self._dock_btn.setAutoRaise(True)
         self._close_btn = QToolButton(self)
-        self._close_btn.setIcon(resources.icon('close_window', theme='color'))
+        self._close_btn.setIcon(library.get_icon('close_window', theme='color'))
         self._close_btn.setMaximumSize(self._button_size)
         self._close_btn.setAutoRaise(True)
 
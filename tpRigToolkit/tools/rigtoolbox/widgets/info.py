@@ -10,11 +10,12 @@ from __future__ import print_function, division, absolute_import
 from Qt.QtCore import Qt, Property
 from Qt.QtWidgets import QSizePolicy, QWidget, QFrame, QPlainTextEdit, QTextEdit
 
-from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import layouts, message, expandables, dividers
 
+from tpRigToolkit.tools.rigtoolbox.widgets import library
+
 
 @theme.mixin
 class InfoMessage(base.BaseWidget, object):
@@ -72,7 +73,7 @@ class InfoMessage(base.BaseWidget, object):
 
         self.setMaximumHeight(150)
 
-        info_icon = resources.icon('info')
+        info_icon = library.get_icon('info')
         self._expandable_frame = expandables.ExpandableFrame(icon=info_icon, parent=self)
         self._expandable_frame.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
 
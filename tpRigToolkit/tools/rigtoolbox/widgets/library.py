@@ -7,8 +7,12 @@ Module that contains basic library implementation
 
 from __future__ import print_function, division, absolute_import
 
+import time
+
 from Qt.QtCore import QObject, Signal
 
+from tpDcc.managers import resources
+
 
 class _CommandSignals(QObject, object):
 
@@ -18,5 +22,151 @@ class _CommandSignals(QObject, object):
     progressCommand = Signal(int, str)
     endCommand = Signal(bool)
 
+    def __init__(self):
+        super(_CommandSignals, self).__init__()
+
+        self._progress_listeners = 0
+
+    def has_progress_listeners(self):
+        return self._progress_listeners > 0
+
+    def add_progress_listener(self, fn):
+        """
+        Connects given function to progressCommand signal. Progress reporters only emit progress while there are
+        listeners connected through this function
+        :param fn: callable
+        """
+
+        self.progressCommand.connect(fn)
+        self._progress_listeners += 1
+
+    def remove_progress_listener(self, fn):
+        """
+        Disconnects a function connected with add_progress_listener
+        :param fn: callable
+        """
+
+        self.progressCommand.disconnect(fn)
+        self._progress_listeners = max(0, self._progress_listeners - 1)
+
 
 Command = _CommandSignals()
+
+
+class ProgressReporter(object):
+    """
+    Class that reports progress of a command through Command.progressCommand signal
+    Updates are coalesced so the signal is emitted at most FPS times per second, so it can be called inside loops with
+    thousands of iterations. Messages are only formatted when the signal is emitted
+    """
+
+    FPS = 30
+
+    def __init__(self, total=100, start=0.0, end=100.0, fps=None, parent=None):
+        """
+        :param total: int, number of steps of the task
+        :param start: float, progress value (in the range [0, 100]) reported at step 0
+        :param end: float, progress value (in the range [0, 100]) reported at the last step
+        :param fps: int or None, maximum number of updates emitted per second. If not given, FPS is used
+        :param parent: ProgressReporter or None, reporter this one is a sub task of. Parent throttling is shared
+        """
+
+        self._total = max(total, 1)
+        self._start = start
+        self._scale = (end - start) / self._total
+        self._root = parent._root if parent else self
+        if self._root is self:
+            self._interval = 1.0 / (fps or self.FPS)
+            self._last_time = 0.0
+            self._last_value = None
+
+    def update(self, step, msg='', *args):
+        """
+        Updates progress of the task. Last step of a task that is not a sub task is always emitted
+        :param step: int, current step of the task
+        :param msg: str, progress message. If args are given, message is formatted with them when emitted
+        :param args: list, message format arguments
+        """
+
+        if not Command.has_progress_listeners():
+            return
+
+        value = int(self._start + min(step, self._total) * self._scale)
+        root = self._root
+        current_time = time.time()
+        finished = root is self and step >= self._total
+        if not finished and (current_time - root._last_time < root._interval or value == root._last_value):
+            return
+
+        root._last_time = current_time
+        root._last_value = value
+        Command.progressCommand.emit(value, msg.format(*args) if args else msg)
+
+    def sub_task(self, start_step, end_step, total=100):
+        """
+        Returns a reporter whose progress is mapped to the given range of steps of this reporter
+        :param start_step: int, step of this reporter where sub task starts
+        :param end_step: int, step of this reporter where sub task ends
+        :param total: int, number of steps of the sub task
+        :return: ProgressReporter
+        """
+
+        return ProgressReporter(
+            total=total, start=self._start + start_step * self._scale, end=self._start + end_step * self._scale,
+            parent=self)
+
+
+# Cache of icons shared by all rig toolbox widgets. QIcon already caches the pixmaps rendered for each size
+_ICONS = dict()
+
+
+def get_icon(name, theme=None):
+    """
+    Returns icon with the given name. Icons are loaded only once and shared by all widgets
+    :param name: str
+    :param theme: str or None
+    :return: QIcon
+    """
+
+    key = (name, theme)
+    icon = _ICONS.get(key, None)
+    if icon is None:
+        icon = _ICONS[key] = resources.icon(name, theme=theme) if theme else resources.icon(name)
+
+    return icon
+
+
+# Cache of the commands registered in each controller class
+_CONTROLLER_COMMANDS = dict()
+
+
+def command(fn):
+    """
+    Decorator that registers a controller method as a command that can be called from rig toolbox widgets
+    Commands are matched by name with the commands (and their options) defined in DCC commands YAML files
+    """
+
+    fn.is_rig_toolbox_command = True
+
+    return fn
+
+
+def get_controller_commands(controller_class):
+    """
+    Returns the names of the commands registered in the given controller class
+    Commands are collected only once per class
+    :param controller_class: type
+    :return: frozenset(str)
+    """
+
+    commands = _CONTROLLER_COMMANDS.get(controller_class, None)
+    if commands is not None:
+        return commands
+
+    command_names = set()
+    for name in dir(controller_class):
+        if getattr(getattr(controller_class, name, None), 'is_rig_toolbox_command', False):
+            command_names.add(name)
+    commands = _CONTROLLER_COMMANDS[controller_class] = frozenset(command_names)
+
+    return commands